@@ -8,15 +8,31 @@ and retrieve bibliographic data in various formats.
 """
 
 import re
+import copy
 import time
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Any, Optional, Tuple
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from sru_library import BiblioRecord
 
+# Prefer lxml (libxml2) for HTML parsing when it is installed. BeautifulSoup
+# is then only a fallback, so it is imported where it is used.
+try:
+    from lxml import etree as lxml_etree
+    from lxml import html as lxml_html
+    LXML_AVAILABLE = True
+    HTML_PARSER = 'lxml'
+except ImportError:
+    LXML_AVAILABLE = False
+    HTML_PARSER = 'html.parser'
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -24,12 +40,462 @@ logging.basicConfig(
 )
 logger = logging.getLogger("ixtheo_library")
 
+# <input name="csrf" value="..."> on the IxTheo homepage (either attribute order)
+_CSRF_RE = re.compile(
+    r'<input\b(?=[^>]*\bname=["\']csrf["\'])[^>]*\bvalue=["\']([^"\']+)["\']',
+    re.IGNORECASE
+)
+
+# Patterns used per record, compiled once at import time
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+_ANY_YEAR_RE = re.compile(r'(\d{4})')
+_ISSN_RE = re.compile(r'\d{4}-\d{3}[\dX]')
+_VOLUME_RE = re.compile(r'Volume:\s*(\d+)')
+_VOLUME_LOOSE_RE = re.compile(r'Volume[^,]*?(\d+)')
+_ISSUE_RE = re.compile(r'Issue:\s*(\d+)')
+_ISSUE_LOOSE_RE = re.compile(r'Issue[^,]*?(\d+)')
+_PAGES_RE = re.compile(r'Pages:\s*([0-9-]+)')
+_PAGES_LOOSE_RE = re.compile(r'Pages[^,]*?([0-9-]+)')
+# RIS record start and end lines, for splitting a multi-record export
+_RIS_TYPE_RE = re.compile(r'^TY  -', re.MULTILINE)
+_RIS_RECORD_END_RE = re.compile(r'^ER  -.*$', re.MULTILINE)
+# Record IDs a RIS record names in its record URL (UR/L2) or ID line
+_RIS_RECORD_ID_RE = re.compile(r'/Record/([^\s/?#]+)|^ID  - (\S+)', re.MULTILINE)
+_JOURNAL_INFO_RE = re.compile(
+    r'Year:\s*([\d]{4})(?:[^,]*?)(?:Volume:\s*(\d+))?(?:[^,]*?)(?:Issue:\s*(\d+))?(?:[^,]*?)(?:Pages:\s*([0-9-]+))?'
+)
+
+# RIS -> BibTeX conversion tables (_convert_ris_to_bibtex)
+# Line templates for the BibTeX fields, in output order
+_BIBTEX_FIELD_TMPL = {
+    key: "  %s = {%%s}," % key
+    for key in ("editor", "title", "author", "year", "journal", "series", "volume",
+                "number", "pages", "publisher", "address", "isbn", "issn", "doi",
+                "url", "abstract")
+}
+_BIBTEX_ESCAPE = str.maketrans({"&": r"\&", "%": r"\%", "$": r"\$", "#": r"\#", "_": r"\_"})
+_RIS_TY_MAP = {
+    "JOUR": "article",
+    "BOOK": "book",
+    "CHAP": "incollection",
+    "CONF": "inproceedings",
+    "THES": "phdthesis",
+}
+_RIS_BIBTEX_FIELDS = {
+    "TI": "title", "T1": "title",
+    "PB": "publisher",
+    "CY": "place",
+    "JO": "journal", "T2": "journal",
+    "VL": "volume",
+    "IS": "issue",
+    "SP": "start_page",
+    "EP": "end_page",
+    "DO": "doi",
+    "UR": "url",
+    "AB": "abstract",
+}
+_RIS_BIBTEX_LIST_FIELDS = {"AU": "authors", "ED": "editors"}
+# One "TG  - value" RIS line; surrounding whitespace is not captured
+_RIS_LINE_RE = re.compile(r'^[ \t]*([A-Z0-9]{2})  - [ \t]*(.*?)[ \t\r]*$', re.MULTILINE)
+
+# Editors embedded in a RIS T2 field: "Last, First 1950- (edt), ..., Book title"
+_T2_EDITOR_RE = re.compile(r'([^,]+)(?:,\s+([^(]+))?\s+(?:\d{4}-)?\s*\(edt\)')
+_T2_EDITOR_PREFIX_RE = re.compile(r'([^,]+)(?:,\s+[^(]+)?\s+(?:\d{4}-)?\s*\(edt\),\s*')
+_LIFE_DATES_RE = re.compile(r'\s+\d{4}-(?:\d{4})?')
+_LEADING_COMMA_RE = re.compile(r'^,\s*')
+
+# First number (with thousands separators) after "results of"
+_DIGITS_RE = re.compile(r'\d[\d,.]*')
+
+# "results of <strong>1,234</strong>" directly in the page source
+_TOTAL_RE = re.compile(r'results of\s*(?:<[^>]*>\s*)*(\d[\d,.]*)', re.IGNORECASE)
+
+def _parse_total_results(text: str) -> Optional[int]:
+    """Extract N from IxTheo's "Showing 1 - 20 results of N" stats text."""
+    idx = text.find('results of')
+    if idx < 0:
+        return None
+    match = _DIGITS_RE.search(text, idx + 10)
+    if not match:
+        return None
+    return int(match.group().replace(',', '').replace('.', ''))
+
+def _find_total_in_source(html_content: str) -> Optional[int]:
+    """Read the result total straight from the raw HTML, without a DOM."""
+    match = _TOTAL_RE.search(html_content)
+    if not match:
+        return None
+    return int(match.group(1).replace(',', '').replace('.', ''))
+
+# Literal \uXXXX escapes sometimes found in IxTheo RIS exports
+_UMLAUT_ESCAPES = {
+    r'\u00fc': 'ü',
+    r'\u00e4': 'ä',
+    r'\u00f6': 'ö',
+    r'\u00dc': 'Ü',
+    r'\u00c4': 'Ä',
+    r'\u00d6': 'Ö',
+    r'\u00df': 'ß'
+}
+_UMLAUT_ESCAPE_RE = re.compile('|'.join(re.escape(seq) for seq in _UMLAUT_ESCAPES))
+_UNICODE_ESCAPE_RE = re.compile(r'\\u([0-9a-fA-F]{4})')
+
+def _is_issn(value: str) -> bool:
+    """Tell whether an SN value holds an ISSN (otherwise it is an ISBN).
+
+    A bare ISSN (``1234-567X``) and a value without any hyphen are decided
+    by character checks; anything else falls back to searching _ISSN_RE.
+    """
+    if '-' not in value:
+        return False
+    if (len(value) == 9 and value[4] == '-' and value[:4].isdigit()
+            and value[5:8].isdigit() and (value[8] == 'X' or value[8].isdigit())):
+        return True
+    return _ISSN_RE.search(value) is not None
+
+def _iter_ris_fields(ris_data: str):
+    """Yield (tag, value) for every non-empty "TG  - value" line of a RIS body."""
+    for match in _RIS_LINE_RE.finditer(ris_data):
+        if match.group(2):
+            yield match.groups()
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching a CSS class token, like the `.name` selector."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+if LXML_AVAILABLE:
+    # Compiled once and reused for every search results page
+    _X_STATS = lxml_etree.XPath(f"//*[{_has_class('search-stats')} or {_has_class('js-search-stats')}]")
+    _X_ITEMS = lxml_etree.XPath(f"//*[{_has_class('result')}]")
+    _X_IDS_ALL = lxml_etree.XPath("//input[@name='idsAll[]']/@value")
+    _X_HIDDEN_ID = lxml_etree.XPath(f"(.//*[{_has_class('hiddenId')}])[1]/@value")
+    _X_CHECKBOX = lxml_etree.XPath(f"(.//input[{_has_class('checkbox-select-item')}])[1]/@value")
+    _X_TITLE = lxml_etree.XPath(f"(.//*[{_has_class('title')}])[1]")
+    _X_AUTHOR = lxml_etree.XPath(f"(.//*[{_has_class('author')}])[1]")
+    _X_FORMATS = lxml_etree.XPath(f".//*[{_has_class('format')}]")
+    _X_YEAR = lxml_etree.XPath(f"(.//*[{_has_class('publishDate')}])[1]")
+    _X_SUBJECTS = lxml_etree.XPath(f".//*[{_has_class('subject')}]//a")
+    _X_PUBLISHER = lxml_etree.XPath(f"(.//*[{_has_class('publisher')}])[1]")
+    _X_TEXT = lxml_etree.XPath(".//text()")
+    # Single-element result fields, by CSS class
+    _RESULT_FIELDS = {"title": _X_TITLE, "author": _X_AUTHOR,
+                      "publishDate": _X_YEAR, "publisher": _X_PUBLISHER}
+    # Record detail page
+    _XD_TITLE = lxml_etree.XPath("(//h3[@property='name'])[1]")
+    _XD_ROWS = lxml_etree.XPath(f"//table[{_has_class('table-striped')}]//tr")
+    _XD_TH = lxml_etree.XPath(".//th")
+    _XD_TD = lxml_etree.XPath("(.//td)[1]")
+    _XD_NEXT_TD = lxml_etree.XPath("following-sibling::td[1]")
+    _XD_DESCRIPTION_TAB = lxml_etree.XPath(f"ancestor::*[{_has_class('description-tab')}]")
+    _XD_PROPERTY_SPANS = lxml_etree.XPath(".//span[@property=$prop]")
+    _XD_FORMAT_SPANS = lxml_etree.XPath(f".//span[{_has_class('format')}]")
+    _XD_SUBJECT_LINKS = lxml_etree.XPath(".//a[contains(@href, '/Search/Results')]")
+    _XD_LINKS = lxml_etree.XPath(".//a")
+    _XD_FULLTEXT_LINKS = lxml_etree.XPath(f".//a[{_has_class('fulltext')}]")
+
+def _parse_html_stream(chunks, encoding: Optional[str] = None):
+    """
+    Parse HTML incrementally from an iterable of byte chunks (lxml only),
+    so parsing overlaps with the download instead of waiting for the body.
+    
+    Args:
+        chunks: Iterable of bytes, e.g. response.iter_content()
+        encoding: Declared character encoding, if known
+        
+    Returns:
+        The root element of the parsed document
+        
+    Raises:
+        ValueError: If the document could not be parsed
+    """
+    parser = lxml_etree.HTMLPullParser(encoding=encoding)
+    try:
+        for chunk in chunks:
+            if chunk:
+                parser.feed(chunk)
+        root = parser.close()
+    except lxml_etree.LxmlError as e:
+        raise ValueError(f"Could not parse HTML: {e}") from e
+    if root is None:
+        raise ValueError("Could not parse HTML: empty document")
+    return root
+
+def _lxml_text(elem) -> str:
+    """Equivalent of BeautifulSoup's get_text(strip=True) for an lxml element."""
+    return ''.join(t.strip() for t in _X_TEXT(elem))
+
+def _first(elems):
+    return elems[0] if elems else None
+
+class _LxmlPage:
+    """Page accessors for the shared extractors, over an lxml tree"""
+    text = staticmethod(_lxml_text)
+    
+    @staticmethod
+    def raw_text(elem):
+        return ''.join(_X_TEXT(elem))
+    
+    # Search results page
+    @staticmethod
+    def stats(tree):
+        return _X_STATS(tree)
+    
+    @staticmethod
+    def items(tree):
+        return _X_ITEMS(tree)
+    
+    @staticmethod
+    def all_ids(tree):
+        return _X_IDS_ALL(tree)
+    
+    @staticmethod
+    def hidden_id(item):
+        return _first(_X_HIDDEN_ID(item))
+    
+    @staticmethod
+    def checkbox_value(item):
+        return _first(_X_CHECKBOX(item))
+    
+    @staticmethod
+    def result_field(item, name):
+        return _first(_RESULT_FIELDS[name](item))
+    
+    @staticmethod
+    def formats(item):
+        return _X_FORMATS(item)
+    
+    @staticmethod
+    def subjects(item):
+        return _X_SUBJECTS(item)
+    
+    # Record detail page
+    @staticmethod
+    def detail_title(tree):
+        return _first(_XD_TITLE(tree))
+    
+    @staticmethod
+    def rows(tree):
+        return _XD_ROWS(tree)
+    
+    @staticmethod
+    def headers(row):
+        return _XD_TH(row)
+    
+    @staticmethod
+    def row_cell(row):
+        return _first(_XD_TD(row))
+    
+    @staticmethod
+    def next_cell(th):
+        return _first(_XD_NEXT_TD(th))
+    
+    @staticmethod
+    def in_description_tab(th):
+        return bool(_XD_DESCRIPTION_TAB(th))
+    
+    @staticmethod
+    def spans(cell, prop):
+        return _XD_PROPERTY_SPANS(cell, prop=prop)
+    
+    @staticmethod
+    def format_spans(cell):
+        return _XD_FORMAT_SPANS(cell)
+    
+    @staticmethod
+    def subject_links(cell):
+        return _XD_SUBJECT_LINKS(cell)
+    
+    @staticmethod
+    def links(cell):
+        return _XD_LINKS(cell)
+    
+    @staticmethod
+    def fulltext_links(cell):
+        return _XD_FULLTEXT_LINKS(cell)
+
+class _SoupPage:
+    """Page accessors for the shared extractors, over a BeautifulSoup tree"""
+    
+    @staticmethod
+    def text(elem):
+        return elem.get_text(strip=True)
+    
+    @staticmethod
+    def raw_text(elem):
+        return elem.get_text()
+    
+    # Search results page
+    @staticmethod
+    def stats(tree):
+        return tree.select('.search-stats, .js-search-stats')
+    
+    @staticmethod
+    def items(tree):
+        return tree.select('.result')
+    
+    @staticmethod
+    def all_ids(tree):
+        return [elem.get('value') for elem in tree.select('input[name="idsAll[]"]')]
+    
+    @staticmethod
+    def hidden_id(item):
+        elem = item.select_one('.hiddenId')
+        return elem.get('value') if elem else None
+    
+    @staticmethod
+    def checkbox_value(item):
+        elem = item.select_one('input.checkbox-select-item')
+        return elem.get('value') if elem else None
+    
+    @staticmethod
+    def result_field(item, name):
+        return item.select_one('.' + name)
+    
+    @staticmethod
+    def formats(item):
+        return item.select('.format')
+    
+    @staticmethod
+    def subjects(item):
+        return item.select('.subject a')
+    
+    # Record detail page
+    @staticmethod
+    def detail_title(tree):
+        return tree.select_one('h3[property="name"]')
+    
+    @staticmethod
+    def rows(tree):
+        return tree.select('table.table-striped tr')
+    
+    @staticmethod
+    def headers(row):
+        return row.find_all('th')
+    
+    @staticmethod
+    def row_cell(row):
+        return row.select_one('td')
+    
+    @staticmethod
+    def next_cell(th):
+        return th.find_next_sibling('td')
+    
+    @staticmethod
+    def in_description_tab(th):
+        return th.find_parent(class_='description-tab') is not None
+    
+    @staticmethod
+    def spans(cell, prop):
+        return cell.select(f'span[property="{prop}"]')
+    
+    @staticmethod
+    def format_spans(cell):
+        return cell.select('span.format')
+    
+    @staticmethod
+    def subject_links(cell):
+        return cell.select('a[href*="/Search/Results"]')
+    
+    @staticmethod
+    def links(cell):
+        return cell.select('a')
+    
+    @staticmethod
+    def fulltext_links(cell):
+        return cell.select('a.fulltext')
+
+def _parse_journal_info(journal_info: str, year: Optional[str]):
+    """
+    Pull volume, issue and pages out of the "In:" cell text of a record
+    detail page, taking the year from it too if none was found yet.
+    
+    Returns:
+        Tuple of (year, volume, issue, pages)
+    """
+    volume = issue = pages = None
+    
+    vol_match = _VOLUME_RE.search(journal_info) or _VOLUME_LOOSE_RE.search(journal_info)
+    if vol_match:
+        volume = vol_match.group(1)
+    
+    issue_match = _ISSUE_RE.search(journal_info) or _ISSUE_LOOSE_RE.search(journal_info)
+    if issue_match:
+        issue = issue_match.group(1)
+    
+    pages_match = _PAGES_RE.search(journal_info) or _PAGES_LOOSE_RE.search(journal_info)
+    if pages_match:
+        pages = pages_match.group(1)
+    
+    # If we still don't have all the info, try another approach with more flexible regex
+    if not (volume and issue and pages):
+        parts = _JOURNAL_INFO_RE.search(journal_info)
+        if parts:
+            if not year and parts.group(1):
+                year = parts.group(1)
+            if not volume and parts.group(2):
+                volume = parts.group(2)
+            if not issue and parts.group(3):
+                issue = parts.group(3)
+            if not pages and parts.group(4):
+                pages = parts.group(4)
+    
+    return year, volume, issue, pages
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter.
+    
+    Allows bursts of up to ``capacity`` requests and a sustained rate of
+    ``rate`` requests per second; callers only sleep when the bucket is empty.
+    """
+    
+    def __init__(self, rate: float, capacity: int):
+        """
+        Initialize the bucket (full).
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of stored tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
 class IxTheoClient:
     """
     Client for searching the IxTheo theological database.
     """
     
-    def __init__(self, timeout: int = 30, debug: bool = False, verify_ssl: bool = True):
+    # Session state (proof-of-work cookie, CSRF token) shared by all clients
+    # in the process, so only the first client visits the homepage.
+    _shared_cookies = None
+    _shared_csrf = None
+    _shared_at = 0.0
+    _init_lock = threading.Lock()
+    # The pow_token cookie is valid for 30 minutes; refresh a bit earlier
+    SHARED_SESSION_TTL = 25 * 60
+    # Records per cart export request in get_export_data_bulk
+    BULK_EXPORT_CHUNK = 50
+    
+    def __init__(self, timeout: int = 30, debug: bool = False, verify_ssl: bool = True,
+                 max_concurrent_requests: int = 8, requests_per_second: float = 2.0,
+                 burst: int = 5,
+                 record_cache_size: int = 2048):
         """
         Initialize the IxTheo client.
         
@@ -37,6 +503,12 @@ class IxTheoClient:
             timeout: Request timeout in seconds
             debug: Whether to print debug information
             verify_ssl: Whether to verify SSL certificates
+            max_concurrent_requests: Maximum number of search, record detail
+                and export requests in flight at once (shared by all threads)
+            requests_per_second: Sustained rate limit for those requests
+            burst: Number of those requests allowed back-to-back
+            record_cache_size: Number of parsed detail records and export
+                bodies kept in the in-process LRU cache (0 disables it)
         """
         # IxTheo endpoints
         self.base_url = "https://ixtheo.de"
@@ -50,8 +522,30 @@ class IxTheoClient:
         self.debug = debug
         self.verify_ssl = verify_ssl
         
-        # Initialize session
+        # Initialize session. The connection pool is sized for the batch
+        # methods, which share this session across worker threads. Transient
+        # failures are retried with exponential backoff; 429/503 responses
+        # wait for the server's Retry-After delay.
         self.session = requests.Session()
+        retry = Retry(total=5, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                      respect_retry_after_header=True, allowed_methods=frozenset(["GET"]))
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        # Bounds concurrent search/per-record requests and their sustained rate
+        self._request_slots = threading.Semaphore(max_concurrent_requests)
+        self._rate = TokenBucket(rate=requests_per_second, capacity=burst)
+        
+        # In-process LRU of parsed detail records and export bodies, keyed
+        # on ("html", record_id, keep_raw) / ("export", record_id, format)
+        self._record_cache: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self._record_cache_size = record_cache_size
+        self._record_cache_lock = threading.Lock()
+        
+        # Whether the cart export answers multi-record requests; None until
+        # get_export_data_bulk has tried it
+        self._bulk_export_supported = None
         
         # Set up session with browser-like headers
         self.session.headers.update({
@@ -72,7 +566,22 @@ class IxTheoClient:
         self._initialize_session()
     
     def _initialize_session(self):
-        """Initialize the session by visiting the main page and getting cookies"""
+        """Initialize the session by visiting the main page and getting cookies.
+        The result is shared process-wide; later clients reuse it until it
+        is older than SHARED_SESSION_TTL."""
+        with IxTheoClient._init_lock:
+            if (IxTheoClient._shared_cookies is not None
+                    and time.time() - IxTheoClient._shared_at < self.SHARED_SESSION_TTL):
+                self.session.cookies.update(IxTheoClient._shared_cookies)
+                self.csrf_token = IxTheoClient._shared_csrf
+                self._debug_print("Reusing shared IxTheo session cookies")
+                return
+            
+            self._initialize_new_session()
+    
+    def _initialize_new_session(self):
+        """Solve the proof-of-work challenge, visit the main page and publish
+        the resulting cookies/CSRF token for other clients"""
         try:
             self._debug_print("Initializing session...")
             
@@ -88,7 +597,11 @@ class IxTheoClient:
             # Extract CSRF token if available
             self._extract_csrf_token(response.text)
             
-            self._debug_print(f"Session initialized with cookies: {dict(self.session.cookies)}")
+            IxTheoClient._shared_cookies = self.session.cookies.copy()
+            IxTheoClient._shared_csrf = self.csrf_token
+            IxTheoClient._shared_at = time.time()
+            
+            self._debug_print("Session initialized with cookies: %s", self.session.cookies)
         
         except requests.exceptions.RequestException as e:
             logger.error(f"Error initializing session: {e}")
@@ -112,7 +625,7 @@ class IxTheoClient:
         self.session.cookies.set(
             "pow_token", f"{nonce}:{ts}:{i}", domain=domain, path="/"
         )
-        self._debug_print(f"Solved IxTheo proof-of-work challenge in {i} hashes")
+        self._debug_print("Solved IxTheo proof-of-work challenge in %s hashes", i)
 
     def _extract_csrf_token(self, html_content):
         """
@@ -122,11 +635,19 @@ class IxTheoClient:
             html_content: HTML content to parse
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            # A regex scan avoids parsing the whole homepage for one token
+            match = _CSRF_RE.search(html_content)
+            if match:
+                self.csrf_token = match.group(1)
+                self._debug_print("Found CSRF token: %s", self.csrf_token)
+                return True
+            
+            from bs4 import BeautifulSoup
+            soup = BeautifulSoup(html_content, HTML_PARSER)
             csrf_input = soup.find('input', {'name': 'csrf'})
             if csrf_input and csrf_input.get('value'):
                 self.csrf_token = csrf_input.get('value')
-                self._debug_print(f"Found CSRF token: {self.csrf_token}")
+                self._debug_print("Found CSRF token: %s", self.csrf_token)
                 return True
         except Exception as e:
             logger.error(f"Error extracting CSRF token: {e}")
@@ -134,6 +655,39 @@ class IxTheoClient:
         self.csrf_token = None
         return False
     
+    def close(self):
+        """Close the HTTP session"""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _lru_get(self, key):
+        """Return a cached value (moving it to most-recently-used) or None"""
+        with self._record_cache_lock:
+            value = self._record_cache.get(key)
+            if value is not None:
+                self._record_cache.move_to_end(key)
+            return value
+    
+    def _lru_put(self, key, value):
+        """Store a value, evicting the least-recently-used entries"""
+        if value is None or self._record_cache_size <= 0:
+            return
+        with self._record_cache_lock:
+            self._record_cache[key] = value
+            self._record_cache.move_to_end(key)
+            while len(self._record_cache) > self._record_cache_size:
+                self._record_cache.popitem(last=False)
+    
+    def clear_cache(self):
+        """Drop all cached detail records and export data"""
+        with self._record_cache_lock:
+            self._record_cache.clear()
+    
     def search(self, query: str, search_type: str = "AllFields", page: int = 1, 
               limit: int = 20, sort: str = "relevance, year desc",
               filter_format: Optional[str] = None, 
@@ -155,7 +709,7 @@ class IxTheoClient:
         Returns:
             Tuple of (total_results, list of BiblioRecord objects)
         """
-        self._debug_print(f"Searching for: {query} (page {page})")
+        self._debug_print("Searching for: %s (page %s)", query, page)
         
         # Prepare parameters
         params: Dict[str, Any] = {
@@ -187,62 +741,54 @@ class IxTheoClient:
             params["csrf"] = self.csrf_token
         
         try:
-            # Make request
-            response = self.session.get(self.search_url, params=params, timeout=self.timeout)
-            
-            if response.status_code != 200:
-                logger.error(f"Search failed with status code: {response.status_code}")
-                return 0, []
+            # Make request. With lxml the page is parsed while it downloads.
+            # Result pages share the rate limit and request slots with the
+            # detail/export requests, since search_all_pages fetches them
+            # concurrently.
+            self._rate.acquire()
+            with self._request_slots, self.session.get(self.search_url, params=params,
+                                                       timeout=self.timeout,
+                                                       stream=LXML_AVAILABLE) as response:
+                if response.status_code != 200:
+                    logger.error(f"Search failed with status code: {response.status_code}")
+                    return 0, []
+                
+                if LXML_AVAILABLE:
+                    # Only trust an explicit charset; otherwise let lxml read <meta charset>
+                    content_type = response.headers.get("Content-Type", "").lower()
+                    encoding = response.encoding if "charset" in content_type else None
+                    page_content = _parse_html_stream(response.iter_content(8192), encoding)
+                else:
+                    page_content = response.text
             
             # Parse search results
-            raw_results = self._parse_search_results(response.text, query, page, limit)
+            raw_results = self._parse_search_results(page_content, query, page, limit)
             
             if raw_results["status"] != "success":
                 logger.error(f"Failed to parse search results: {raw_results.get('message', 'Unknown error')}")
                 return 0, []
             
-            # Convert raw results to BiblioRecord objects
-            total_results = raw_results["total_results"]
-            records = []
-            
-            for raw_record in raw_results["records"]:
-                record_id = raw_record.get("id")
-                
-                # Generate clean authors
-                authors = []
-                for author in raw_record.get("authors", []):
-                    if author and author.strip():
-                        authors.append(author.strip())
-                
-                # Extract year from raw record
-                year = raw_record.get("year")
-                
-                # Create BiblioRecord
-                record = BiblioRecord(
-                    id=record_id,
-                    title=raw_record.get("title", "Unknown Title"),
-                    authors=authors,
-                    year=year,
-                    subjects=raw_record.get("subjects", []),
-                    format=", ".join(raw_record.get("formats", [])),
-                    raw_data=str(raw_record)
-                )
-                
-                records.append(record)
-            
-            return total_results, records
+            # The parser already builds BiblioRecord objects
+            return raw_results["total_results"], raw_results["records"]
             
         except requests.exceptions.RequestException as e:
             logger.error(f"Search request error: {e}")
             return 0, []
+        except ValueError as e:
+            logger.error(f"Failed to parse search results: {e}")
+            return 0, []
     
     def search_all_pages(self, query: str, search_type: str = "AllFields", max_results: Optional[int] = None, 
                         limit: int = 20, sort: str = "relevance, year desc",
                         filter_format: Optional[str] = None, 
                         filter_language: Optional[str] = None,
-                        filter_topic: Optional[str] = None) -> Tuple[int, List[BiblioRecord]]:
+                        filter_topic: Optional[str] = None,
+                        max_workers: int = 8) -> Tuple[int, List[BiblioRecord]]:
         """
-        Search all pages until we reach max_results or all results are fetched
+        Search all pages until we reach max_results or all results are fetched.
+        
+        The first page is fetched on its own to learn the total result count;
+        the remaining pages are then requested concurrently.
         
         Args:
             query: Search query
@@ -253,14 +799,14 @@ class IxTheoClient:
             filter_format: Filter by format
             filter_language: Filter by language
             filter_topic: Filter by topic
+            max_workers: Maximum number of pages fetched in parallel
             
         Returns:
             Tuple of (total_results, list of BiblioRecord objects)
         """
-        page = 1
         all_records = []
         total_results, records = self.search(
-            query, search_type, page, limit, sort, 
+            query, search_type, 1, limit, sort, 
             filter_format, filter_language, filter_topic
         )
         
@@ -275,25 +821,29 @@ class IxTheoClient:
         else:
             max_pages = ((min(max_results, total_results) - 1) // limit) + 1
         
-        # Fetch remaining pages
-        for page in range(2, max_pages + 1):
-            # Check if we've already reached max_results
-            if max_results is not None and len(all_records) >= max_results:
-                break
-                
-            # Add a small delay to avoid overwhelming the server
-            time.sleep(1)
-            
-            _, page_records = self.search(
-                query, search_type, page, limit, sort, 
-                filter_format, filter_language, filter_topic
-            )
-            
-            if not page_records:
-                # No more results or error
-                break
+        # Fetch remaining pages concurrently over the shared session so the
+        # pow_token cookie and CSRF token from page 1 are reused. search()
+        # takes a rate-limiter token and request slot for every page, so the
+        # workers can't burst past the client's limits.
+        remaining_pages = range(2, max_pages + 1)
+        if remaining_pages:
+            workers = max(1, min(max_workers, len(remaining_pages)))
+            self._debug_print("Fetching %s more pages with %s workers", len(remaining_pages), workers)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                page_results = executor.map(
+                    lambda page: self.search(
+                        query, search_type, page, limit, sort,
+                        filter_format, filter_language, filter_topic
+                    )[1],
+                    remaining_pages
+                )
                 
-            all_records.extend(page_records)
+                # Results come back in page order; stop at the first empty page
+                for page_records in page_results:
+                    if not page_records:
+                        # No more results or error
+                        break
+                    all_records.extend(page_records)
         
         # Trim results to max_results if specified
         if max_results is not None and len(all_records) > max_results:
@@ -306,7 +856,7 @@ class IxTheoClient:
         Parse search results from HTML content
         
         Args:
-            html_content: HTML content to parse
+            html_content: HTML content to parse, or an already parsed lxml tree
             query: Original search query
             page: Current page number
             limit: Results per page
@@ -315,125 +865,10 @@ class IxTheoClient:
             dict: Parsed search results
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            results = []
-            
-            # Get total results count
-            total_results = 0
-            stats_elements = soup.select('.search-stats, .js-search-stats')
-            for stats_elem in stats_elements:
-                text = stats_elem.get_text()
-                if 'results of' in text:
-                    try:
-                        total_str = text.split('results of')[1].strip()
-                        # Extract only digits
-                        total_results = int(''.join(filter(str.isdigit, total_str)))
-                        break
-                    except (ValueError, IndexError):
-                        pass
-            
-            # Extract search results
-            result_items = soup.select('.result')
-            self._debug_print(f"Found {len(result_items)} result items on the page")
-            
-            for item in result_items:
-                # Get ID from different possible locations
-                item_id = None
-                
-                # Try hidden input first
-                hidden_id = item.select_one('.hiddenId')
-                if hidden_id and hidden_id.get('value'):
-                    item_id = hidden_id.get('value')
-                
-                # If still no ID, try from checkbox
-                if not item_id:
-                    checkbox = item.select_one('input.checkbox-select-item')
-                    if checkbox and checkbox.get('value'):
-                        # Value format is typically "Solr|ID"
-                        checkbox_value = checkbox.get('value')
-                        if '|' in checkbox_value:
-                            item_id = checkbox_value.split('|')[1]
-                
-                # If still no ID, try from li id attribute
-                if not item_id:
-                    li_id = item.get('id')
-                    if li_id and li_id.startswith('result'):
-                        try:
-                            # Extract the numeric part of the result ID
-                            li_index = int(li_id[6:])
-                            
-                            # Find the corresponding hidden input in the form
-                            hidden_inputs = soup.select('input[name="idsAll[]"]')
-                            if li_index < len(hidden_inputs):
-                                hidden_value = hidden_inputs[li_index].get('value')
-                                if hidden_value and '|' in hidden_value:
-                                    item_id = hidden_value.split('|')[1]
-                        except (ValueError, IndexError):
-                            pass
-                
-                if item_id:
-                    # Get title
-                    title_elem = item.select_one('.title')
-                    title = title_elem.get_text(strip=True) if title_elem else "Unknown Title"
-                    
-                    # Get authors
-                    authors = []
-                    author_elem = item.select_one('.author')
-                    if author_elem:
-                        author_text = author_elem.get_text(strip=True)
-                        # Handle different author formats
-                        if '(' in author_text and ')' in author_text:
-                            # Format: "Author Name (Author)" or similar
-                            author_name = author_text.split('(')[0].strip()
-                            authors.append(author_name)
-                        else:
-                            # Simple format or multiple authors
-                            authors = [a.strip() for a in author_text.split(';') if a.strip()]
-                    
-                    # Get formats
-                    formats = []
-                    format_elements = item.select('.format')
-                    for fmt in format_elements:
-                        format_text = fmt.get_text(strip=True)
-                        if format_text:
-                            formats.append(format_text)
-                    
-                    # Get year 
-                    year = None
-                    year_elem = item.select_one('.publishDate')
-                    if year_elem:
-                        year_text = year_elem.get_text(strip=True)
-                        # Try to extract year from text
-                        year_match = re.search(r'\b(19|20)\d{2}\b', year_text)
-                        if year_match:
-                            year = year_match.group(0)
-                    
-                    # Get subjects/topics
-                    subjects = []
-                    subject_elements = item.select('.subject a')
-                    for subject_elem in subject_elements:
-                        subject_text = subject_elem.get_text(strip=True)
-                        if subject_text:
-                            subjects.append(subject_text)
-                    
-                    # Get publisher name if available
-                    publisher = None
-                    publisher_elem = item.select_one('.publisher')
-                    if publisher_elem:
-                        publisher = publisher_elem.get_text(strip=True)
-                    
-                    # Build result object
-                    result = {
-                        "id": item_id,
-                        "title": title,
-                        "authors": authors,
-                        "formats": formats,
-                        "year": year,
-                        "subjects": subjects,
-                        "publisher": publisher
-                    }
-                    
-                    results.append(result)
+            if LXML_AVAILABLE:
+                total_results, results = self._extract_results_lxml(html_content)
+            else:
+                total_results, results = self._extract_results_soup(html_content)
             
             return {
                 "status": "success",
@@ -456,6 +891,157 @@ class IxTheoClient:
                 "records": []
             }
     
+    def _extract_results_lxml(self, html_content):
+        """
+        Extract the total count and result entries using compiled lxml XPaths
+        
+        Args:
+            html_content: HTML content to parse, or an already parsed lxml tree
+            
+        Returns:
+            Tuple of (total_results, list of BiblioRecord objects)
+        """
+        total_hint = None
+        if isinstance(html_content, (str, bytes)):
+            if isinstance(html_content, str):
+                total_hint = _find_total_in_source(html_content)
+            tree = lxml_html.fromstring(html_content)
+        else:
+            tree = html_content
+        return self._extract_results(_LxmlPage, tree, total_hint)
+    
+    def _extract_results_soup(self, html_content):
+        """
+        Extract the total count and result entries using BeautifulSoup
+        
+        Args:
+            html_content: HTML content to parse
+            
+        Returns:
+            Tuple of (total_results, list of BiblioRecord objects)
+        """
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(html_content, HTML_PARSER)
+        return self._extract_results(_SoupPage, soup, _find_total_in_source(html_content))
+    
+    def _extract_results(self, page, tree, total_hint):
+        """
+        Extract the total count and result entries of a parsed search
+        results page
+        
+        Args:
+            page: Accessors for the parser backend (_LxmlPage or _SoupPage)
+            tree: The parsed page
+            total_hint: Total read from the raw source, if found there
+            
+        Returns:
+            Tuple of (total_results, list of BiblioRecord objects)
+        """
+        # Get total results count (stats elements only if the source scan missed)
+        total_results = total_hint or 0
+        for stats_elem in (page.stats(tree) if total_hint is None else ()):
+            total = _parse_total_results(page.raw_text(stats_elem))
+            if total is not None:
+                total_results = total
+                break
+        
+        # Extract search results
+        result_items = page.items(tree)
+        self._debug_print("Found %s result items on the page", len(result_items))
+        
+        # Form-level hidden inputs, looked up once for the li-index fallback
+        all_ids = None
+        results = []
+        for item in result_items:
+            # Get ID from different possible locations
+            
+            # Try hidden input first
+            item_id = page.hidden_id(item)
+            
+            # If still no ID, try from checkbox ("Solr|ID")
+            if not item_id:
+                checkbox_value = page.checkbox_value(item)
+                if checkbox_value and '|' in checkbox_value:
+                    item_id = checkbox_value.partition('|')[2]
+            
+            # If still no ID, try from li id attribute
+            if not item_id:
+                li_id = item.get('id')
+                if li_id and li_id.startswith('result'):
+                    try:
+                        li_index = int(li_id[6:])
+                        if all_ids is None:
+                            all_ids = page.all_ids(tree)
+                        if li_index < len(all_ids) and all_ids[li_index] and '|' in all_ids[li_index]:
+                            item_id = all_ids[li_index].partition('|')[2]
+                    except (ValueError, IndexError):
+                        pass
+            
+            if not item_id:
+                continue
+            
+            def field_text(name):
+                elem = page.result_field(item, name)
+                return page.text(elem) if elem is not None else None
+            
+            results.append(self._build_result(
+                item_id,
+                title=field_text('title'),
+                author_text=field_text('author'),
+                formats=[page.text(fmt) for fmt in page.formats(item)],
+                year_text=field_text('publishDate'),
+                subjects=[page.text(subj) for subj in page.subjects(item)],
+                publisher=field_text('publisher')
+            ))
+        
+        return total_results, results
+    
+    def _build_result(self, item_id, title, author_text, formats, year_text, subjects, publisher):
+        """
+        Build a BiblioRecord from the fields of one search result entry.
+        raw_data is left unset; the detail/export lookups supply full data.
+        
+        Args:
+            item_id: Record ID
+            title: Title text (None if missing)
+            author_text: Raw author text (None if missing)
+            formats: Format labels
+            year_text: Publication date text (None if missing)
+            subjects: Subject labels
+            publisher: Publisher text (None if missing)
+            
+        Returns:
+            BiblioRecord: Result record
+        """
+        # Get authors
+        authors = []
+        if author_text:
+            # Handle different author formats
+            if '(' in author_text and ')' in author_text:
+                # Format: "Author Name (Author)" or similar
+                authors.append(author_text.partition('(')[0].strip())
+            else:
+                # Simple format or multiple authors
+                authors = [a for a in map(str.strip, author_text.split(';')) if a]
+        
+        # Get year
+        year = None
+        if year_text:
+            # Try to extract year from text
+            year_match = _YEAR_RE.search(year_text)
+            if year_match:
+                year = year_match.group(0)
+        
+        return BiblioRecord(
+            id=item_id,
+            title=title if title is not None else "Unknown Title",
+            authors=authors,
+            year=year,
+            publisher_name=publisher or None,
+            subjects=[subj for subj in subjects if subj],
+            format=", ".join(fmt for fmt in formats if fmt)
+        )
+    
     def get_export_data(self, record_id, export_format="RIS"):
         """
         Get export data for a specific record
@@ -467,19 +1053,21 @@ class IxTheoClient:
         Returns:
             str: The export data
         """
-        self._debug_print(f"Getting {export_format} export for record: {record_id}")
+        self._debug_print("Getting %s export for record: %s", export_format, record_id)
         
         # IxTheo only supports RIS and MARC formats via direct export
         if export_format not in ["RIS", "MARC"]:
             export_format = "RIS"  # Default to RIS if unsupported format is requested
         
+        cache_key = ("export", record_id, export_format)
+        cached = self._lru_get(cache_key)
+        if cached is not None:
+            return cached
+        
         # Generate export URL
         export_url = f"{self.export_url_template.format(record_id=record_id)}?style={export_format}"
         
         try:
-            # Wait a moment to avoid overwhelming the server
-            time.sleep(0.5)
-            
             # Make request with headers that match a browser
             headers = {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
@@ -488,252 +1076,94 @@ class IxTheoClient:
                 "Referer": f"{self.base_url}/Record/{record_id}",
                 "X-Requested-With": "XMLHttpRequest"
             }
-            response = self.session.get(export_url, headers=headers, timeout=self.timeout)
+            # Limit request rate and concurrency to avoid overwhelming the server
+            self._rate.acquire()
+            with self._request_slots:
+                response = self.session.get(export_url, headers=headers, timeout=self.timeout)
             
             if response.status_code != 200:
                 logger.error(f"Export failed with status code: {response.status_code}")
                 return None
             
             # Check if response is empty
-            if not response.text.strip():
+            text = response.text
+            if not text.strip():
                 logger.warning(f"Export returned empty response for record {record_id}")
                 return None
-                
-            return response.text
+            
+            self._lru_put(cache_key, text)
+            return text
             
         except requests.exceptions.RequestException as e:
             logger.error(f"Export request error for record {record_id}: {e}")
             return None
     
-    def get_record_with_html(self, record_id):
+    def get_raw_html(self, record_id):
+        """
+        Get the raw HTML of a record's detail page
+        
+        Args:
+            record_id: The record ID
+            
+        Returns:
+            str: The detail page HTML, or None on failure
+        """
+        try:
+            self._rate.acquire()
+            with self._request_slots:
+                response = self.session.get(f"{self.base_url}/Record/{record_id}", timeout=self.timeout)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Record detail request error for record {record_id}: {e}")
+            return None
+        
+        if response.status_code != 200:
+            logger.error(f"Record detail request failed with status code: {response.status_code}")
+            return None
+        return response.text
+    
+    def get_record_with_html(self, record_id, keep_raw: bool = True):
     
         """
         Get detailed information for a specific record
         
         Args:
             record_id: The record ID
+            keep_raw: Whether to keep the page HTML as raw_data. Pass False
+                when fetching many records; get_raw_html() re-fetches it.
             
         Returns:
             BiblioRecord: The detailed record
         """
-        self._debug_print(f"Getting detail for record: {record_id}")
+        self._debug_print("Getting detail for record: %s", record_id)
+        
+        # Callers may modify the returned record, so hand out copies
+        cache_key = ("html", record_id, keep_raw)
+        cached = self._lru_get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
         
         try:
             # Make request for record detail page
-            response = self.session.get(f"{self.base_url}/Record/{record_id}", timeout=self.timeout)
-            
-            if response.status_code != 200:
-                logger.error(f"Record detail request failed with status code: {response.status_code}")
+            html = self.get_raw_html(record_id)
+            if html is None:
                 return None
             
-            # Parse record details
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Extract title - find the h3 tag with the title
-            title = "Unknown Title"
-            title_elem = soup.select_one('h3[property="name"]')
-            if title_elem:
-                title = title_elem.get_text(strip=True)
-            
-            # Extract authors - look in the bibliographic details table
-            authors = []
-            for row in soup.select('table.table-striped tr'):
-                header = row.select_one('th')
-                if header and 'Author' in header.get_text():
-                    author_cell = row.select_one('td')
-                    if author_cell:
-                        author_spans = author_cell.select('span[property="name"]')
-                        for span in author_spans:
-                            author_text = span.get_text(strip=True)
-                            if author_text:
-                                authors.append(author_text)
-            
-            # Extract format
-            format_str = ""
-            format_row = soup.select_one('table.table-striped tr th:-soup-contains("Format:")')
-            if format_row:
-                format_cell = format_row.find_next_sibling('td')
-                if format_cell:
-                    format_spans = format_cell.select('span.format')
-                    for span in format_spans:
-                        format_type = span.get_text(strip=True)
-                        format_str += format_type
-            
-            # Extract language
-            language = None
-            language_row = soup.select_one('table.table-striped tr th:-soup-contains("Language:")')
-            if language_row and language_row.find_next_sibling('td'):
-                language = language_row.find_next_sibling('td').get_text(strip=True)
-            
-            # Extract publication info
-            publisher = None
-            pub_place = None
-            year = None
-            
-            # Try finding the publication information
-            published_row = soup.select_one('table.table-striped tr th:-soup-contains("Published:")')
-            if published_row:
-                published_cell = published_row.find_next_sibling('td')
-                if published_cell:
-                    # Extract location
-                    location_elem = published_cell.select_one('span[property="location"]')
-                    if location_elem:
-                        pub_place = location_elem.get_text(strip=True)
-                    
-                    # Extract publisher
-                    publisher_elem = published_cell.select_one('span[property="name"]')
-                    if publisher_elem:
-                        publisher = publisher_elem.get_text(strip=True)
-                    
-                    # Extract year
-                    date_elem = published_cell.select_one('span[property="datePublished"]')
-                    if date_elem:
-                        year = date_elem.get_text(strip=True)
-            
-            # Extract subjects
-            subjects = []
-            # Find subject rows - there may be multiple
-            subject_rows = soup.select('table.table-striped tr th:-soup-contains("Subject")')
-            for row in subject_rows:
-                subject_cell = row.find_next_sibling('td')
-                if subject_cell:
-                    # Get all subject links
-                    for link in subject_cell.select('a[href*="/Search/Results"]'):
-                        subject_text = link.get_text(strip=True)
-                        if subject_text and subject_text not in subjects:
-                            subjects.append(subject_text)
-            
-            # Extract ISBN/ISSN
-            isbn = None
-            issn = None
-            
-            isbn_row = soup.select_one('.description-tab table.table-striped tr th:-soup-contains("ISBN:")')
-            if isbn_row:
-                isbn_cell = isbn_row.find_next_sibling('td')
-                if isbn_cell:
-                    span = isbn_cell.select_one('span[property="isbn"]')
-                    if span:
-                        isbn = span.get_text(strip=True)
-                    else:
-                        isbn = isbn_cell.get_text(strip=True)
-            
-            issn_row = soup.select_one('.description-tab table.table-striped tr th:-soup-contains("ISSN:")')
-            if issn_row:
-                issn_cell = issn_row.find_next_sibling('td')
-                if issn_cell:
-                    span = issn_cell.select_one('span[property="issn"]')
-                    if span:
-                        issn = span.get_text(strip=True)
-                    else:
-                        issn = issn_cell.get_text(strip=True)
-            
-            # Extract physical description (extent)
-            extent = None
-            phys_desc_row = soup.select_one('.description-tab table.table-striped tr th:-soup-contains("Physical Description:")')
-            if phys_desc_row:
-                phys_desc_cell = phys_desc_row.find_next_sibling('td')
-                if phys_desc_cell:
-                    extent = phys_desc_cell.get_text(strip=True)
-            
-            # Extract series
-            series = None
-            series_row = soup.select_one('table.table-striped tr th:-soup-contains("Series")')
-            if series_row:
-                series_cell = series_row.find_next_sibling('td')
-                if series_cell:
-                    series_link = series_cell.select_one('a')
-                    if series_link:
-                        series = series_link.get_text(strip=True)
-            
-            # Extract journal info - volume, issue, pages
-            journal_title = None
-            volume = None
-            issue = None
-            pages = None
-            
-            journal_row = soup.select_one('table.table-striped tr th:-soup-contains("In:")')
-            if journal_row:
-                journal_cell = journal_row.find_next_sibling('td')
-                if journal_cell:
-                    journal_link = journal_cell.select_one('a')
-                    if journal_link:
-                        journal_title = journal_link.get_text(strip=True)
-                    
-                    # Try to extract volume, issue, pages from text after journal title
-                    journal_info = journal_cell.get_text(strip=True)
-                    
-                    # Extract volume
-                    vol_match = re.search(r'Volume:\s*(\d+)', journal_info) or re.search(r'Volume[^,]*?(\d+)', journal_info)
-                    if vol_match:
-                        volume = vol_match.group(1)
-                    
-                    # Extract issue
-                    issue_match = re.search(r'Issue:\s*(\d+)', journal_info) or re.search(r'Issue[^,]*?(\d+)', journal_info)
-                    if issue_match:
-                        issue = issue_match.group(1)
-                    
-                    # Extract pages
-                    pages_match = re.search(r'Pages:\s*([0-9-]+)', journal_info) or re.search(r'Pages[^,]*?([0-9-]+)', journal_info)
-                    if pages_match:
-                        pages = pages_match.group(1)
-                    
-                    # If we still don't have all the info, try another approach with more flexible regex
-                    if not (volume and issue and pages):
-                        parts = re.search(r'Year:\s*([\d]{4})(?:[^,]*?)(?:Volume:\s*(\d+))?(?:[^,]*?)(?:Issue:\s*(\d+))?(?:[^,]*?)(?:Pages:\s*([0-9-]+))?', journal_info)
-                        if parts:
-                            if not year and parts.group(1):
-                                year = parts.group(1)
-                            if not volume and parts.group(2):
-                                volume = parts.group(2)
-                            if not issue and parts.group(3):
-                                issue = parts.group(3)
-                            if not pages and parts.group(4):
-                                pages = parts.group(4)
-            
-            # Extract abstract/summary
-            abstract = None
-            summary_row = soup.select_one('.description-tab table.table-striped tr th:-soup-contains("Summary:")')
-            if summary_row:
-                summary_cell = summary_row.find_next_sibling('td')
-                if summary_cell:
-                    abstract = summary_cell.get_text(strip=True)
-            
-            # Extract URLs (if any)
-            urls = []
-            url_row = soup.select_one('table.table-striped tr th:-soup-contains("Online Access:")')
-            if url_row:
-                url_cell = url_row.find_next_sibling('td')
-                if url_cell:
-                    for link in url_cell.select('a.fulltext'):
-                        href = link.get('href')
-                        if href and href.startswith('http'):
-                            urls.append(href)
+            # Parse record details (lxml XPaths, or BeautifulSoup without lxml;
+            # a blank page has nothing for lxml to parse)
+            if LXML_AVAILABLE and html.strip():
+                fields = self._extract_detail_lxml(html)
+            else:
+                fields = self._extract_detail_soup(html)
             
             # Create BiblioRecord with all extracted data
             record = BiblioRecord(
                 id=record_id,
-                title=title,
-                authors=authors,
-                year=year,
-                publisher_name=publisher,
-                place_of_publication=pub_place,
-                isbn=isbn,
-                issn=issn,
-                urls=urls,
-                abstract=abstract,
-                language=language,
-                format=format_str,
-                subjects=subjects,
-                series=series,
-                extent=extent,
-                journal_title=journal_title,
-                volume=volume,
-                issue=issue,
-                pages=pages,
-                raw_data=response.text
+                raw_data=html if keep_raw else None,
+                **fields
             )
             
-            self._debug_print(f"Created detailed record: {record.title}")
+            self._debug_print("Created detailed record: %s", record.title)
+            self._lru_put(cache_key, copy.deepcopy(record))
             return record
             
         except requests.exceptions.RequestException as e:
@@ -745,165 +1175,420 @@ class IxTheoClient:
             traceback.print_exc()
             return None
     
-    def _debug_print(self, message):
-        """Print debug message if debug mode is enabled"""
-        if self.debug:
-            logger.debug(message)
-
-    def _convert_ris_to_bibtex(self, ris_data, record_id):
+    def _extract_detail_lxml(self, html_content):
         """
-        Convert RIS data to BibTeX format
+        Extract the fields of a record detail page using compiled lxml XPaths
         
         Args:
-            ris_data: RIS formatted data
-            record_id: Record ID for reference
+            html_content: HTML content to parse, or an already parsed lxml tree
             
         Returns:
-            str: BibTeX formatted data
+            dict: BiblioRecord keyword arguments (all but id and raw_data)
         """
-        self._debug_print(f"Converting RIS to BibTeX for record {record_id}")
+        if isinstance(html_content, (str, bytes)):
+            tree = lxml_html.fromstring(html_content)
+        else:
+            tree = html_content
+        return self._extract_detail(_LxmlPage, tree)
+    
+    def _extract_detail_soup(self, html_content):
+        """
+        Extract the fields of a record detail page using BeautifulSoup
         
-        if not ris_data:
-            self._debug_print("No RIS data to convert")
-            return None
+        Args:
+            html_content: HTML content to parse
             
-        # Parse RIS data
-        ris_lines = ris_data.strip().split("\n")
-        self._debug_print(f"Parsing {len(ris_lines)} lines of RIS data")
+        Returns:
+            dict: BiblioRecord keyword arguments (all but id and raw_data)
+        """
+        from bs4 import BeautifulSoup
+        return self._extract_detail(_SoupPage, BeautifulSoup(html_content, HTML_PARSER))
+    
+    def _extract_detail(self, page, tree):
+        """
+        Extract the fields of a parsed record detail page
         
-        # Initialize fields to extract
-        entry_type = "misc"  # Default
-        title = None
+        Args:
+            page: Accessors for the parser backend (_LxmlPage or _SoupPage)
+            tree: The parsed page
+            
+        Returns:
+            dict: BiblioRecord keyword arguments (all but id and raw_data)
+        """
+        # Extract title - find the h3 tag with the title
+        title = "Unknown Title"
+        title_elem = page.detail_title(tree)
+        if title_elem is not None:
+            title = page.text(title_elem)
+        
+        # Index the bibliographic details table in a single pass; the
+        # field lookups below scan this list instead of re-walking the DOM
+        detail_rows = page.rows(tree)
+        header_cells = [(page.raw_text(th), th) for row in detail_rows for th in page.headers(row)]
+        
+        def find_cell(label, description_tab=False):
+            """Value cell of the first header containing label (optionally
+            only in .description-tab)"""
+            for text, th in header_cells:
+                if label in text and (not description_tab or page.in_description_tab(th)):
+                    return page.next_cell(th)
+            return None
+        
+        def first_span(cell, prop):
+            return _first(page.spans(cell, prop))
+        
+        # Extract authors - look in the bibliographic details table
         authors = []
-        editors = []  
-        year = None
+        for row in detail_rows:
+            header = _first(page.headers(row))
+            if header is not None and 'Author' in page.raw_text(header):
+                author_cell = page.row_cell(row)
+                if author_cell is not None:
+                    for span in page.spans(author_cell, 'name'):
+                        author_text = page.text(span)
+                        if author_text:
+                            authors.append(author_text)
+        
+        # Extract format
+        format_str = ""
+        format_cell = find_cell("Format:")
+        if format_cell is not None:
+            format_str = ''.join(page.text(span) for span in page.format_spans(format_cell))
+        
+        # Extract language
+        language = None
+        language_cell = find_cell("Language:")
+        if language_cell is not None:
+            language = page.text(language_cell)
+        
+        # Extract publication info
         publisher = None
-        place = None
-        isbn = None
-        issn = None
-        journal = None
+        pub_place = None
+        year = None
+        
+        published_cell = find_cell("Published:")
+        if published_cell is not None:
+            location_elem = first_span(published_cell, 'location')
+            if location_elem is not None:
+                pub_place = page.text(location_elem)
+            
+            publisher_elem = first_span(published_cell, 'name')
+            if publisher_elem is not None:
+                publisher = page.text(publisher_elem)
+            
+            date_elem = first_span(published_cell, 'datePublished')
+            if date_elem is not None:
+                year = page.text(date_elem)
+        
+        # Extract subjects - there may be multiple subject rows
+        subjects = []
+        for text, th in header_cells:
+            if "Subject" not in text:
+                continue
+            subject_cell = page.next_cell(th)
+            if subject_cell is not None:
+                for link in page.subject_links(subject_cell):
+                    subject_text = page.text(link)
+                    if subject_text and subject_text not in subjects:
+                        subjects.append(subject_text)
+        
+        # Extract ISBN/ISSN, preferring the property span over the cell text
+        def identifier(label, prop):
+            cell = find_cell(label, description_tab=True)
+            if cell is None:
+                return None
+            span = first_span(cell, prop)
+            return page.text(span if span is not None else cell)
+        
+        isbn = identifier("ISBN:", "isbn")
+        issn = identifier("ISSN:", "issn")
+        
+        # Extract physical description (extent)
+        extent = None
+        phys_desc_cell = find_cell("Physical Description:", description_tab=True)
+        if phys_desc_cell is not None:
+            extent = page.text(phys_desc_cell)
+        
+        # Extract series
+        series = None
+        series_cell = find_cell("Series")
+        if series_cell is not None:
+            series_link = _first(page.links(series_cell))
+            if series_link is not None:
+                series = page.text(series_link)
+        
+        # Extract journal info - volume, issue, pages
+        journal_title = None
         volume = None
         issue = None
         pages = None
-        start_page = None
-        end_page = None
-        doi = None
-        url = None
+        
+        journal_cell = find_cell("In:")
+        if journal_cell is not None:
+            journal_link = _first(page.links(journal_cell))
+            if journal_link is not None:
+                journal_title = page.text(journal_link)
+            
+            # Volume, issue and pages follow the journal title in the cell text
+            year, volume, issue, pages = _parse_journal_info(page.text(journal_cell), year)
+        
+        # Extract abstract/summary
         abstract = None
+        summary_cell = find_cell("Summary:", description_tab=True)
+        if summary_cell is not None:
+            abstract = page.text(summary_cell)
+        
+        # Extract URLs (if any)
+        urls = []
+        url_cell = find_cell("Online Access:")
+        if url_cell is not None:
+            for link in page.fulltext_links(url_cell):
+                href = link.get('href')
+                if href and href.startswith('http'):
+                    urls.append(href)
+        
+        return {
+            "title": title,
+            "authors": authors,
+            "year": year,
+            "publisher_name": publisher,
+            "place_of_publication": pub_place,
+            "isbn": isbn,
+            "issn": issn,
+            "urls": urls,
+            "abstract": abstract,
+            "language": language,
+            "format": format_str,
+            "subjects": subjects,
+            "series": series,
+            "extent": extent,
+            "journal_title": journal_title,
+            "volume": volume,
+            "issue": issue,
+            "pages": pages,
+        }
+    
+    def get_export_data_batch(self, record_ids: List[str], export_format: str = "RIS",
+                              max_workers: int = 16) -> Dict[str, Optional[str]]:
+        """
+        Get export data for several records in parallel
         
-        # Extract data from RIS
-        for line in ris_lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Try to split line into tag and value
-            if "  - " not in line:
-                self._debug_print(f"Skipping invalid RIS line: {line}")
+        Args:
+            record_ids: The record IDs
+            export_format: The export format (RIS or MARC)
+            max_workers: Number of worker threads sharing the session
+            
+        Returns:
+            dict: Mapping of record ID to export data (None on failure)
+        """
+        return self._run_batch(
+            lambda record_id: self.get_export_data(record_id, export_format),
+            record_ids, max_workers
+        )
+    
+    def get_export_data_bulk(self, record_ids: List[str],
+                             export_format: str = "RIS") -> Dict[str, Optional[str]]:
+        """
+        Get RIS export data for many records with one cart export request
+        per BULK_EXPORT_CHUNK records instead of one request per record
+        
+        VuFind returns the records of a cart export one after another; each
+        is matched to its ID through the record URL or ID line it carries.
+        Records that can't be matched are exported one by one instead, as is
+        a chunk whose cart export failed, and everything once the server has
+        rejected cart exports outright. The results also fill the cache
+        get_export_data reads.
+        
+        Args:
+            record_ids: The record IDs
+            export_format: The export format; only RIS is requested in bulk
+            
+        Returns:
+            dict: Mapping of record ID to export data (None on failure)
+        """
+        record_ids = list(dict.fromkeys(record_ids))
+        if export_format != "RIS":
+            return self.get_export_data_batch(record_ids, export_format)
+        
+        results = {}
+        missing = []
+        for record_id in record_ids:
+            cached = self._lru_get(("export", record_id, "RIS"))
+            if cached is not None:
+                results[record_id] = cached
+            else:
+                missing.append(record_id)
+        
+        leftover = []
+        for start in range(0, len(missing), self.BULK_EXPORT_CHUNK):
+            chunk = missing[start:start + self.BULK_EXPORT_CHUNK]
+            exports = self._cart_export_ris(chunk) if self._bulk_export_supported is not False else {}
+            for record_id in chunk:
+                text = exports.get(record_id)
+                if text is None:
+                    leftover.append(record_id)
+                    continue
+                self._lru_put(("export", record_id, "RIS"), text)
+                results[record_id] = text
+        
+        if leftover:
+            results.update(self.get_export_data_batch(leftover, "RIS"))
+        return {record_id: results.get(record_id) for record_id in record_ids}
+    
+    def _cart_export_ris(self, record_ids):
+        """
+        Export several records as RIS through the cart export
+        
+        Returns:
+            dict: Mapping of record ID to its RIS record, for the IDs whose
+            record was found in the export (empty if the export failed)
+        """
+        params = [("f", "RIS")] + [("i[]", f"Solr|{record_id}") for record_id in record_ids]
+        try:
+            self._rate.acquire()
+            with self._request_slots:
+                response = self.session.get(f"{self.base_url}/Cart/doExport", params=params,
+                                            headers={"Accept": "text/plain, */*; q=0.01"},
+                                            timeout=self.timeout)
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Cart export request error: {e}")
+            return {}
+        
+        # No cart export route, or a page that isn't RIS: don't try again.
+        # Other errors may be transient and only affect this chunk.
+        if response.status_code in (404, 405) or (
+                response.status_code == 200 and not _RIS_TYPE_RE.search(response.text)):
+            self._debug_print("Cart export not available (status %s), exporting records one by one",
+                              response.status_code)
+            self._bulk_export_supported = False
+            return {}
+        if response.status_code != 200:
+            self._debug_print("Cart export failed (status %s), exporting this chunk one by one",
+                              response.status_code)
+            return {}
+        self._bulk_export_supported = True
+        
+        wanted = set(record_ids)
+        exports = {}
+        for part in _RIS_RECORD_END_RE.split(response.text):
+            part = part.strip()
+            if not part:
                 continue
-                
-            parts = line.split("  - ", 1)
-            if len(parts) != 2:
-                self._debug_print(f"Skipping invalid RIS line after split: {line}")
+            named = {url_id or line_id for url_id, line_id in _RIS_RECORD_ID_RE.findall(part)} & wanted
+            if len(named) != 1:
+                self._debug_print("Cart export record names %s of the requested IDs, skipping it",
+                                  len(named))
                 continue
-                
-            tag, value = parts[0].strip(), parts[1].strip()
-            self._debug_print(f"Processing RIS tag: {tag} with value: {value}")
+            exports[named.pop()] = part + "\nER  - "
+        if len(exports) != len(record_ids):
+            self._debug_print("Cart export matched %s of %s IDs, exporting the rest one by one",
+                              len(exports), len(record_ids))
+        return exports
+    
+    def _run_batch(self, fetch, record_ids, max_workers):
+        """
+        Apply a per-record fetch function to many IDs on a thread pool
+        
+        Args:
+            fetch: Callable taking a record ID
+            record_ids: The record IDs
+            max_workers: Number of worker threads
             
-            if tag == "TY":
-                # Map RIS type to BibTeX type
-                if value == "JOUR":
-                    entry_type = "article"
-                    self._debug_print("Setting entry type to article based on JOUR")
-                elif value == "BOOK":
-                    entry_type = "book"
-                    self._debug_print("Setting entry type to book based on BOOK")
-                elif value == "CHAP":
-                    entry_type = "incollection"
-                    self._debug_print("Setting entry type to incollection based on CHAP")
-                elif value == "CONF":
-                    entry_type = "inproceedings"
-                    self._debug_print("Setting entry type to inproceedings based on CONF")
-                elif value == "THES":
-                    entry_type = "phdthesis"
-                    self._debug_print("Setting entry type to phdthesis based on THES")
-                self._debug_print(f"Entry type set to: {entry_type}")
-                
-            elif tag == "TI" or tag == "T1":
-                title = value
-                self._debug_print(f"Title set to: {title}")
-                
-            elif tag == "AU":
-                authors.append(value)
-                self._debug_print(f"Added author: {value}")
+        Returns:
+            dict: Mapping of record ID to the fetch result, in input order
+        """
+        record_ids = list(dict.fromkeys(record_ids))
+        if not record_ids:
+            return {}
+        
+        results = {}
+        workers = max(1, min(max_workers, len(record_ids)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(fetch, record_id): record_id for record_id in record_ids}
+            for future in as_completed(futures):
+                record_id = futures[future]
+                try:
+                    results[record_id] = future.result()
+                except Exception as e:
+                    logger.error(f"Batch request failed for record {record_id}: {e}")
+                    results[record_id] = None
+        
+        return {record_id: results[record_id] for record_id in record_ids}
+    
+    def _debug_print(self, message, *args):
+        """Log a debug message if debug mode is enabled. Arguments are
+        %-formatted lazily, so disabled calls cost no string building."""
+        if self.debug:
+            logger.debug(message, *args)
 
-            elif tag == "ED":
-                editors.append(value)
-                self._debug_print(f"Added editor: {value}")
-                
+    def _convert_ris_to_bibtex(self, ris_data, record_id):
+        """
+        Convert RIS data to BibTeX format
+        
+        Args:
+            ris_data: RIS formatted data
+            record_id: Record ID for reference
+            
+        Returns:
+            str: BibTeX formatted data
+        """
+        self._debug_print("Converting RIS to BibTeX for record %s", record_id)
+        
+        if not ris_data:
+            self._debug_print("No RIS data to convert")
+            return None
+            
+        # Extract data from RIS via the tag dispatch tables; one regex sweep
+        # over the whole body yields the (tag, value) pairs
+        entry_type = "misc"  # Default
+        fields: Dict[str, Any] = {"authors": [], "editors": []}
+        for tag, value in _iter_ris_fields(ris_data):
+            self._debug_print("Processing RIS tag: %s with value: %s", tag, value)
+            
+            field = _RIS_BIBTEX_FIELDS.get(tag)
+            if field:
+                fields[field] = value
+            elif tag in _RIS_BIBTEX_LIST_FIELDS:
+                fields[_RIS_BIBTEX_LIST_FIELDS[tag]].append(value)
+            elif tag == "TY":
+                # Map RIS type to BibTeX type
+                entry_type = _RIS_TY_MAP.get(value, entry_type)
             elif tag == "PY" or tag == "Y1":
                 # Extract year
-                year_match = re.search(r'\b(19|20)\d{2}\b', value)
+                year_match = _YEAR_RE.search(value)
                 if year_match:
-                    year = year_match.group(0)
-                    self._debug_print(f"Year set to: {year}")
-                    
-            elif tag == "PB":
-                publisher = value
-                self._debug_print(f"Publisher set to: {publisher}")
-                
-            elif tag == "CY":
-                place = value
-                self._debug_print(f"Place set to: {place}")
-                
+                    fields["year"] = year_match.group(0)
             elif tag == "SN":
                 # Could be ISBN or ISSN
-                if re.search(r'\d{4}-\d{3}[\dX]', value):
-                    issn = value
-                    self._debug_print(f"ISSN set to: {issn}")
-                else:
-                    isbn = value
-                    self._debug_print(f"ISBN set to: {isbn}")
-                    
-            elif tag == "JO" or tag == "T2":
-                journal = value
-                self._debug_print(f"Journal/Series set to: {journal}")
-                
-            elif tag == "VL":
-                volume = value
-                self._debug_print(f"Volume set to: {volume}")
-                
-            elif tag == "IS":
-                issue = value
-                self._debug_print(f"Issue set to: {issue}")
-                
-            elif tag == "SP":
-                start_page = value
-                self._debug_print(f"Start page set to: {start_page}")
-                
-            elif tag == "EP":
-                end_page = value
-                self._debug_print(f"End page set to: {end_page}")
-                
-            elif tag == "DO":
-                doi = value
-                self._debug_print(f"DOI set to: {doi}")
-                
-            elif tag == "UR":
-                url = value
-                self._debug_print(f"URL set to: {url}")
-                
-            elif tag == "AB":
-                abstract = value
-                self._debug_print("Abstract set")
+                fields["issn" if _is_issn(value) else "isbn"] = value
+        
+        self._debug_print("Entry type set to: %s", entry_type)
+        
+        title = fields.get("title")
+        authors = fields["authors"]
+        editors = fields["editors"]
+        year = fields.get("year")
+        publisher = fields.get("publisher")
+        place = fields.get("place")
+        isbn = fields.get("isbn")
+        issn = fields.get("issn")
+        journal = fields.get("journal")
+        volume = fields.get("volume")
+        issue = fields.get("issue")
+        start_page = fields.get("start_page")
+        end_page = fields.get("end_page")
+        doi = fields.get("doi")
+        url = fields.get("url")
+        abstract = fields.get("abstract")
+        pages = None
         
         # Construct page range if we have both start and end pages
         if start_page and end_page:
             pages = f"{start_page}--{end_page}"
-            self._debug_print(f"Page range set to: {pages}")
+            self._debug_print("Page range set to: %s", pages)
         elif start_page:
             pages = start_page
-            self._debug_print(f"Single page set to: {pages}")
+            self._debug_print("Single page set to: %s", pages)
         
         # If no title was found, use "Unknown Title"
         if not title:
@@ -922,104 +1607,134 @@ class IxTheoClient:
                 parts = first_author.split()
                 if parts:
                     citation_key = f"{parts[-1].lower()}{year}"
-            self._debug_print(f"Generated citation key: {citation_key}")
+            self._debug_print("Generated citation key: %s", citation_key)
         else:
             citation_key = f"ixtheo_{record_id}"
-            self._debug_print(f"No author/year, using ID-based citation key: {citation_key}")
-
-        # Build BibTeX entry
-        bibtex = [f"@{entry_type}{{{citation_key},"]
-
-        if editors:
-            # Format editors for BibTeX
-            formatted_editors = []
-            for editor in editors:
-                # Ensure proper formatting (already in "lastname, firstname" in RIS)
-                formatted_editors.append(editor)
+            self._debug_print("No author/year, using ID-based citation key: %s", citation_key)
 
-            bibtex.append(f"  editor = {{{' and '.join(formatted_editors)}}},")
-        
-        # Add title
-        if title:
-            # Escape special characters in title
-            title = title.replace("&", "\\&").replace("%", "\\%")
-            bibtex.append(f"  title = {{{title}}},")
-        
-        # Add authors
-        if authors:
-            # Format authors for BibTeX
-            formatted_authors = []
-            for author in authors:
-                # Ensure proper formatting (already in "lastname, firstname" in RIS)
-                formatted_authors.append(author)
-            
-            bibtex.append(f"  author = {{{' and '.join(formatted_authors)}}},")
-        
-        # Add year
-        if year:
-            bibtex.append(f"  year = {{{year}}},")
-        
-        # Add journal for articles
-        if entry_type == "article" and journal:
-            bibtex.append(f"  journal = {{{journal}}},")
-        elif journal and entry_type != "article":
-            # For non-articles, add as series
-            bibtex.append(f"  series = {{{journal}}},")
-        
-        # Add volume for articles or books with volumes
-        if volume:
-            bibtex.append(f"  volume = {{{volume}}},")
-        
-        # Add number/issue for articles
-        if issue:
-            bibtex.append(f"  number = {{{issue}}},")
-        
-        # Add pages
-        if pages:
-            bibtex.append(f"  pages = {{{pages}}},")
-        
-        # Add publisher
-        if publisher:
-            bibtex.append(f"  publisher = {{{publisher}}},")
-        
-        # Add address/place
-        if place:
-            bibtex.append(f"  address = {{{place}}},")
-        
-        # Add ISBN/ISSN
-        if isbn:
-            bibtex.append(f"  isbn = {{{isbn}}},")
-        if issn:
-            bibtex.append(f"  issn = {{{issn}}},")
-        
-        # Add DOI
-        if doi:
-            bibtex.append(f"  doi = {{{doi}}},")
-        
-        # Add URL
-        if url:
-            bibtex.append(f"  url = {{{url}}},")
-        
-        # Add abstract
+        # Escape special characters in title/abstract; limit abstract length
+        # to avoid issues with BibTeX
+        title = title.translate(_BIBTEX_ESCAPE)
         if abstract:
-            # Limit abstract length to avoid issues with BibTeX
             if len(abstract) > 1000:
                 abstract = abstract[:997] + "..."
-            abstract = abstract.replace("&", "\\&").replace("%", "\\%")
-            bibtex.append(f"  abstract = {{{abstract}}},")
-        
-        # Add note with record ID
-        bibtex.append(f"  note = {{ID: {record_id}}}")
-        
-        # Close entry
-        bibtex.append("}")
+            abstract = abstract.translate(_BIBTEX_ESCAPE)
+        
+        # Field table in output order; empty values are skipped. Journals are
+        # emitted as journal for articles and as series otherwise.
+        is_article = entry_type == "article"
+        bibtex_fields = (
+            ("editor", " and ".join(editors)),
+            ("title", title),
+            ("author", " and ".join(authors)),
+            ("year", year),
+            ("journal", journal if is_article else None),
+            ("series", journal if not is_article else None),
+            ("volume", volume),
+            ("number", issue),
+            ("pages", pages),
+            ("publisher", publisher),
+            ("address", place),
+            ("isbn", isbn),
+            ("issn", issn),
+            ("doi", doi),
+            ("url", url),
+            ("abstract", abstract),
+        )
         
-        result = "\n".join(bibtex)
-        self._debug_print(f"Generated BibTeX for {record_id}:")
+        # Build BibTeX entry
+        result = "\n".join((
+            "@%s{%s," % (entry_type, citation_key),
+            *(_BIBTEX_FIELD_TMPL[key] % value for key, value in bibtex_fields if value),
+            "  note = {ID: %s}" % record_id,
+            "}",
+        ))
+        self._debug_print("Generated BibTeX for %s:", record_id)
         self._debug_print(result)
         return result
 
 
+# RIS tag handlers for IxTheoSearchHandler.get_record_with_ris. Each one
+# updates the parse state dict for one "TAG  - value" line.
+def _ris_setter(key):
+    def handler(state, tag, value):
+        state[key] = value
+        logger.debug("%s set to: %s", key, value)
+    return handler
+
+def _ris_appender(key):
+    def handler(state, tag, value):
+        state[key].append(value)
+        logger.debug("Added to %s: %s", key, value)
+    return handler
+
+def _ris_year(state, tag, value):
+    year_match = _ANY_YEAR_RE.search(value)
+    if year_match:
+        state["year"] = year_match.group(1)
+        logger.debug("Year set to: %s", state["year"])
+
+def _ris_standard_number(state, tag, value):
+    # ISBN or ISSN
+    key = "issn" if _is_issn(value) else "isbn"
+    state[key] = value
+    logger.debug("%s set to: %s", key.upper(), value)
+
+def _ris_secondary_title(state, tag, value):
+    # Secondary title: the journal for articles, otherwise a book/series title
+    if state.get("record_type") == "JOUR":
+        state["journal"] = value
+        logger.debug("Journal title set to: %s", value)
+    elif tag == "T2":
+        # Process book chapter information from T2. First, extract editors
+        # from patterns like "Author Name (edt)"
+        editors = state["editors"]
+        for editor_match in _T2_EDITOR_RE.finditer(value):
+            if editor_match.group(2):  # We have last name, first name
+                editor_name = f"{editor_match.group(1).strip()}, {editor_match.group(2).strip()}"
+            else:  # Just have a name
+                editor_name = editor_match.group(1).strip()
+            
+            # Remove birth dates if present
+            editor_name = _LIFE_DATES_RE.sub('', editor_name)
+            
+            if editor_name not in editors:
+                editors.append(editor_name)
+                logger.debug("Extracted editor from T2: %s", editor_name)
+        
+        # Now remove the editor information from the T2 field to get just the book title
+        clean_series_title = _T2_EDITOR_PREFIX_RE.sub('', value)
+        # Remove any trailing comma + space if it's at the beginning
+        state["series_title"] = _LEADING_COMMA_RE.sub('', clean_series_title)
+        logger.debug("Series/Book title (cleaned) set to: %s", state["series_title"])
+    else:
+        # For other secondary title fields, just use as is
+        state["series_title"] = value
+        logger.debug("Series/Book title set to: %s", value)
+
+_RIS_RECORD_HANDLERS = {
+    "TY": _ris_setter("record_type"),
+    "TI": _ris_setter("title"), "T1": _ris_setter("title"),
+    "AU": _ris_appender("authors"), "A1": _ris_appender("authors"),
+    "A2": _ris_appender("editors"), "ED": _ris_appender("editors"),
+    "A4": _ris_appender("translators"),
+    "PY": _ris_year, "Y1": _ris_year,
+    "PB": _ris_setter("publisher"),
+    "CY": _ris_setter("place"),
+    "SN": _ris_standard_number,
+    "T2": _ris_secondary_title, "JF": _ris_secondary_title,
+    "JO": _ris_secondary_title, "JA": _ris_secondary_title,
+    "VL": _ris_setter("volume"),
+    "IS": _ris_setter("issue"),
+    "SP": _ris_setter("start_page"),
+    "EP": _ris_setter("end_page"),
+    "LA": _ris_setter("language"),
+    "DO": _ris_setter("doi"),
+    "UR": _ris_appender("urls"),
+    "N2": _ris_setter("abstract"), "AB": _ris_setter("abstract"),
+}
+
+
 # Add IxTheo to library_search.py functionality
 class IxTheoSearchHandler:
     """
@@ -1037,6 +1752,16 @@ class IxTheoSearchHandler:
         """
         self.client = IxTheoClient(timeout=timeout, debug=debug, verify_ssl=verify_ssl)
     
+    def close(self):
+        """Close the underlying IxTheo client"""
+        self.client.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def search(self, query=None, title=None, author=None, subject=None, 
               max_results=20, format_filter=None, language_filter=None):
         """
@@ -1092,15 +1817,15 @@ class IxTheoSearchHandler:
             return record
         
         # Get MARC export data
-        logger.debug(f"Getting MARC export for record: {record.id}")
+        logger.debug("Getting MARC export for record: %s", record.id)
         marc_data = self.client.get_export_data(record.id, "MARC")
         
         # Debug output for MARC data
         if marc_data:
-            logger.debug(f"MARC data received for {record.id}:")
+            logger.debug("MARC data received for %s:", record.id)
             logger.debug(marc_data)
         else:
-            logger.debug(f"No MARC data received for {record.id}")
+            logger.debug("No MARC data received for %s", record.id)
             # If no MARC data, fallback to RIS
             logger.warning(f"MARC retrieval failed for record {record.id}, falling back to RIS")
             return self.get_record_with_ris(record)
@@ -1270,7 +1995,7 @@ class IxTheoSearchHandler:
             format=format_str or record.format
         )
         
-        logger.debug(f"Enhanced record created from MARC for {record.id}: {enhanced_record}")
+        logger.debug("Enhanced record created from MARC for %s: %s", record.id, enhanced_record)
         return enhanced_record
     
     def get_record_with_ris(self, record):
@@ -1288,29 +2013,28 @@ class IxTheoSearchHandler:
             logger.debug("Record has no ID, returning unmodified")
             return record
         
-        # First get detailed record information
-        logger.debug(f"Getting detail for record: {record.id}")
+        # Fetch the detail page and the RIS export (IxTheo only supports RIS
+        # and MARC directly). Records are already enhanced in parallel by the
+        # caller, so the two requests run one after the other.
+        logger.debug("Getting detail and RIS export for record: %s", record.id)
         detailed_record = self.client.get_record_with_html(record.id)
-        
-        # Get RIS export data - IxTheo only supports RIS and MARC directly
-        logger.debug(f"Getting RIS export for record: {record.id}")
         ris_data = self.client.get_export_data(record.id, "RIS")
         
         # Debug output for RIS data
         if ris_data:
-            logger.debug(f"RIS data received for {record.id}:")
+            logger.debug("RIS data received for %s:", record.id)
             logger.debug(ris_data)
         else:
-            logger.debug(f"No RIS data received for {record.id}")
+            logger.debug("No RIS data received for %s", record.id)
             
             # If we have a detailed record but no RIS data
             if detailed_record:
-                logger.debug(f"Using detailed record (no RIS data) for {record.id}")
+                logger.debug("Using detailed record (no RIS data) for %s", record.id)
                 detailed_record.raw_data = detailed_record.raw_data or record.raw_data
                 return detailed_record
             
             # If all else fails, return the original record
-            logger.debug(f"No enhanced data available, returning original record for {record.id}")
+            logger.debug("No enhanced data available, returning original record for %s", record.id)
             return record
         
         # Ensure RIS data is properly encoded as UTF-8
@@ -1325,158 +2049,43 @@ class IxTheoSearchHandler:
                     ris_data = ris_data.decode('utf-8', errors='replace')
         
         # Fix common umlaut encodings if they appear as escape sequences
-        umlaut_replacements = {
-            r'\u00fc': 'ü',
-            r'\u00e4': 'ä',
-            r'\u00f6': 'ö',
-            r'\u00dc': 'Ü',
-            r'\u00c4': 'Ä',
-            r'\u00d6': 'Ö',
-            r'\u00df': 'ß'
-        }
-        
-        for escape_seq, umlaut in umlaut_replacements.items():
-            ris_data = ris_data.replace(escape_seq, umlaut)
+        if '\\u' in ris_data:
+            ris_data = _UMLAUT_ESCAPE_RE.sub(lambda m: _UMLAUT_ESCAPES[m.group(0)], ris_data)
         
         # Extract data from RIS to populate record fields
         if ris_data:
             # Parse RIS data to extract key fields
-            record_type = None
-            title = None
-            authors = []
-            editors = []
-            translators = []
-            year = None
-            publisher = None
-            place = None
-            isbn = None
-            issn = None
-            journal = None
-            volume = None
-            issue = None
-            start_page = None
-            end_page = None
-            language = None
-            doi = None
-            series_title = None
-            urls = []
-            abstract = None
-            
-            # Simple RIS parser
-            for line in ris_data.splitlines():
-                line = line.strip()
-                if not line or "  - " not in line:
-                    continue
-                
-                parts = line.split("  - ", 1)
-                if len(parts) != 2:
-                    continue
-                    
-                tag, value = parts[0].strip(), parts[1].strip()
-                # Ensure the value is properly encoded
-                value = self._ensure_utf8(value)
-                logger.debug(f"Processing RIS tag: {tag} with value: {value}")
-                
-                if tag == "TY":  # Type
-                    record_type = value
-                    logger.debug(f"Record type set to: {record_type}")
-                elif tag in ["TI", "T1"]:  # Title
-                    title = value
-                    logger.debug(f"Title set to: {title}")
-                elif tag == "AU" or tag == "A1":  # Author
-                    authors.append(value)
-                    logger.debug(f"Added author: {value}")
-                elif tag == "A2" or tag == "ED":  # Editor
-                    editors.append(value)
-                    logger.debug(f"Added editor: {value}")
-                elif tag == "A4":  # Translator
-                    translators.append(value)
-                    logger.debug(f"Added translator: {value}")
-                elif tag in ["PY", "Y1"]:  # Year
-                    year_match = re.search(r'(\d{4})', value)
-                    if year_match:
-                        year = year_match.group(1)
-                        logger.debug(f"Year set to: {year}")
-                elif tag == "PB":  # Publisher
-                    publisher = value
-                    logger.debug(f"Publisher set to: {publisher}")
-                elif tag == "CY":  # City/Place
-                    place = value
-                    logger.debug(f"Place set to: {place}")
-                elif tag == "SN":  # ISBN/ISSN
-                    if re.search(r'\d{4}-\d{3}[\dX]', value):
-                        issn = value
-                        logger.debug(f"ISSN set to: {issn}")
-                    else:
-                        isbn = value
-                        logger.debug(f"ISBN set to: {isbn}")
-                elif tag in ["T2", "JF", "JO", "JA"]:  # Secondary Title/Journal
-                    if record_type == "JOUR":
-                        journal = value
-                        logger.debug(f"Journal title set to: {value}")
-                    else:
-                        # Process book chapter information from T2
-                        # First, extract editors from T2 field if present
-                        if tag == "T2":
-                            # Look for patterns like "Author Name (edt)"
-                            t2_value = value
-                            editor_matches = re.finditer(r'([^,]+)(?:,\s+([^(]+))?\s+(?:\d{4}-)?\s*\(edt\)', t2_value)
-                            for editor_match in editor_matches:
-                                if editor_match.group(2):  # We have last name, first name
-                                    editor_name = f"{editor_match.group(1).strip()}, {editor_match.group(2).strip()}"
-                                else:  # Just have a name
-                                    editor_name = editor_match.group(1).strip()
-                                
-                                # Remove birth dates if present
-                                editor_name = re.sub(r'\s+\d{4}-(?:\d{4})?', '', editor_name)
-                                
-                                if editor_name not in editors:
-                                    editors.append(editor_name)
-                                    logger.debug(f"Extracted editor from T2: {editor_name}")
-                            
-                            # Now remove the editor information from the T2 field to get just the book title
-                            clean_series_title = re.sub(r'([^,]+)(?:,\s+[^(]+)?\s+(?:\d{4}-)?\s*\(edt\),\s*', '', t2_value)
-                            # Remove any trailing comma + space if it's at the beginning
-                            clean_series_title = re.sub(r'^,\s*', '', clean_series_title)
-                            series_title = clean_series_title
-                            logger.debug(f"Series/Book title (cleaned) set to: {series_title}")
-                        else:
-                            # For other secondary title fields, just use as is
-                            series_title = value
-                            logger.debug(f"Series/Book title set to: {value}")
-                elif tag == "VL":  # Volume
-                    volume = value
-                    logger.debug(f"Volume set to: {volume}")
-                elif tag == "IS":  # Issue
-                    issue = value
-                    logger.debug(f"Issue set to: {issue}")
-                elif tag == "SP":  # Start Page
-                    start_page = value
-                    logger.debug(f"Start page set to: {start_page}")
-                elif tag == "EP":  # End Page
-                    end_page = value
-                    logger.debug(f"End page set to: {end_page}")
-                elif tag == "LA":  # Language
-                    language = value
-                    logger.debug(f"Language set to: {language}")
-                elif tag == "DO":  # DOI
-                    doi = value
-                    logger.debug(f"DOI set to: {doi}")
-                elif tag == "UR":  # URL
-                    urls.append(value)
-                    logger.debug(f"Added URL: {value}")
-                elif tag == "N2" or tag == "AB":  # Abstract
-                    abstract = value
-                    logger.debug(f"Abstract set to: {abstract}")
+            state = self._parse_ris(ris_data)
+            
+            record_type = state.get("record_type")
+            title = state.get("title")
+            authors = state["authors"]
+            editors = state["editors"]
+            translators = state["translators"]
+            year = state.get("year")
+            publisher = state.get("publisher")
+            place = state.get("place")
+            isbn = state.get("isbn")
+            issn = state.get("issn")
+            journal = state.get("journal")
+            volume = state.get("volume")
+            issue = state.get("issue")
+            start_page = state.get("start_page")
+            end_page = state.get("end_page")
+            language = state.get("language")
+            doi = state.get("doi")
+            series_title = state.get("series_title")
+            urls = state["urls"]
+            abstract = state.get("abstract")
             
             # Create page range without "Pages " prefix
             pages = None
             if start_page and end_page:
                 pages = f"{start_page}-{end_page}"
-                logger.debug(f"Pages set to: {pages}")
+                logger.debug("Pages set to: %s", pages)
             elif start_page:
                 pages = start_page
-                logger.debug(f"Pages set to: {start_page}")
+                logger.debug("Pages set to: %s", start_page)
             
             # Determine the format from record_type
             format_str = None
@@ -1493,67 +2102,119 @@ class IxTheoSearchHandler:
             elif record_type == "RPRT":
                 format_str = "Report"
             
-            # Create a new record with data from both RIS and detailed record
-            enhanced_record = BiblioRecord(
-                id=record.id,
-                title=title or (detailed_record.title if detailed_record else record.title) or "Unknown Title",
-                authors=authors or (detailed_record.authors if detailed_record else record.authors) or [],
-                editors=editors or (detailed_record.editors if detailed_record else []),
-                translators=translators or [],
-                year=year or (detailed_record.year if detailed_record else record.year),
-                publisher_name=publisher or (detailed_record.publisher_name if detailed_record else None),
-                place_of_publication=place or (detailed_record.place_of_publication if detailed_record else None),
-                isbn=isbn or (detailed_record.isbn if detailed_record else None),
-                issn=issn or (detailed_record.issn if detailed_record else None),
-                urls=urls or [],
-                
+            # Fields the RIS export describes outright; these replace whatever
+            # the detail page had
+            ris_fields = (
+                ("translators", translators or []),
+                ("urls", urls or []),
                 # For journal articles
-                journal_title=journal if record_type == "JOUR" else None,
-                volume=volume,
-                issue=issue,
-                pages=pages,
-                
+                ("journal_title", journal if record_type == "JOUR" else None),
+                ("volume", volume),
+                ("issue", issue),
+                ("pages", pages),
                 # For book chapters, store book title in series field
-                series=series_title,
-                
-                raw_data=ris_data,
-                
+                ("series", series_title),
+                ("raw_data", ris_data),
                 # Create proper extent field without "Pages " prefix
-                extent=pages if pages else None,
-                
-                subjects=detailed_record.subjects if detailed_record and detailed_record.subjects else [],
-                abstract=abstract or (detailed_record.abstract if detailed_record and detailed_record.abstract else None),
-                language=language,
-                doi=doi,
-                
+                ("extent", pages if pages else None),
+                ("language", language),
+                ("doi", doi),
                 # Store record type to inform downstream formatting
-                format=format_str if format_str else (record_type if record_type else None)
+                ("format", format_str if format_str else (record_type if record_type else None)),
             )
             
-            logger.debug(f"Enhanced record created: {enhanced_record}")
-            
-            # Log complete record details
-            logger.debug(f"Enhanced record details for {record.id}:")
-            logger.debug(f"  Title: {enhanced_record.title}")
-            logger.debug(f"  Authors: {enhanced_record.authors}")
-            logger.debug(f"  Editors: {enhanced_record.editors}")
-            logger.debug(f"  Translators: {enhanced_record.translators}")
-            logger.debug(f"  Year: {enhanced_record.year}")
-            logger.debug(f"  Format/Type: {enhanced_record.format}")
-            logger.debug(f"  Publisher: {enhanced_record.publisher_name}")
-            logger.debug(f"  Place: {enhanced_record.place_of_publication}")
-            logger.debug(f"  ISBN: {enhanced_record.isbn}")
-            logger.debug(f"  ISSN: {enhanced_record.issn}")
-            logger.debug(f"  Journal: {enhanced_record.journal_title}")
-            logger.debug(f"  Series/Book title: {enhanced_record.series}")
-            logger.debug(f"  URLs: {enhanced_record.urls}")
-            logger.debug(f"  Volume: {enhanced_record.volume}")
-            logger.debug(f"  Issue: {enhanced_record.issue}")
-            logger.debug(f"  Pages: {enhanced_record.pages}")
-            logger.debug(f"  DOI: {enhanced_record.doi}")
+            if detailed_record:
+                # The detail record is our own copy, so fill it in place and only
+                # override the fields the RIS export actually provides
+                enhanced_record = detailed_record
+                for attr, value in (
+                    ("title", title),
+                    ("authors", authors),
+                    ("editors", editors),
+                    ("year", year),
+                    ("publisher_name", publisher),
+                    ("place_of_publication", place),
+                    ("isbn", isbn),
+                    ("issn", issn),
+                    ("abstract", abstract),
+                ):
+                    if value:
+                        setattr(enhanced_record, attr, value)
+                enhanced_record.title = enhanced_record.title or "Unknown Title"
+                enhanced_record.authors = enhanced_record.authors or []
+                enhanced_record.subjects = enhanced_record.subjects or []
+                enhanced_record.abstract = enhanced_record.abstract or None
+            else:
+                enhanced_record = BiblioRecord(
+                    id=record.id,
+                    title=title or record.title or "Unknown Title",
+                    authors=authors or record.authors or [],
+                    editors=editors,
+                    year=year or record.year,
+                    publisher_name=publisher,
+                    place_of_publication=place,
+                    isbn=isbn,
+                    issn=issn,
+                    abstract=abstract,
+                )
+            for attr, value in ris_fields:
+                setattr(enhanced_record, attr, value)
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Enhanced record created: %s", enhanced_record)
+                
+                # Log complete record details
+                logger.debug("Enhanced record details for %s:", record.id)
+                logger.debug("  Title: %s", enhanced_record.title)
+                logger.debug("  Authors: %s", enhanced_record.authors)
+                logger.debug("  Editors: %s", enhanced_record.editors)
+                logger.debug("  Translators: %s", enhanced_record.translators)
+                logger.debug("  Year: %s", enhanced_record.year)
+                logger.debug("  Format/Type: %s", enhanced_record.format)
+                logger.debug("  Publisher: %s", enhanced_record.publisher_name)
+                logger.debug("  Place: %s", enhanced_record.place_of_publication)
+                logger.debug("  ISBN: %s", enhanced_record.isbn)
+                logger.debug("  ISSN: %s", enhanced_record.issn)
+                logger.debug("  Journal: %s", enhanced_record.journal_title)
+                logger.debug("  Series/Book title: %s", enhanced_record.series)
+                logger.debug("  URLs: %s", enhanced_record.urls)
+                logger.debug("  Volume: %s", enhanced_record.volume)
+                logger.debug("  Issue: %s", enhanced_record.issue)
+                logger.debug("  Pages: %s", enhanced_record.pages)
+                logger.debug("  DOI: %s", enhanced_record.doi)
             
             return enhanced_record
 
+    def _parse_ris(self, ris_data: str) -> Dict[str, Any]:
+        """
+        Parse a RIS export once into a dict of record fields
+        
+        Args:
+            ris_data: RIS formatted data
+            
+        Returns:
+            dict with record_type, title, authors, editors, translators, year,
+            publisher, place, isbn, issn, journal, volume, issue, start_page,
+            end_page, language, doi, series_title, urls and abstract (scalar
+            keys are absent when the export lacks them)
+        """
+        state: Dict[str, Any] = {
+            "authors": [], "editors": [], "translators": [], "urls": []
+        }
+        debug = logger.isEnabledFor(logging.DEBUG)
+        
+        for tag, value in _iter_ris_fields(ris_data):
+            # Ensure the value is properly encoded
+            value = self._ensure_utf8(value)
+            if debug:
+                logger.debug("Processing RIS tag: %s with value: %s", tag, value)
+            
+            handler = _RIS_RECORD_HANDLERS.get(tag)
+            if handler:
+                handler(state, tag, value)
+        
+        return state
+    
     def _ensure_utf8(self, text):
         """
         Ensure that text is properly encoded as UTF-8, specifically handling umlauts
@@ -1564,25 +2225,12 @@ class IxTheoSearchHandler:
         Returns:
             UTF-8 encoded text with proper handling of umlauts
         """
-        if not text:
+        # Every escape handled below starts with a backslash-u; most RIS values
+        # contain none, so skip the scan entirely for them
+        if not text or '\\u' not in text:
             return text
-            
-        # Handle specific umlaut escape sequences
-        escape_chars = {
-            r'\u00fc': 'ü',
-            r'\u00e4': 'ä',
-            r'\u00f6': 'ö',
-            r'\u00dc': 'Ü',
-            r'\u00c4': 'Ä',
-            r'\u00d6': 'Ö',
-            r'\u00df': 'ß',
-            # Add additional special characters as needed
-        }
-        
-        for escape_seq, char in escape_chars.items():
-            text = text.replace(escape_seq, char)
         
-        # Handle unicode escape sequences like \uXXXX
+        # Handle unicode escape sequences like \uXXXX (including umlauts)
         # This regex finds patterns like \uXXXX where X is a hexadecimal digit
         def replace_unicode_escapes(match):
             try:
@@ -1591,7 +2239,7 @@ class IxTheoSearchHandler:
             except (ValueError, TypeError):
                 return match.group(0)  # Return the original match if conversion fails
         
-        text = re.sub(r'\\u([0-9a-fA-F]{4})', replace_unicode_escapes, text)
+        text = _UNICODE_ESCAPE_RE.sub(replace_unicode_escapes, text)
         
         return text
 
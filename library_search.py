@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 # library_search.py
+# PYTHON_ARGCOMPLETE_OK
 """
 Library Search - Command-line tool for searching library SRU and OAI-PMH endpoints
 
@@ -18,23 +19,43 @@ import os
 import sqlite3
 import urllib.parse
 from datetime import datetime
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple
 import unicodedata
+import functools
+import itertools
+import operator
+import hashlib
 import shutil
 import tempfile
 
-# Import library modules
-from sru_library import SRUClient, BiblioRecord, SRU_ENDPOINTS, format_ris_creator
-from oai_pmh_library import OAIClient, OAI_ENDPOINTS
-from ixtheo_library import IxTheoSearchHandler, IXTHEO_ENDPOINTS
+# Import library modules. The protocol clients (sru_library, oai_pmh_library,
+# ixtheo_library) pull in requests and are imported where they are used, so
+# --help, --list, --info and Zotero searches don't pay for them.
+from sru_shared import BiblioRecord
+from endpoints_manifest import SRU_ENDPOINTS, OAI_ENDPOINTS
+
+# Optional dependencies. pyzotero is slow to import and only needed for the
+# Zotero API paths, so it is loaded on first use by _have_pyzotero().
+Zotero = None
+
+
+@functools.lru_cache(maxsize=None)
+def _have_pyzotero():
+    """Import pyzotero on first use; returns whether the Zotero API is available."""
+    global Zotero
+    try:
+        from pyzotero.zotero import Zotero
+    except ImportError:
+        return False
+    return True
 
-# Try to import optional dependencies
 try:
-    import pyzotero
-    from pyzotero.zotero import Zotero
-    ZOTERO_API_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    ZOTERO_API_AVAILABLE = False
+    ORJSON_AVAILABLE = False
 
 # Configure logging
 # logging.basicConfig(
@@ -48,6 +69,101 @@ logging.basicConfig(
 )
 logger = logging.getLogger("library_search")
 
+# Loggers raised to DEBUG by --verbose. The root logger stays at INFO so that
+# requests/urllib3 don't build debug records for every connection.
+_VERBOSE_LOGGERS = ("library_search", "sru_library", "sru_shared", "oai_pmh_library", "ixtheo_library")
+
+# Default location of the on-disk response cache (--cache / --no-cache)
+DEFAULT_CACHE_PATH = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'crisplib', 'responses.sqlite'
+)
+DEFAULT_CACHE_TTL = 24 * 60 * 60
+
+
+class _ResponseCache:
+    """
+    SQLite-backed cache of search responses shared across CLI runs.
+    
+    Values are JSON documents keyed by a hash of the request; entries older
+    than ttl seconds are treated as missing and pruned when the cache is
+    opened. Cache failures are logged and otherwise ignored, so a broken
+    cache never breaks a search. Use as a context manager or call close().
+    """
+    
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl: int = DEFAULT_CACHE_TTL):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.ttl = ttl
+        self.conn = sqlite3.connect(path)
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache (k TEXT PRIMARY KEY, ts INTEGER, body BLOB)"
+            )
+            self.conn.execute("DELETE FROM cache WHERE ts < ?", (int(time.time()) - ttl,))
+    
+    @staticmethod
+    def key(*parts) -> str:
+        """Stable cache key for a request described by JSON-serializable parts."""
+        encoded = json.dumps(parts, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+    
+    def get(self, key: str) -> Any:
+        """Return the cached value for key, or None if missing or expired."""
+        try:
+            row = self.conn.execute("SELECT ts, body FROM cache WHERE k = ?", (key,)).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"Response cache read failed: {e}")
+            return None
+        if row is None or time.time() - row[0] > self.ttl:
+            return None
+        return _loads(row[1])
+    
+    def put(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value under key."""
+        try:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO cache (k, ts, body) VALUES (?, ?, ?)",
+                    (key, int(time.time()), _dumps(value))
+                )
+        except sqlite3.Error as e:
+            logger.debug(f"Response cache write failed: {e}")
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _open_response_cache(args) -> Optional[_ResponseCache]:
+    """Open the response cache if enabled with --cache; the caller closes it."""
+    if not getattr(args, 'cache', False):
+        return None
+    try:
+        return _ResponseCache(ttl=args.cache_ttl)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"Response cache unavailable, continuing without it: {e}")
+        return None
+
+
+def _record_to_cache(record: BiblioRecord) -> Dict[str, Any]:
+    """Serialize a record for the response cache (raw data only if textual)."""
+    data = record.to_dict()
+    raw_data = _raw_text(record.raw_data)
+    data['raw_data'] = raw_data if isinstance(raw_data, str) else None
+    return data
+
+
+def _record_from_cache(data: Dict[str, Any]) -> BiblioRecord:
+    return BiblioRecord(**data)
+
 
 def list_endpoints(protocol=None):
     """Display information about available endpoints."""
@@ -56,133 +172,183 @@ def list_endpoints(protocol=None):
         logger.info("Valid protocols are: sru, oai, zotero, ixtheo")
         return
     
+    # Build the whole listing and write it at once
+    lines = []
+    
     if not protocol or protocol == 'sru':
-        print("\\nAvailable SRU Endpoints:\\n")
-        print(f"{'ID':<10} {'Name':<40} {'Version':<10}")
-        print("-" * 60)
+        lines.append("\\nAvailable SRU Endpoints:\\n")
+        lines.append(f"{'ID':<10} {'Name':<40} {'Version':<10}")
+        lines.append("-" * 60)
         
         for id, info in SRU_ENDPOINTS.items():
-            print(f"{id:<10} {info['name']:<40} {info.get('version', '1.1'):<10}")
+            lines.append(f"{id:<10} {info['name']:<40} {info.get('version', '1.1'):<10}")
     
     if not protocol or protocol == 'oai':
-        print("\\nAvailable OAI-PMH Endpoints:\\n")
-        print(f"{'ID':<12} {'Name':<40} {'Metadata Format':<16}")
-        print("-" * 70)
+        lines.append("\\nAvailable OAI-PMH Endpoints:\\n")
+        lines.append(f"{'ID':<12} {'Name':<40} {'Metadata Format':<16}")
+        lines.append("-" * 70)
         
         for id, info in OAI_ENDPOINTS.items():
-            print(f"{id:<12} {info['name']:<40} {info.get('default_metadata_prefix', 'oai_dc'):<16}")
+            lines.append(f"{id:<12} {info['name']:<40} {info.get('default_metadata_prefix', 'oai_dc'):<16}")
     
     if not protocol or protocol == 'zotero':
-        print("\\nZotero Search:")
-        print("-" * 60)
-        print("To search a local Zotero database:")
-        print("  --protocol zotero --zotero-path /path/to/zotero/zotero.sqlite")
-        print("\\nTo search a Zotero library via API (requires API key):")
-        print("  --protocol zotero --zotero-api-key YOUR_API_KEY --zotero-library-id LIBRARY_ID --zotero-library-type [user|group]")
+        lines.append("\\nZotero Search:")
+        lines.append("-" * 60)
+        lines.append("To search a local Zotero database:")
+        lines.append("  --protocol zotero --zotero-path /path/to/zotero/zotero.sqlite")
+        lines.append("\\nTo search a Zotero library via API (requires API key):")
+        lines.append("  --protocol zotero --zotero-api-key YOUR_API_KEY --zotero-library-id LIBRARY_ID --zotero-library-type [user|group]")
     
     if not protocol or protocol == 'ixtheo':
-        print("\\nIxTheo (Index Theologicus) Endpoint:")
-        print("-" * 60)
-        print(f"{'ID':<10} {'Name':<40} {'Description':<30}")
-        print("-" * 80)
+        from ixtheo_library import IXTHEO_ENDPOINTS
+        lines.append("\\nIxTheo (Index Theologicus) Endpoint:")
+        lines.append("-" * 60)
+        lines.append(f"{'ID':<10} {'Name':<40} {'Description':<30}")
+        lines.append("-" * 80)
         
         for id, info in IXTHEO_ENDPOINTS.items():
-            print(f"{id:<10} {info['name']:<40} {info['description']:<30}")
+            lines.append(f"{id:<10} {info['name']:<40} {info.get('description', ''):<30}")
         
-        print("\\nAvailable formats for filtering:")
+        lines.append("\\nAvailable formats for filtering:")
         for id, info in IXTHEO_ENDPOINTS.items():
             if info.get('formats'):
-                print(f"  {', '.join(info['formats'])}")
+                lines.append(f"  {', '.join(info['formats'])}")
                 break
         
-        print("\\nAvailable languages for filtering:")
+        lines.append("\\nAvailable languages for filtering:")
         for id, info in IXTHEO_ENDPOINTS.items():
             if info.get('languages'):
-                print(f"  {', '.join(info['languages'])}")
+                lines.append(f"  {', '.join(info['languages'])}")
                 break
     
-    print("\\nUse --info <endpoint_id> for more details about a specific endpoint.")
+    lines.append("\\nUse --info <endpoint_id> for more details about a specific endpoint.")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def show_endpoint_info(endpoint_id):
-    """Show detailed information about a specific endpoint."""
-    # Check SRU endpoints
-    if endpoint_id in SRU_ENDPOINTS:
-        info = SRU_ENDPOINTS[endpoint_id]
-        print(f"\\n{info['name']} ({endpoint_id}) - SRU Protocol")
-        print("=" * 50)
-        print(f"URL: {info['url']}")
-        print(f"Default Schema: {info.get('default_schema', 'None')}")
-        print(f"SRU Version: {info.get('version', '1.1')}")
-        print(f"Description: {info.get('description', 'No description available')}")
-        
-        print("\\nExample Queries:")
-        for query_type, example in info.get('examples', {}).items():
-            if isinstance(example, dict):
-                # For advanced queries stored as dictionaries
-                example_str = " AND ".join([f"{k}={v}" for k, v in example.items()])
-            else:
-                example_str = example
-            print(f"  {query_type}: {example_str}")
-        
-        return
+def _print_sru_info(endpoint_id, info):
+    """Print the details of an SRU endpoint."""
+    print(f"\\n{info['name']} ({endpoint_id}) - SRU Protocol")
+    print("=" * 50)
+    print(f"URL: {info['url']}")
+    print(f"Default Schema: {info.get('default_schema', 'None')}")
+    print(f"SRU Version: {info.get('version', '1.1')}")
+    print(f"Description: {info.get('description', 'No description available')}")
+    
+    print("\\nExample Queries:")
+    for query_type, example in info.get('examples', {}).items():
+        if isinstance(example, dict):
+            # For advanced queries stored as dictionaries
+            example_str = " AND ".join([f"{k}={v}" for k, v in example.items()])
+        else:
+            example_str = example
+        print(f"  {query_type}: {example_str}")
+
+
+def _print_oai_info(endpoint_id, info):
+    """Print the details of an OAI-PMH endpoint."""
+    print(f"\\n{info['name']} ({endpoint_id}) - OAI-PMH Protocol")
+    print("=" * 50)
+    print(f"URL: {info['url']}")
+    print(f"Default Metadata Format: {info.get('default_metadata_prefix', 'oai_dc')}")
+    print(f"Description: {info.get('description', 'No description available')}")
     
-    # Check OAI-PMH endpoints
-    if endpoint_id in OAI_ENDPOINTS:
-        info = OAI_ENDPOINTS[endpoint_id]
-        print(f"\\n{info['name']} ({endpoint_id}) - OAI-PMH Protocol")
-        print("=" * 50)
-        print(f"URL: {info['url']}")
-        print(f"Default Metadata Format: {info.get('default_metadata_prefix', 'oai_dc')}")
-        print(f"Description: {info.get('description', 'No description available')}")
-        
-        if info.get('sets'):
-            print("\\nAvailable Sets:")
-            for set_id, set_desc in info['sets'].items():
-                print(f"  {set_id}: {set_desc}")
-        
-        print("\\nUsage Example:")
-        print(f"  --endpoint {endpoint_id} --title 'Python' --protocol oai")
-        print(f"  --endpoint {endpoint_id} --set {list(info.get('sets', {}).keys())[0] if info.get('sets') else 'NONE'} --protocol oai")
-        
-        return
+    if info.get('sets'):
+        print("\\nAvailable Sets:")
+        for set_id, set_desc in info['sets'].items():
+            print(f"  {set_id}: {set_desc}")
     
-    # Check IxTheo endpoints
-    if endpoint_id in IXTHEO_ENDPOINTS:
-        info = IXTHEO_ENDPOINTS[endpoint_id]
-        print(f"\\n{info['name']} ({endpoint_id}) - Specialized Theological Database")
-        print("=" * 60)
-        print(f"URL: {info['url']}")
-        print(f"Description: {info['description']}")
-        
-        if info.get('formats'):
-            print("\\nAvailable Formats for Filtering:")
-            print(f"  {', '.join(info['formats'])}")
-        
-        if info.get('languages'):
-            print("\\nAvailable Languages for Filtering:")
-            print(f"  {', '.join(info['languages'])}")
-        
-        if info.get('export_formats'):
-            print("\\nSupported Export Formats:")
-            print(f"  {', '.join(info['export_formats'])}")
-        
-        print("\\nUsage Example:")
-        print(f"  --endpoint {endpoint_id} --title 'Bible' --protocol ixtheo --format-filter 'Article'")
-        print(f"  --endpoint {endpoint_id} --author 'Smith' --protocol ixtheo --language-filter 'English' --get-export")
-        
+    print("\\nUsage Example:")
+    print(f"  --endpoint {endpoint_id} --title 'Python' --protocol oai")
+    print(f"  --endpoint {endpoint_id} --set {list(info.get('sets', {}).keys())[0] if info.get('sets') else 'NONE'} --protocol oai")
+
+
+def _print_ixtheo_info(endpoint_id, info):
+    """Print the details of an IxTheo endpoint."""
+    print(f"\\n{info['name']} ({endpoint_id}) - Specialized Theological Database")
+    print("=" * 60)
+    print(f"URL: {info.get('url', info.get('base_url'))}")
+    print(f"Description: {info.get('description', 'No description available')}")
+    
+    if info.get('formats'):
+        print("\\nAvailable Formats for Filtering:")
+        print(f"  {', '.join(info['formats'])}")
+    
+    if info.get('languages'):
+        print("\\nAvailable Languages for Filtering:")
+        print(f"  {', '.join(info['languages'])}")
+    
+    if info.get('export_formats'):
+        print("\\nSupported Export Formats:")
+        print(f"  {', '.join(info['export_formats'])}")
+    
+    print("\\nUsage Example:")
+    print(f"  --endpoint {endpoint_id} --title 'Bible' --protocol ixtheo --format-filter 'Article'")
+    print(f"  --endpoint {endpoint_id} --author 'Smith' --protocol ixtheo --language-filter 'English' --get-export")
+
+
+def _print_zotero_info():
+    """Print how to search Zotero."""
+    print("\\nZotero - Local database or API")
+    print("=" * 50)
+    print("Zotero is a reference management software to manage bibliographic data.")
+    print("\\nTo search a local Zotero database:")
+    print("  --protocol zotero --zotero-path /path/to/zotero/zotero.sqlite --title 'Python'")
+    print("\\nTo search a Zotero library via API (requires API key):")
+    print("  --protocol zotero --zotero-api-key YOUR_API_KEY --zotero-library-id LIBRARY_ID --zotero-library-type [user|group] --title 'Python'")
+    print("\\nFor more information on Zotero API, visit: https://www.zotero.org/support/dev/web_api/v3/start")
+
+
+_ENDPOINT_INFO_PRINTERS = {
+    'sru': _print_sru_info,
+    'oai': _print_oai_info,
+    'ixtheo': _print_ixtheo_info,
+}
+
+
+def _find_endpoint(endpoint_id):
+    """
+    (protocol, info) of an endpoint ID, or None if unknown. IDs may be shared
+    between protocols (dnb speaks both SRU and OAI-PMH); SRU wins over
+    OAI-PMH, which wins over IxTheo. The IxTheo table lives in
+    ixtheo_library, which imports requests, so it is only loaded on a miss.
+    """
+    for protocol in ('sru', 'oai', 'ixtheo'):
+        info = _protocol_endpoints(protocol).get(endpoint_id)
+        if info is not None:
+            return protocol, info
+    return None
+
+
+def _protocol_endpoints(protocol):
+    """Endpoint table for a --protocol (empty for zotero)."""
+    if protocol == 'ixtheo':
+        from ixtheo_library import IXTHEO_ENDPOINTS
+        return IXTHEO_ENDPOINTS
+    return {'sru': SRU_ENDPOINTS, 'oai': OAI_ENDPOINTS}.get(protocol, {})
+
+
+def _resolve_endpoint(args, protocol):
+    """
+    Info for args.endpoint under protocol, or None if unknown. parse_args
+    resolves it once into args.endpoint_info; args built elsewhere fall
+    back to a table lookup.
+    """
+    if getattr(args, 'protocol', None) == protocol and hasattr(args, 'endpoint_info'):
+        return args.endpoint_info
+    return _protocol_endpoints(protocol).get(args.endpoint)
+
+
+def show_endpoint_info(endpoint_id):
+    """Show detailed information about a specific endpoint."""
+    entry = _find_endpoint(endpoint_id)
+    if entry is not None:
+        protocol, info = entry
+        _ENDPOINT_INFO_PRINTERS[protocol](endpoint_id, info)
         return
     
     # If it's Zotero, show Zotero info
     if endpoint_id.lower() == 'zotero':
-        print("\\nZotero - Local database or API")
-        print("=" * 50)
-        print("Zotero is a reference management software to manage bibliographic data.")
-        print("\\nTo search a local Zotero database:")
-        print("  --protocol zotero --zotero-path /path/to/zotero/zotero.sqlite --title 'Python'")
-        print("\\nTo search a Zotero library via API (requires API key):")
-        print("  --protocol zotero --zotero-api-key YOUR_API_KEY --zotero-library-id LIBRARY_ID --zotero-library-type [user|group] --title 'Python'")
-        print("\\nFor more information on Zotero API, visit: https://www.zotero.org/support/dev/web_api/v3/start")
+        _print_zotero_info()
         return
     
     # Not found in either
@@ -190,6 +356,72 @@ def show_endpoint_info(endpoint_id):
     print("Use --list to see available endpoints")
 
 
+# Query fields that map to a single index in build_sru_query, in priority order
+_SRU_QUERY_FIELDS = ('isbn', 'issn', 'title', 'author', 'year')
+
+
+def _default_sru_templates(endpoint_id):
+    """
+    Fallback (prefix, suffix) query templates for an endpoint without usable
+    examples; a query is prefix + value + suffix.
+    """
+    if endpoint_id == 'dnb':
+        templates = {'isbn': ('ISBN=', ''), 'issn': ('ISS=', ''), 'title': ('TIT=', ''),
+                     'author': ('PER=', ''), 'year': ('JHR=', '')}
+    elif endpoint_id == 'bnf':
+        templates = {field: (f'bib.{index} any "', '"') for field, index in
+                     (('isbn', 'isbn'), ('issn', 'issn'), ('title', 'title'),
+                      ('author', 'author'), ('year', 'date'))}
+    else:
+        templates = {'isbn': ('isbn=', ''), 'issn': ('issn=', ''), 'title': ('title="', '"'),
+                     'author': ('author="', '"'), 'year': ('date=', '')}
+        if endpoint_id == 'zdb':
+            templates['issn'] = ('ISS=', '')
+    return templates
+
+
+def _template_from_example(field, example):
+    """
+    Derive a (prefix, suffix) query template from an endpoint's example query,
+    or None if the example doesn't show a usable pattern.
+    """
+    if not isinstance(example, str):
+        return None
+    eq_index = example.find('=')
+    if eq_index >= 0:
+        prefix = example[:eq_index]
+        # Check if the value is quoted in the example
+        if example[eq_index + 1:eq_index + 2] in ('"', "'"):
+            return (f'{prefix}="', '"')
+        return (f'{prefix}=', '')
+    if field in ('title', 'author'):
+        # Handle "all"/"any" syntax (BNF)
+        for operator in (' all ', ' any '):
+            op_index = example.find(operator)
+            if op_index >= 0:
+                return (f'{example[:op_index]}{operator}"', '"')
+    return None
+
+
+def _build_sru_templates():
+    """Precompute the query templates of every SRU endpoint from its examples."""
+    all_templates = {}
+    for endpoint_id, endpoint_info in SRU_ENDPOINTS.items():
+        templates = _default_sru_templates(endpoint_id)
+        examples = endpoint_info.get('examples', {})
+        # Years have no example-driven format
+        for field in ('isbn', 'issn', 'title', 'author'):
+            if field in examples:
+                template = _template_from_example(field, examples[field])
+                if template:
+                    templates[field] = template
+        all_templates[endpoint_id] = templates
+    return all_templates
+
+
+_SRU_TEMPLATES = _build_sru_templates()
+
+
 def build_sru_query(args, endpoint_id):
     """
     Build an appropriate SRU query string for the given endpoint and search criteria.
@@ -201,126 +433,19 @@ def build_sru_query(args, endpoint_id):
     Returns:
         Query string formatted for the specified endpoint
     """
-    # Get endpoint info
-    endpoint_info = SRU_ENDPOINTS.get(endpoint_id, {})
-    examples = endpoint_info.get('examples', {})
-    
     # For BNF endpoint, ensure we're using the correct schema
     if endpoint_id == 'bnf' and not args.schema:
         args.schema = 'dublincore'  # Override default schema for BNF
     
-    # Use the examples as templates for how to format queries for this endpoint
-    if args.isbn:
-        if 'isbn' in examples:
-            # Extract the format from the example
-            example = examples['isbn']
-            if '=' in example:
-                parts = example.split('=')
-                prefix = parts[0]
-                # Check if the value is quoted in the example
-                if len(parts) > 1 and (parts[1].startswith('"') or parts[1].startswith("'")):
-                    return f"{prefix}=\"{args.isbn}\""
-                else:
-                    return f"{prefix}={args.isbn}"
-        
-        # Default formats if no example is available
-        if endpoint_id == 'dnb':
-            return f"ISBN={args.isbn}"
-        elif endpoint_id == 'bnf':
-            return f"bib.isbn any \"{args.isbn}\""
-        else:
-            return f"isbn={args.isbn}"
+    # Simple criteria use the endpoint's precomputed query templates
+    templates = _SRU_TEMPLATES.get(endpoint_id) or _default_sru_templates(endpoint_id)
+    for field in _SRU_QUERY_FIELDS:
+        value = getattr(args, field)
+        if value:
+            prefix, suffix = templates[field]
+            return f"{prefix}{value}{suffix}"
     
-    if args.issn:
-        if 'issn' in examples:
-            # Extract the format from the example
-            example = examples['issn']
-            if '=' in example:
-                parts = example.split('=')
-                prefix = parts[0]
-                # Check if the value is quoted in the example
-                if len(parts) > 1 and (parts[1].startswith('"') or parts[1].startswith("'")):
-                    return f"{prefix}=\"{args.issn}\""
-                else:
-                    return f"{prefix}={args.issn}"
-        
-        # Default formats if no example is available
-        if endpoint_id == 'dnb' or endpoint_id == 'zdb':
-            return f"ISS={args.issn}"
-        elif endpoint_id == 'bnf':
-            return f"bib.issn any \"{args.issn}\""
-        else:
-            return f"issn={args.issn}"
-    
-    if args.title:
-        if 'title' in examples:
-            # Extract the format from the example
-            example = examples['title']
-            if '=' in example:
-                parts = example.split('=')
-                prefix = parts[0]
-                # Check if the value is quoted in the example
-                if len(parts) > 1 and (parts[1].startswith('"') or parts[1].startswith("'")):
-                    return f"{prefix}=\"{args.title}\""
-                else:
-                    return f"{prefix}={args.title}"
-            else:
-                # Handle "all" syntax (BNF)
-                if ' all ' in example:
-                    parts = example.split(' all ')
-                    prefix = parts[0]
-                    return f"{prefix} all \"{args.title}\""
-                elif ' any ' in example:
-                    parts = example.split(' any ')
-                    prefix = parts[0]
-                    return f"{prefix} any \"{args.title}\""
-        
-        # Default formats if no example is available
-        if endpoint_id == 'dnb':
-            return f"TIT={args.title}"
-        elif endpoint_id == 'bnf':
-            return f"bib.title any \"{args.title}\""
-        else:
-            return f"title=\"{args.title}\""
-    
-    if args.author:
-        if 'author' in examples:
-            # Extract the format from the example
-            example = examples['author']
-            if '=' in example:
-                parts = example.split('=')
-                prefix = parts[0]
-                # Check if the value is quoted in the example
-                if len(parts) > 1 and (parts[1].startswith('"') or parts[1].startswith("'")):
-                    return f"{prefix}=\"{args.author}\""
-                else:
-                    return f"{prefix}={args.author}"
-            else:
-                # Handle "all" syntax (BNF)
-                if ' all ' in example:
-                    parts = example.split(' all ')
-                    prefix = parts[0]
-                    return f"{prefix} all \"{args.author}\""
-                elif ' any ' in example:
-                    parts = example.split(' any ')
-                    prefix = parts[0]
-                    return f"{prefix} any \"{args.author}\""
-        
-        # Default formats if no example is available
-        if endpoint_id == 'dnb':
-            return f"PER={args.author}"
-        elif endpoint_id == 'bnf':
-            return f"bib.author any \"{args.author}\""
-        else:
-            return f"author=\"{args.author}\""
-    
-    if args.year:
-        if endpoint_id == 'dnb':
-            return f"JHR={args.year}"
-        elif endpoint_id == 'bnf':
-            return f"bib.date any \"{args.year}\""
-        else:
-            return f"date={args.year}"
+    examples = SRU_ENDPOINTS.get(endpoint_id, {}).get('examples', {})
     
     # Advanced query logic remains unchanged
     if args.advanced:
@@ -373,48 +498,64 @@ def build_sru_query(args, endpoint_id):
     return ""
 
 
+# Special characters and their LaTeX equivalents, applied in one pass
+_BIBTEX_TRANS = str.maketrans({
+    '&': r'\&',
+    '%': r'\%',
+    '$': r'\$',
+    '#': r'\#',
+    '_': r'\_',
+    '{': r'\{',
+    '}': r'\}',
+    '~': r'\textasciitilde{}',
+    '^': r'\textasciicircum{}',
+    '\\': r'\textbackslash{}',
+    '<': r'\textless{}',
+    '>': r'\textgreater{}'
+})
+_BIBTEX_SPECIALS_RE = re.compile('[' + re.escape(''.join(map(chr, _BIBTEX_TRANS))) + ']')
+
+
 def bibtex_escape(text):
     """Escape special characters for BibTeX."""
     if not text:
         return ""
     
-    # Replace special characters with LaTeX equivalents
-    replacements = {
-        '&': r'\&',
-        '%': r'\%',
-        '$': r'\$',
-        '#': r'\#',
-        '_': r'\_',
-        '{': r'\{',
-        '}': r'\}',
-        '~': r'\textasciitilde{}',
-        '^': r'\textasciicircum{}',
-        '\\': r'\textbackslash{}',
-        '<': r'\textless{}',
-        '>': r'\textgreater{}'
-    }
-    
-    for char, replacement in replacements.items():
-        text = text.replace(char, replacement)
+    # Most text has nothing to escape; the regex scan is far cheaper than a
+    # translate() whose table maps to multi-character strings
+    if not _BIBTEX_SPECIALS_RE.search(text):
+        return text
     
-    # Handle accented characters by maintaining them (Unicode in BibTeX)
-    return text
+    # Accented characters are kept as they are (Unicode in BibTeX)
+    return text.translate(_BIBTEX_TRANS)
+
+
+_NON_ALNUM_RE = re.compile(r'[^\w\s]')
+# Same class spelled out for ASCII text, sparing the Unicode \w lookup
+_NON_ALNUM_ASCII_RE = re.compile(r'[^A-Za-z0-9_\s]')
+_WS_RE = re.compile(r'\s+')
 
 
+@functools.lru_cache(maxsize=4096)
 def clean_key(text):
-    """Generate a clean citation key from text."""
+    """Generate a clean citation key from text (cached; the same authors and
+    titles recur across a result set)."""
     if not text:
         return "unknown"
     
-    # Normalize and remove accents
-    text = unicodedata.normalize('NFKD', text)
-    text = ''.join([c for c in text if not unicodedata.combining(c)])
+    # Normalize and remove accents (ASCII text has none)
+    is_ascii = text.isascii()
+    if not is_ascii:
+        text = unicodedata.normalize('NFKD', text)
+        text = ''.join(c for c in text if not unicodedata.combining(c))
     
-    # Remove non-alphanumeric characters and convert to lowercase
-    text = re.sub(r'[^\w\s]', '', text).lower()
+    # Remove non-alphanumeric characters and convert to lowercase. Text that
+    # was ASCII to begin with can use the cheaper ASCII-only class.
+    non_alnum = _NON_ALNUM_ASCII_RE if is_ascii else _NON_ALNUM_RE
+    text = non_alnum.sub('', text).lower()
     
     # Replace spaces with underscores and truncate
-    text = re.sub(r'\s+', '_', text)[:30]
+    text = _WS_RE.sub('_', text)[:30]
     
     return text
 
@@ -429,7 +570,6 @@ def format_record_bibtex(record):
     Returns:
         BibTeX formatted string
     """
-    # Use the new bibtex_from_record function from sru_library
     from sru_library import bibtex_from_record
     return bibtex_from_record(record)
 
@@ -440,6 +580,43 @@ def _sanitize_ris_value(value):
     return re.sub(r'[\r\n]+', ' ', str(value)).strip()
 
 
+# Single-valued RIS tags emitted straight from a record attribute when set,
+# as (line prefix, attribute) in output order. format_record_ris emits each
+# group at its place in the tag sequence.
+_RIS_IMPRINT_FIELDS = (
+    ("PB  - ", "publisher_name"),
+    ("CY  - ", "place_of_publication"),
+)
+_RIS_SIMPLE_FIELDS = (
+    ("VL  - ", "volume"),
+    ("IS  - ", "issue"),
+    ("SP  - ", "pages"),
+    ("LA  - ", "language"),
+    ("DO  - ", "doi"),
+)
+_RIS_NOTE_FIELDS = (
+    ("N1  - Format: ", "format"),
+    ("N1  - Extent: ", "extent"),
+)
+
+
+def _ris_field_lines(record, fields):
+    """Yield the RIS lines for the non-empty attributes in a field table."""
+    for prefix, attr in fields:
+        value = getattr(record, attr)
+        if value:
+            yield f"{prefix}{value}"
+
+
+def _ris_creator_lines(tag, names):
+    """Yield RIS creator lines (AU/ED) for a list of names."""
+    from sru_library import format_ris_creator
+    for name in names:
+        name = format_ris_creator(name)
+        if name:
+            yield f"{tag}  - {name}"
+
+
 def format_record_ris(record):
     """
     Format a BiblioRecord as RIS (Research Information Systems) format.
@@ -465,38 +642,24 @@ def format_record_ris(record):
         record_type = "BOOK"  # Book
 
     # Start building RIS entry
-    ris = ["TY  - " + record_type]
-
-    # Add ID
-    ris.append(f"ID  - {record.id}")
-
-    # Add title
-    ris.append(f"TI  - {_sanitize_ris_value(record.title)}")
-
-    # Add authors ("Last, First"; corporate/mononym names kept verbatim)
-    for author in record.authors:
-        name = format_ris_creator(author)
-        if name:
-            ris.append(f"AU  - {name}")
-
-    # Add editors if present
-    for editor in record.editors:
-        name = format_ris_creator(editor)
-        if name:
-            ris.append(f"ED  - {name}")
-
-    # Add year
+    ris = [
+        "TY  - " + record_type,
+        f"ID  - {record.id}",
+        f"TI  - {_sanitize_ris_value(record.title)}",
+    ]
+
+    # Add authors and editors ("Last, First"; corporate/mononym names kept
+    # verbatim)
+    ris.extend(_ris_creator_lines("AU", record.authors))
+    ris.extend(_ris_creator_lines("ED", record.editors))
+
+    # Add year (Y1 with // for month/day)
     if record.year:
         ris.append(f"PY  - {record.year}")
-        ris.append(f"Y1  - {record.year}///")  # Year with // for month/day
-
-    # Add publisher
-    if record.publisher_name:
-        ris.append(f"PB  - {record.publisher_name}")
+        ris.append(f"Y1  - {record.year}///")
 
-    # Add place of publication
-    if record.place_of_publication:
-        ris.append(f"CY  - {record.place_of_publication}")
+    # Add publisher and place of publication
+    ris.extend(_ris_field_lines(record, _RIS_IMPRINT_FIELDS))
 
     # Add ISBN/ISSN. RIS uses a single `SN` tag for both, so emitting two
     # lines is ambiguous to importers — pick the identifier matching the type
@@ -519,45 +682,21 @@ def format_record_ris(record):
     elif record.series:
         ris.append(f"T2  - {record.series}")
 
-    # Add volume
-    if record.volume:
-        ris.append(f"VL  - {record.volume}")
-
-    # Add issue
-    if record.issue:
-        ris.append(f"IS  - {record.issue}")
-
-    # Add pages
-    if record.pages:
-        ris.append(f"SP  - {record.pages}")
-
-    # Add language
-    if record.language:
-        ris.append(f"LA  - {record.language}")
-
-    # Add DOI
-    if record.doi:
-        ris.append(f"DO  - {record.doi}")
+    # Add volume, issue, pages, language and DOI
+    ris.extend(_ris_field_lines(record, _RIS_SIMPLE_FIELDS))
 
     # Add URLs
-    for url in record.urls:
-        ris.append(f"UR  - {url}")
+    ris.extend(f"UR  - {url}" for url in record.urls)
 
     # Add abstract
     if record.abstract:
         ris.append(f"AB  - {_sanitize_ris_value(record.abstract)}")
 
     # Add keywords (from subjects)
-    for subject in record.subjects:
-        ris.append(f"KW  - {subject}")
-
-    # Add note with format info
-    if record.format:
-        ris.append(f"N1  - Format: {record.format}")
+    ris.extend(f"KW  - {subject}" for subject in record.subjects)
 
-    # Add extent information
-    if record.extent:
-        ris.append(f"N1  - Extent: {record.extent}")
+    # Add notes with format and extent info
+    ris.extend(_ris_field_lines(record, _RIS_NOTE_FIELDS))
 
     # End record
     ris.append("ER  - ")
@@ -565,30 +704,135 @@ def format_record_ris(record):
     return "\n".join(ris)
 
 
-def format_record(record, format_type='text', include_raw=False, verbose=False):
+def _loads(text):
+    """Parse a JSON document, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+# Characters json.dumps escapes as \uXXXX by default (ensure_ascii)
+_JSON_NON_ASCII_RE = re.compile(r'[^\x00-\x7e]')
+
+
+def _json_escape(match):
+    """JSON \\uXXXX escape of one character, as a surrogate pair above U+FFFF."""
+    code = ord(match.group())
+    if code > 0xFFFF:
+        code -= 0x10000
+        return '\\u{:04x}\\u{:04x}'.format(0xD800 | (code >> 10), 0xDC00 | (code & 0x3FF))
+    return '\\u{:04x}'.format(code)
+
+
+def _orjson_dumps(data, option=None):
     """
-    Format a bibliographic record for display.
+    orjson.dumps as text escaped like json.dumps: orjson writes non-ASCII
+    characters as UTF-8, json.dumps as \\uXXXX. With this the output is the
+    same byte for byte whether orjson is installed or not (floats aside,
+    where orjson writes 1e16 for 1e+16; record fields are text).
+    """
+    return _JSON_NON_ASCII_RE.sub(_json_escape, orjson.dumps(data, option=option).decode('utf-8'))
+
+
+def _dumps(data):
+    """Serialize data as compact JSON, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return _orjson_dumps(data)
+        except TypeError:
+            pass
+    return json.dumps(data, separators=(',', ':'))
+
+
+def _dumps_indented(data):
+    """
+    Serialize data as JSON indented by two spaces, using orjson when it is
+    installed and the json module otherwise (or for types orjson rejects).
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return _orjson_dumps(data, orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2)
+
+
+def _raw_text(raw_data):
+    """
+    Return a record's raw data as text. The Zotero searches keep the parsed
+    item dict and only serialize it here, when raw output is requested.
+    """
+    if isinstance(raw_data, (dict, list)):
+        return _dumps_indented(raw_data)
+    return raw_data
+
+
+@functools.lru_cache(maxsize=2048)
+def _split_name(name):
+    """
+    Split a personal name into (last, first) for Zotero creators. Handles
+    "Last, First" and "First Middle Last"; a single word is all last name.
+    Cached, since the same names recur across a result set.
+    """
+    last, comma, first = name.partition(',')
+    if comma:
+        return last.strip(), first.strip()
+    parts = name.split()
+    if len(parts) > 1:
+        return parts[-1], ' '.join(parts[:-1])
+    return name, ""
+
+
+def _zotero_creators(record):
+    """Zotero creator dicts for a record's authors followed by its editors."""
+    creators = []
+    for creator_type, names in (("author", record.authors), ("editor", record.editors)):
+        for name in names:
+            last, first = _split_name(name)
+            creators.append({"creatorType": creator_type, "lastName": last, "firstName": first})
+    return creators
+
+
+def _interleave(items, sep):
+    """Yield items with sep between them, like the pieces of sep.join(items)."""
+    it = iter(items)
+    for item in it:
+        yield item
+        break
+    for item in it:
+        yield sep
+        yield item
+
+
+def iter_format_record(record, format_type='text', include_raw=False, verbose=False):
+    """
+    Format a bibliographic record for display, as a sequence of string
+    fragments. Writers can stream these with writelines() instead of
+    building the whole string; format_record() joins them.
     
     Args:
         record: BiblioRecord object
-        format_type: 'text', 'json', 'bibtex', 'ris', or 'zotero'
+        format_type: 'text', 'json', 'ndjson', 'bibtex', 'ris', or 'zotero'
         include_raw: Whether to include raw XML data
         verbose: Whether to show detailed debugging info
         
     Returns:
-        Formatted record string
+        Iterator of string fragments that together form the formatted record
     """
-    if format_type == 'json':
+    if format_type == 'json' or format_type == 'ndjson':
         data = record.to_dict()
         if include_raw or verbose:
-            data['raw_data'] = record.raw_data
-        return json.dumps(data, indent=2)
+            data['raw_data'] = _raw_text(record.raw_data)
+        yield _dumps_indented(data) if format_type == 'json' else _dumps(data)
+        return
     
     elif format_type == 'bibtex':
-        return format_record_bibtex(record)
+        yield format_record_bibtex(record)
+        return
     
     elif format_type == 'ris':
-        return format_record_ris(record)
+        yield format_record_ris(record)
+        return
     
     elif format_type == 'zotero':
         # For Zotero format, we'll use JSON with specific Zotero-compatible fields
@@ -611,56 +855,7 @@ def format_record(record, format_type='text', include_raw=False, verbose=False):
         }
         
         # Format creators for Zotero (need firstName, lastName fields)
-        for author in record.authors:
-            creator = {}
-            if ',' in author:
-                parts = author.split(',', 1)
-                creator = {
-                    "creatorType": "author",
-                    "lastName": parts[0].strip(),
-                    "firstName": parts[1].strip() if len(parts) > 1 else ""
-                }
-            else:
-                parts = author.split()
-                if len(parts) > 1:
-                    creator = {
-                        "creatorType": "author",
-                        "lastName": parts[-1],
-                        "firstName": ' '.join(parts[:-1])
-                    }
-                else:
-                    creator = {
-                        "creatorType": "author",
-                        "lastName": author,
-                        "firstName": ""
-                    }
-            zotero_data["creators"].append(creator)
-
-        # Format editors for Zotero
-        for editor in record.editors:
-            creator = {}
-            if ',' in editor:
-                parts = editor.split(',', 1)
-                creator = {
-                    "creatorType": "editor",
-                    "lastName": parts[0].strip(),
-                    "firstName": parts[1].strip() if len(parts) > 1 else ""
-                }
-            else:
-                parts = editor.split()
-                if len(parts) > 1:
-                    creator = {
-                        "creatorType": "editor",
-                        "lastName": parts[-1],
-                        "firstName": ' '.join(parts[:-1])
-                    }
-                else:
-                    creator = {
-                        "creatorType": "editor",
-                        "lastName": editor,
-                        "firstName": ""
-                    }
-            zotero_data["creators"].append(creator)
+        zotero_data["creators"].extend(_zotero_creators(record))
         
         # Add journal article specific fields
         if record.journal_title:
@@ -669,96 +864,117 @@ def format_record(record, format_type='text', include_raw=False, verbose=False):
             zotero_data["issue"] = record.issue
             zotero_data["pages"] = record.pages
         
-        return json.dumps(zotero_data, indent=2)
+        yield _dumps_indented(zotero_data)
+        return
     
     # Default to text format with improved layout
-    result = []
-    result.append(f"Title: {record.title}")
+    yield f"Title: {record.title}"
     
     if record.authors:
         # Properly format authors list
-        result.append(f"Author(s): {', '.join(record.authors)}")
+        yield "\nAuthor(s): "
+        yield from _interleave(record.authors, ", ")
 
     if record.editors:
         # Properly format editors list
-        result.append(f"Editor(s): {', '.join(record.editors)}")
+        yield "\nEditor(s): "
+        yield from _interleave(record.editors, ", ")
     
     if record.year:
-        result.append(f"Year: {record.year}")
+        yield f"\nYear: {record.year}"
     
     # Format place and publisher separately
     if record.place_of_publication:
-        result.append(f"Place of Publication: {record.place_of_publication}")
+        yield f"\nPlace of Publication: {record.place_of_publication}"
     
     if record.publisher_name:
-        result.append(f"Publisher: {record.publisher_name}")
+        yield f"\nPublisher: {record.publisher_name}"
     
     if record.edition:
-        result.append(f"Edition: {record.edition}")
+        yield f"\nEdition: {record.edition}"
     
     if record.series:
-        result.append(f"Series: {record.series}")
+        yield f"\nSeries: {record.series}"
     
     if record.extent:
-        result.append(f"Extent: {record.extent}")
+        yield f"\nExtent: {record.extent}"
     
     # Add journal information for articles
     if record.journal_title:
-        result.append(f"Journal Title: {record.journal_title}")
+        yield f"\nJournal Title: {record.journal_title}"
         if record.volume:
-            result.append(f"Volume: {record.volume}")
+            yield f"\nVolume: {record.volume}"
         if record.issue:
-            result.append(f"Issue: {record.issue}")
+            yield f"\nIssue: {record.issue}"
         if record.pages:
-            result.append(f"Pages: {record.pages}")
+            yield f"\nPages: {record.pages}"
     
     if record.isbn:
-        result.append(f"ISBN: {record.isbn}")
+        yield f"\nISBN: {record.isbn}"
     
     if record.issn:
-        result.append(f"ISSN: {record.issn}")
+        yield f"\nISSN: {record.issn}"
     
     if record.language:
-        result.append(f"Language: {record.language}")
+        yield f"\nLanguage: {record.language}"
     
     if record.subjects:
         # Limit to 5 subjects but indicate if there are more
-        if len(record.subjects) > 5:
-            subjects_text = ", ".join(record.subjects[:5]) + f", ... ({len(record.subjects) - 5} more)"
+        subject_count = len(record.subjects)
+        if subject_count > 5:
+            subjects_text = ", ".join(itertools.islice(record.subjects, 5)) + f", ... ({subject_count - 5} more)"
         else:
             subjects_text = ", ".join(record.subjects)
-        result.append(f"Subjects: {subjects_text}")
+        yield f"\nSubjects: {subjects_text}"
     
     if record.urls:
         # Format URLs for better readability (one per line if there are multiple)
         if len(record.urls) == 1:
-            result.append(f"URL: {record.urls[0]}")
+            yield f"\nURL: {record.urls[0]}"
         elif len(record.urls) > 1:
-            result.append("URLs:")
+            yield "\nURLs:"
             for url in record.urls:
-                result.append(f"  - {url}")
+                yield f"\n  - {url}"
     
     if record.abstract:
         # Truncate long abstracts
         abstract = record.abstract
         if len(abstract) > 300:
             abstract = abstract[:297] + "..."
-        result.append(f"Abstract: {abstract}")
+        yield f"\nAbstract: {abstract}"
     
     # Show format information if available
     if record.format:
-        result.append(f"Format: {record.format}")
+        yield f"\nFormat: {record.format}"
     
     # Show raw data in verbose mode
     if include_raw or verbose:
-        result.append("\nRaw Data:")
-        raw_data = record.raw_data
-        # Limit raw data length to prevent overwhelming the terminal
-        if raw_data and len(raw_data) > 2000:
-            raw_data = raw_data[:1997] + "..."
-        result.append(raw_data)
+        yield "\n\nRaw Data:\n"
+        raw_data = _raw_text(record.raw_data)
+        if raw_data is not None:
+            # Limit raw data length to prevent overwhelming the terminal; the
+            # ellipsis is emitted separately so the head isn't copied again
+            if len(raw_data) > 2000:
+                yield raw_data[:1997]
+                yield "..."
+            else:
+                yield raw_data
+
+
+def format_record(record, format_type='text', include_raw=False, verbose=False):
+    """
+    Format a bibliographic record for display.
     
-    return "\n".join(result)
+    Args:
+        record: BiblioRecord object
+        format_type: 'text', 'json', 'ndjson', 'bibtex', 'ris', or 'zotero'
+        include_raw: Whether to include raw XML data
+        verbose: Whether to show detailed debugging info
+        
+    Returns:
+        Formatted record string
+    """
+    return "".join(iter_format_record(record, format_type, include_raw, verbose))
 
 def handle_search_output(records, args):
     """
@@ -831,10 +1047,18 @@ def handle_search_output(records, args):
             # Don't fail the overall process for this error
     
     # Display results to console if we're not just saving to a file
-    if not args.output:
-        for i, record in enumerate(records, 1):
-            print(f"\n--- Result {i} of {len(records)} ---")
-            print(format_record(record, args.format, args.raw, args.verbose))
+    if not args.output and args.format == 'ndjson':
+        # Plain NDJSON, so the output can be piped into other tools
+        sys.stdout.write("".join(
+            f"{format_record(record, args.format, args.raw, args.verbose)}\n" for record in records
+        ))
+    elif not args.output:
+        total = len(records)
+        sys.stdout.write("".join(
+            f"\n--- Result {i} of {total} ---\n"
+            f"{format_record(record, args.format, args.raw, args.verbose)}\n"
+            for i, record in enumerate(records, 1)
+        ))
     
     return success
 
@@ -848,19 +1072,25 @@ def search_ixtheo_endpoint(args):
     Returns:
         Tuple of (success, records) where success is a boolean and records is a list of BiblioRecord objects
     """
+    from ixtheo_library import IxTheoSearchHandler
     endpoint_id = args.endpoint
-    if endpoint_id not in IXTHEO_ENDPOINTS:
-        logger.error(f"Unknown IxTheo endpoint: {endpoint_id}")
+    endpoint_info = _resolve_endpoint(args, 'ixtheo')
+    if endpoint_info is None:
+        logger.error("Unknown IxTheo endpoint: %s", endpoint_id)
         logger.info("Use --list --protocol ixtheo to see available IxTheo endpoints")
         return False, []
     
-    # Get endpoint info
-    endpoint_info = IXTHEO_ENDPOINTS[endpoint_id]
-    logger.info(f"Using {endpoint_info['name']} ({endpoint_id}) via IxTheo protocol")
+    logger.info("Using %s (%s) via IxTheo protocol", endpoint_info['name'], endpoint_id)
     
     # Get the data format from endpoint config, with RIS as the default
     data_format = endpoint_info.get('format', 'ris').lower()
-    logger.info(f"Using {data_format.upper()} format for record retrieval")
+    logger.info("Using %s format for record retrieval", data_format.upper())
+    
+    # Check the IxTheo criteria before opening a session
+    if not any((args.title, args.author, args.subject, args.advanced,
+                args.format_filter, args.language_filter)):
+        logger.error("No IxTheo search criteria specified (use --title, --author, --subject or --advanced)")
+        return False, []
     
     # Create IxTheo search handler
     ixtheo_handler = IxTheoSearchHandler(
@@ -870,31 +1100,42 @@ def search_ixtheo_endpoint(args):
     )
     
     # Perform search
-    logger.info(f"Searching IxTheo with parameters:")
-    if args.title:
-        logger.info(f"  Title: {args.title}")
-    if args.author:
-        logger.info(f"  Author: {args.author}")
-    if args.subject:
-        logger.info(f"  Subject: {args.subject}")
-    if args.format_filter:
-        logger.info(f"  Format filter: {args.format_filter}")
-    if args.language_filter:
-        logger.info(f"  Language filter: {args.language_filter}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Searching IxTheo with parameters:")
+        for label, value in (("Title", args.title), ("Author", args.author), ("Subject", args.subject),
+                             ("Format filter", args.format_filter),
+                             ("Language filter", args.language_filter)):
+            if value:
+                logger.info("  %s: %s", label, value)
     
     start_time = time.time()
     
+    # Reuse a cached response for the same request when --cache is given
+    cache = _open_response_cache(args)
     try:
         # Execute search
-        total_results, records = ixtheo_handler.search(
-            query=args.advanced,
-            title=args.title,
-            author=args.author,
-            subject=args.subject,
-            max_results=args.max_records,
-            format_filter=args.format_filter,
-            language_filter=args.language_filter
-        )
+        search_key = _ResponseCache.key('ixtheo', endpoint_id, args.advanced, args.title, args.author,
+                                        args.subject, args.max_records, args.format_filter,
+                                        args.language_filter)
+        cached = cache.get(search_key) if cache else None
+        if cached is not None:
+            logger.warning("Showing cached IxTheo search results (up to %s seconds old); "
+                           "drop --cache to query the endpoint", cache.ttl)
+            total_results = cached['total']
+            records = [_record_from_cache(r) for r in cached['records']]
+        else:
+            total_results, records = ixtheo_handler.search(
+                query=args.advanced,
+                title=args.title,
+                author=args.author,
+                subject=args.subject,
+                max_results=args.max_records,
+                format_filter=args.format_filter,
+                language_filter=args.language_filter
+            )
+            if cache and records:
+                cache.put(search_key, {'total': total_results,
+                                       'records': [_record_to_cache(r) for r in records]})
         
         end_time = time.time()
         search_time = end_time - start_time
@@ -903,38 +1144,35 @@ def search_ixtheo_endpoint(args):
             logger.warning("No results found")
             return False, []
         
-        logger.info(f"Found {total_results} results, showing {len(records)} ({search_time:.2f} seconds)")
+        logger.info("Found %s results, showing %s (%.2f seconds)", total_results, len(records), search_time)
         
         # Get detailed data for each record based on the specified format
-        logger.info(f"Retrieving {data_format.upper()} data for each record...")
+        logger.info("Retrieving %s data for each record...", data_format.upper())
         
-        enhanced_records = []
-        for i, record in enumerate(records):
+        def enhance(indexed_record):
+            i, record = indexed_record
             if args.verbose:
-                logger.info(f"Getting {data_format.upper()} data for record {i+1}/{len(records)}: {record.id}")
+                logger.info("Getting %s data for record %s/%s: %s", data_format.upper(), i+1, len(records), record.id)
             
             try:
                 if data_format == 'marc':
                     # Use MARC format
-                    marc_record = ixtheo_handler.get_record_with_marc(record)
-                    enhanced_records.append(marc_record)
+                    return ixtheo_handler.get_record_with_marc(record)
                 elif data_format == 'html':
                     # Use direct HTML parsing
                     html_record = ixtheo_handler.client.get_record_with_html(record.id)
                     if html_record:
-                        enhanced_records.append(html_record)
+                        return html_record
                     else:
                         # Fallback to RIS if HTML parsing fails
-                        logger.warning(f"HTML parsing failed for record {record.id}, falling back to RIS")
-                        ris_record = ixtheo_handler.get_record_with_ris(record)
-                        enhanced_records.append(ris_record)
+                        logger.warning("HTML parsing failed for record %s, falling back to RIS", record.id)
+                        return ixtheo_handler.get_record_with_ris(record)
                 else:
                     # Default to RIS format
-                    ris_record = ixtheo_handler.get_record_with_ris(record)
-                    enhanced_records.append(ris_record)
+                    return ixtheo_handler.get_record_with_ris(record)
             except Exception as e:
-                logger.warning(f"Error retrieving {data_format.upper()} data for record {record.id}: {e}")
-                logger.warning(f"Falling back to simpler method")
+                logger.warning("Error retrieving %s data for record %s: %s", data_format.upper(), record.id, e)
+                logger.warning("Falling back to simpler method")
                 
                 try:
                     # Fallback: try to get at least basic information
@@ -942,18 +1180,41 @@ def search_ixtheo_endpoint(args):
                         # Try HTML parsing as fallback
                         html_record = ixtheo_handler.client.get_record_with_html(record.id)
                         if html_record:
-                            enhanced_records.append(html_record)
-                            continue
+                            return html_record
                     
                     # If all else fails, use the basic record
-                    logger.error(f"All retrieval methods failed for record {record.id}")
-                    enhanced_records.append(record)
+                    logger.error("All retrieval methods failed for record %s", record.id)
+                    return record
                 except Exception as e2:
-                    logger.error(f"Fallback also failed for record {record.id}: {e2}")
-                    enhanced_records.append(record)
-            
-            # Add a small delay to avoid overwhelming the server
-            time.sleep(0.2)
+                    logger.error("Fallback also failed for record %s: %s", record.id, e2)
+                    return record
+        
+        # Records retrieved on an earlier run come from the cache
+        enhanced_records = [None] * len(records)
+        record_keys = [_ResponseCache.key('ixtheo-record', data_format, record.id) for record in records]
+        if cache:
+            for i, key in enumerate(record_keys):
+                cached_record = cache.get(key)
+                if cached_record is not None:
+                    enhanced_records[i] = _record_from_cache(cached_record)
+            reused = sum(record is not None for record in enhanced_records)
+            if reused:
+                logger.warning("Using %s cached IxTheo record(s); drop --cache to refetch them", reused)
+        pending = [(i, record) for i, record in enumerate(records) if enhanced_records[i] is None]
+        
+        # The rest are fetched concurrently; each is a few independent HTTP
+        # requests, and the client's rate limiter keeps the load polite
+        if pending:
+            # Their RIS exports come in a few bulk requests up front, which
+            # the per-record retrieval then finds in the client's cache
+            if data_format == 'ris':
+                ixtheo_handler.client.get_export_data_bulk([record.id for _, record in pending if record.id])
+            with ThreadPoolExecutor(max_workers=min(10, len(pending))) as executor:
+                for (i, record), enhanced in zip(pending, executor.map(enhance, pending)):
+                    enhanced_records[i] = enhanced
+                    # Only cache real retrievals, not fallbacks to the search hit
+                    if cache and enhanced is not record:
+                        cache.put(record_keys[i], _record_to_cache(enhanced))
         
         # Show pagination info if applicable
         if total_results > len(enhanced_records) and not args.output:
@@ -965,12 +1226,57 @@ def search_ixtheo_endpoint(args):
         return True, enhanced_records
     
     except Exception as e:
-        logger.error(f"Error performing IxTheo search: {e}")
+        logger.error("Error performing IxTheo search: %s", e)
         import traceback
         traceback.print_exc()
         return False, []
+    finally:
+        ixtheo_handler.close()
+        if cache:
+            cache.close()
 
     
+# Records requested per SRU searchRetrieve call. Larger --max-records values
+# are split into windows of this size, fetched concurrently.
+SRU_PAGE_SIZE = 100
+SRU_MAX_WORKERS = 4
+
+
+def _sru_search_windows(sru_client, query, schema, max_records, start_record,
+                        max_workers=SRU_MAX_WORKERS):
+    """
+    Run an SRU search that may span several startRecord windows.
+
+    The first window is fetched on its own to learn the total hit count; the
+    remaining windows are then requested in parallel, up to max_workers at
+    a time, and joined in order.
+
+    Returns:
+        Tuple of (total_records, list of BiblioRecord objects)
+    """
+    first_size = min(max_records, SRU_PAGE_SIZE)
+    total, records = sru_client.search(query=query, schema=schema,
+                                       max_records=first_size, start_record=start_record)
+    if len(records) < first_size:
+        return total, records
+
+    end = start_record + min(max_records, max(total - start_record + 1, 0))
+    starts = range(start_record + first_size, end, SRU_PAGE_SIZE)
+    if not starts:
+        return total, records
+
+    def fetch(start):
+        return sru_client.search(query=query, schema=schema,
+                                 max_records=min(SRU_PAGE_SIZE, end - start),
+                                 start_record=start)[1]
+
+    logger.info("Fetching %d more SRU result windows", len(starts))
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(starts))) as executor:
+        for window in executor.map(fetch, starts):
+            records.extend(window)
+    return total, records
+
+
 def search_sru_endpoint(args):
     """
     Search a library SRU endpoint with the given parameters.
@@ -981,15 +1287,15 @@ def search_sru_endpoint(args):
     Returns:
         Tuple of (success, records) where success is a boolean and records is a list of BiblioRecord objects
     """
+    from sru_library import SRUClient
     endpoint_id = args.endpoint
-    if endpoint_id not in SRU_ENDPOINTS:
-        logger.error(f"Unknown SRU endpoint: {endpoint_id}")
+    endpoint_info = _resolve_endpoint(args, 'sru')
+    if endpoint_info is None:
+        logger.error("Unknown SRU endpoint: %s", endpoint_id)
         logger.info("Use --list --protocol sru to see available SRU endpoints")
         return False, []
     
-    # Get endpoint info
-    endpoint_info = SRU_ENDPOINTS[endpoint_id]
-    logger.info(f"Using {endpoint_info['name']} ({endpoint_id}) via SRU protocol")
+    logger.info("Using %s (%s) via SRU protocol", endpoint_info['name'], endpoint_id)
     
     # Build query
     query = build_sru_query(args, endpoint_id)
@@ -1004,19 +1310,30 @@ def search_sru_endpoint(args):
         version=endpoint_info.get('version', '1.1'),
         timeout=args.timeout,
         query_params=endpoint_info.get('query_params'),
+        pool_size=max(10, args.jobs),
     )
     
-    logger.info(f"Searching with SRU query: {query}")
+    logger.info("Searching with SRU query: %s", query)
     start_time = time.time()
     
+    # Reuse a cached response for the same request when --cache is given
+    cache = _open_response_cache(args)
     try:
         # Execute search
-        total, records = sru_client.search(
-            query=query,
-            schema=args.schema,
-            max_records=args.max_records,
-            start_record=args.start_record
-        )
+        cache_key = _ResponseCache.key('sru', endpoint_info['url'], query, args.schema,
+                                       args.max_records, args.start_record)
+        cached = cache.get(cache_key) if cache else None
+        if cached is not None:
+            logger.warning("Showing cached SRU results (up to %s seconds old); "
+                           "drop --cache to query the endpoint", cache.ttl)
+            total = cached['total']
+            records = [_record_from_cache(r) for r in cached['records']]
+        else:
+            total, records = _sru_search_windows(
+                sru_client, query, args.schema, args.max_records, args.start_record, args.jobs
+            )
+            if cache and records:
+                cache.put(cache_key, {'total': total, 'records': [_record_to_cache(r) for r in records]})
         
         end_time = time.time()
         search_time = end_time - start_time
@@ -1030,7 +1347,7 @@ def search_sru_endpoint(args):
                 logger.warning("No results found")
             return False, []
         
-        logger.info(f"Found {total} results, showing {len(records)} ({search_time:.2f} seconds)")
+        logger.info("Found %s results, showing %s (%.2f seconds)", total, len(records), search_time)
             
         # Show pagination info if applicable and we're not redirecting output
         if total > len(records) and not args.output:
@@ -1042,8 +1359,11 @@ def search_sru_endpoint(args):
         return True, records
     
     except Exception as e:
-        logger.error(f"Error performing SRU search: {e}")
+        logger.error("Error performing SRU search: %s", e)
         return False, []
+    finally:
+        if cache:
+            cache.close()
 
 def search_oai_endpoint(args):
     """
@@ -1055,21 +1375,22 @@ def search_oai_endpoint(args):
     Returns:
         Tuple of (success, records) where success is a boolean and records is a list of BiblioRecord objects
     """
+    from oai_pmh_library import OAIClient
     endpoint_id = args.endpoint
-    if endpoint_id not in OAI_ENDPOINTS:
+    endpoint_info = _resolve_endpoint(args, 'oai')
+    if endpoint_info is None:
         logger.error(f"Unknown OAI-PMH endpoint: {endpoint_id}")
         logger.info("Use --list --protocol oai to see available OAI-PMH endpoints")
         return False, []
     
-    # Get endpoint info
-    endpoint_info = OAI_ENDPOINTS[endpoint_id]
     logger.info(f"Using {endpoint_info['name']} ({endpoint_id}) via OAI-PMH protocol")
     
     # Create OAI client
     oai_client = OAIClient(
         base_url=endpoint_info['url'],
         default_metadata_prefix=endpoint_info.get('default_metadata_prefix', 'oai_dc'),
-        timeout=args.timeout
+        timeout=args.timeout,
+        pool_size=max(10, args.jobs)
     )
     
     # Build search parameters
@@ -1108,16 +1429,30 @@ def search_oai_endpoint(args):
     
     start_time = time.time()
     
+    # Reuse a cached response for the same request when --cache is given
+    cache = _open_response_cache(args)
     try:
         # Execute search
-        total, records = oai_client.search(
-            query=search_query,
-            metadata_prefix=metadata_prefix,
-            set_spec=args.set,
-            from_date=from_date,
-            until_date=until_date,
-            max_results=args.max_records
-        )
+        cache_key = _ResponseCache.key('oai', endpoint_info['url'], search_query, metadata_prefix,
+                                       args.set, from_date, until_date, args.max_records)
+        cached = cache.get(cache_key) if cache else None
+        if cached is not None:
+            logger.warning("Showing cached OAI-PMH results (up to %s seconds old); "
+                           "drop --cache to query the endpoint", cache.ttl)
+            total = cached['total']
+            records = [_record_from_cache(r) for r in cached['records']]
+        else:
+            total, records = oai_client.search(
+                query=search_query,
+                metadata_prefix=metadata_prefix,
+                set_spec=args.set,
+                from_date=from_date,
+                until_date=until_date,
+                max_results=args.max_records,
+                max_workers=args.jobs
+            )
+            if cache and records:
+                cache.put(cache_key, {'total': total, 'records': [_record_to_cache(r) for r in records]})
         
         end_time = time.time()
         search_time = end_time - start_time
@@ -1140,6 +1475,24 @@ def search_oai_endpoint(args):
     except Exception as e:
         logger.error(f"Error performing OAI-PMH search: {e}")
         return False, []
+    finally:
+        if cache:
+            cache.close()
+
+# Four-digit year (1000-2099) inside a free-form Zotero date field
+_YEAR_RE = re.compile(r'\b(1\d{3}|20\d{2})\b')
+
+
+def _year_from_date(date):
+    """Return the first plausible year in a Zotero date string, or None."""
+    match = _YEAR_RE.search(date) if date else None
+    return match.group(1) if match else None
+
+
+def _duplicate_key(isbn, title, authors):
+    """Identity of a Zotero item for dropping duplicates: ISBN, title, first author."""
+    return (isbn or '', (title or '').lower(), authors[0] if authors else '')
+
 
 def search_zotero(args):
     """
@@ -1161,7 +1514,7 @@ def search_zotero(args):
         logger.error("  2. API: --zotero-api-key KEY --zotero-library-id ID --zotero-library-type [user|group]")
         return False, []
     
-    if use_api and not ZOTERO_API_AVAILABLE:
+    if use_api and not _have_pyzotero():
         logger.error("Zotero API search requires the pyzotero library.")
         logger.error("Install it with: pip install pyzotero")
         return False, []
@@ -1174,6 +1527,13 @@ def search_zotero(args):
         return search_zotero_local(args)
 
 
+# Item types search_zotero_api converts to records. The API is asked to filter
+# on them, so the items it returns are all usable.
+_ZOTERO_API_ITEM_TYPES = ('book', 'journalArticle', 'bookSection', 'conferencePaper')
+# Most items the Zotero web API returns per request
+_ZOTERO_API_MAX_LIMIT = 100
+
+
 def search_zotero_api(args):
     """
     Search a Zotero library using the API.
@@ -1213,12 +1573,15 @@ def search_zotero_api(args):
         logger.info(f"Searching Zotero with parameters: {search_params}")
         start_time = time.time()
         
-        # Get items with the specified parameters
+        # Get items with the specified parameters, one request of at most
+        # --max-records items of the supported types
+        api_filter = {'itemType': ' || '.join(_ZOTERO_API_ITEM_TYPES),
+                      'limit': min(args.max_records, _ZOTERO_API_MAX_LIMIT)}
         if search_params:
-            items = zot.items(q=search_params.get('q'), **{k: v for k, v in search_params.items() if k != 'q'})
+            items = zot.items(**search_params, **api_filter)
         else:
             # If no specific search, get recent items
-            items = zot.top(limit=args.max_records)
+            items = zot.top(**api_filter)
         
         end_time = time.time()
         search_time = end_time - start_time
@@ -1229,24 +1592,31 @@ def search_zotero_api(args):
         
         # Convert Zotero items to BiblioRecords
         records = []
+        seen = set()
         for item in items:
-            if item.get('data', {}).get('itemType') in ['book', 'journalArticle', 'bookSection', 'conferencePaper']:
+            if item.get('data', {}).get('itemType') in _ZOTERO_API_ITEM_TYPES:
                 data = item.get('data', {})
                 
                 # Extract authors
-                authors = []
-                for creator in data.get('creators', []):
-                    if 'name' in creator:
-                        authors.append(creator['name'])
-                    elif 'lastName' in creator and 'firstName' in creator:
-                        authors.append(f"{creator['lastName']}, {creator['firstName']}")
+                authors = [
+                    creator['name'] if 'name' in creator
+                    else f"{creator['lastName']}, {creator['firstName']}"
+                    for creator in data.get('creators', ())
+                    if 'name' in creator or ('lastName' in creator and 'firstName' in creator)
+                ]
+                
+                # Skip copies of an item that is already in the results
+                key = _duplicate_key(data.get('ISBN'), data.get('title', 'Untitled'), authors)
+                if key in seen:
+                    continue
+                seen.add(key)
                 
                 # Create BiblioRecord
                 record = BiblioRecord(
                     id=item.get('key', ''),
                     title=data.get('title', 'Untitled'),
                     authors=authors,
-                    year=data.get('date', '').split('-')[0] if data.get('date') else None,
+                    year=_year_from_date(data.get('date')),
                     publisher_name=data.get('publisher', None),
                     place_of_publication=data.get('place', None),
                     isbn=data.get('ISBN', None),
@@ -1257,7 +1627,7 @@ def search_zotero_api(args):
                     series=data.get('series', None),
                     edition=data.get('edition', None),
                     subjects=[tag.get('tag', '') for tag in data.get('tags', [])],
-                    raw_data=json.dumps(item, indent=2)
+                    raw_data=item
                 )
                 records.append(record)
         
@@ -1270,6 +1640,71 @@ def search_zotero_api(args):
         return False, []
 
 
+# Zotero item fields read by search_zotero_local, one result column each
+_ZOTERO_FIELDS = ('title', 'date', 'publisher', 'place', 'ISBN', 'ISSN', 'url',
+                  'abstractNote', 'language', 'series', 'edition')
+_ZOTERO_FIELD_VALUE = """
+    SELECT idv.value
+    FROM itemData idata
+    JOIN itemDataValues idv ON idata.valueID = idv.valueID
+    JOIN fields f ON idata.fieldID = f.fieldID
+    WHERE idata.itemID = i.itemID AND f.fieldName = '{0}'
+"""
+_ZOTERO_FIELD_COLUMNS = ', '.join(
+    '({}) AS "{}"'.format(_ZOTERO_FIELD_VALUE.format(name), name) for name in _ZOTERO_FIELDS
+)
+# Condition matching items whose field {0} is LIKE the bound parameter
+_ZOTERO_FIELD_MATCH = """
+    i.itemID IN (
+        SELECT idata.itemID
+        FROM itemData idata
+        JOIN itemDataValues idv ON idata.valueID = idv.valueID
+        JOIN fields f ON idata.fieldID = f.fieldID
+        WHERE f.fieldName = '{0}' AND idv.value LIKE ?
+    )
+"""
+
+# Creators and tags of a batch of items (see _fetch_for_items)
+_ZOTERO_CREATORS_SQL = """
+    SELECT c.itemID, c.orderIndex, cd.lastName, cd.firstName
+    FROM creators c
+    JOIN creatorData cd ON c.creatorDataID = cd.creatorDataID
+    WHERE c.itemID IN ({})
+    ORDER BY c.itemID, c.orderIndex
+"""
+_ZOTERO_TAGS_SQL = """
+    SELECT it.itemID, t.name
+    FROM tags t
+    JOIN itemTags it ON t.tagID = it.tagID
+    WHERE it.itemID IN ({})
+    ORDER BY it.itemID
+"""
+
+# Per-connection read tuning for the local Zotero database: a 64 MiB page
+# cache, in-memory temp tables and a memory-mapped database file
+_ZOTERO_PRAGMAS = (
+    "PRAGMA cache_size = -65536",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",
+)
+
+# Stay below SQLITE_MAX_VARIABLE_NUMBER (999 in SQLite < 3.32)
+_SQLITE_IN_BATCH = 500
+
+
+def _fetch_for_items(cursor, query, item_ids):
+    """
+    Run a query whose WHERE clause has an ``IN ({})`` placeholder for item IDs.
+    
+    The IDs are bound in batches of _SQLITE_IN_BATCH, so a handful of queries
+    replaces one round-trip per item. Yields the result rows.
+    """
+    for i in range(0, len(item_ids), _SQLITE_IN_BATCH):
+        batch = item_ids[i:i + _SQLITE_IN_BATCH]
+        cursor.execute(query.format(','.join('?' * len(batch))), batch)
+        yield from cursor.fetchall()
+
+
 def search_zotero_local(args):
     """
     Search a local Zotero database.
@@ -1286,19 +1721,21 @@ def search_zotero_local(args):
             logger.error(f"Zotero database not found at: {args.zotero_path}")
             return False, []
         
-        # Connect to the SQLite database
-        conn = sqlite3.connect(args.zotero_path)
+        # Connect to the SQLite database read-only and immutable: SQLite then
+        # skips locking and change detection, and the search also works
+        # while a running Zotero holds its lock on the database
+        conn = sqlite3.connect(Path(args.zotero_path).resolve().as_uri() + '?mode=ro&immutable=1',
+                               uri=True)
         conn.row_factory = sqlite3.Row
+        for pragma in _ZOTERO_PRAGMAS:
+            conn.execute(pragma)
         cursor = conn.cursor()
         
-        # Build the search query
-        query = """
-        SELECT i.itemID, i.key, idata.fieldName, idata.value
+        # Build the search query: one row per item, with the fields we use
+        # pivoted into columns so that LIMIT counts items, not field rows
+        query = f"""
+        SELECT i.itemID, i.key, {_ZOTERO_FIELD_COLUMNS}
         FROM items i
-        JOIN itemData idata ON i.itemID = idata.itemID
-        JOIN itemDataValues idv ON idata.valueID = idv.valueID
-        JOIN fields f ON idata.fieldID = f.fieldID
-        JOIN itemTypes it ON i.itemTypeID = it.itemTypeID
         WHERE i.itemTypeID IN (1, 2, 3, 7)  -- book, article, bookSection, conferencePaper
           AND i.itemID NOT IN (SELECT itemID FROM deletedItems)
         """
@@ -1308,7 +1745,7 @@ def search_zotero_local(args):
         params = []
         
         if args.title:
-            conditions.append("(f.fieldName = 'title' AND idv.value LIKE ?)")
+            conditions.append(_ZOTERO_FIELD_MATCH.format('title'))
             params.append(f"%{args.title}%")
         
         if args.author:
@@ -1325,69 +1762,54 @@ def search_zotero_local(args):
             params.append(f"%{args.author}%")
         
         if args.isbn:
-            conditions.append("(f.fieldName = 'ISBN' AND idv.value LIKE ?)")
+            conditions.append(_ZOTERO_FIELD_MATCH.format('ISBN'))
             params.append(f"%{args.isbn}%")
         
         if args.issn:
-            conditions.append("(f.fieldName = 'ISSN' AND idv.value LIKE ?)")
+            conditions.append(_ZOTERO_FIELD_MATCH.format('ISSN'))
             params.append(f"%{args.issn}%")
         
         if args.year:
-            conditions.append("(f.fieldName = 'date' AND idv.value LIKE ?)")
+            conditions.append(_ZOTERO_FIELD_MATCH.format('date'))
             params.append(f"%{args.year}%")
         
         # Add conditions to the query
         if conditions:
             query += " AND (" + " OR ".join(conditions) + ")"
         
-        # Add limit
-        query += " LIMIT ?"
-        params.append(args.max_records * 20)  # Higher limit for raw fields
+        # Add order and limit; without ORDER BY, the OR'ed IN subqueries
+        # may hand back items in any order
+        query += " ORDER BY i.itemID LIMIT ?"
+        params.append(args.max_records)
         
         # Execute the query
         logger.info(f"Executing SQL query against local Zotero database")
         start_time = time.time()
         cursor.execute(query, params)
-        rows = cursor.fetchall()
         
-        # Group by itemID to build complete records
         items_data = {}
-        for row in rows:
-            item_id = row['itemID']
-            if item_id not in items_data:
-                items_data[item_id] = {
-                    'key': row['key'],
-                    'fields': {}
-                }
-            items_data[item_id]['fields'][row['fieldName']] = row['value']
-        
-        # Get creator data for each item
-        for item_id in items_data:
-            cursor.execute("""
-            SELECT c.orderIndex, cd.lastName, cd.firstName
-            FROM creators c
-            JOIN creatorData cd ON c.creatorDataID = cd.creatorDataID
-            WHERE c.itemID = ?
-            ORDER BY c.orderIndex
-            """, (item_id,))
-            
-            creators = cursor.fetchall()
-            items_data[item_id]['creators'] = creators
-        
-        # Get tags for each item
-        for item_id in items_data:
-            cursor.execute("""
-            SELECT t.name
-            FROM tags t
-            JOIN itemTags it ON t.tagID = it.tagID
-            WHERE it.itemID = ?
-            """, (item_id,))
-            
-            tags = cursor.fetchall()
+        for row in cursor.fetchall():
+            items_data[row['itemID']] = {
+                'key': row['key'],
+                'fields': {name: row[name] for name in _ZOTERO_FIELDS if row[name] is not None}
+            }
+        
+        # Get creators and tags for all items with one query each; the rows
+        # come back ordered by itemID, so each item's rows are one run
+        item_ids = list(items_data)
+        by_item = operator.itemgetter('itemID')
+        
+        for item_id, creators in itertools.groupby(
+                _fetch_for_items(cursor, _ZOTERO_CREATORS_SQL, item_ids), key=by_item):
+            items_data[item_id]['creators'] = list(creators)
+        
+        for item_id, tags in itertools.groupby(
+                _fetch_for_items(cursor, _ZOTERO_TAGS_SQL, item_ids), key=by_item):
             items_data[item_id]['tags'] = [tag['name'] for tag in tags]
         
         # Convert to BiblioRecords
         records = []
+        seen = set()
         for item_id, data in items_data.items():
             fields = data['fields']
             
@@ -1399,19 +1821,18 @@ def search_zotero_local(args):
                 if last_name or first_name:
                     authors.append(f"{last_name}, {first_name}".strip())
             
-            # Extract year from date
-            year = None
-            if 'date' in fields:
-                year_match = re.search(r'\b(1\d{3}|20\d{2})\b', fields['date'])
-                if year_match:
-                    year = year_match.group(1)
+            # Skip copies of an item that is already in the results
+            key = _duplicate_key(fields.get('ISBN'), fields.get('title', 'Untitled'), authors)
+            if key in seen:
+                continue
+            seen.add(key)
             
             # Create BiblioRecord
             record = BiblioRecord(
                 id=data['key'],
                 title=fields.get('title', 'Untitled'),
                 authors=authors,
-                year=year,
+                year=_year_from_date(fields.get('date')),
                 publisher_name=fields.get('publisher'),
                 place_of_publication=fields.get('place'),
                 isbn=fields.get('ISBN'),
@@ -1422,7 +1843,7 @@ def search_zotero_local(args):
                 series=fields.get('series'),
                 edition=fields.get('edition'),
                 subjects=data.get('tags', []),
-                raw_data=json.dumps(fields, indent=2)
+                raw_data=fields
             )
             records.append(record)
         
@@ -1447,14 +1868,31 @@ def search_zotero_local(args):
 
 
 
+def _write_json_array(f, items):
+    """
+    Write items to f as an indented JSON array, one item at a time, so the
+    whole document is never built in memory. The layout is the same as
+    json.dump(list(items), f, indent=2).
+    """
+    sep = '\n  '
+    f.write('[')
+    for item in items:
+        f.write(sep)
+        # Nest the item one level deeper; JSON strings never contain raw newlines
+        f.write(_dumps_indented(item).replace('\n', '\n  '))
+        sep = ',\n  '
+    f.write(']' if sep == '\n  ' else '\n]')
+
+
 def save_results_to_file(records, filename, format_type='text', include_raw=False, verbose=False):
     """
     Save search results to a file.
     
     Args:
-        records: List of BiblioRecord objects
+        records: Iterable of BiblioRecord objects; a generator is written as
+            it is consumed, without being collected into a list
         filename: Output filename
-        format_type: 'text', 'json', 'bibtex', 'ris', or 'zotero'
+        format_type: 'text', 'json', 'ndjson', 'bibtex', 'ris', or 'zotero'
         include_raw: Whether to include raw data
         verbose: Whether to include verbose output
         
@@ -1467,6 +1905,8 @@ def save_results_to_file(records, filename, format_type='text', include_raw=Fals
         if not ext:
             if format_type == 'json' or format_type == 'zotero':
                 filename = f"{filename}.json"
+            elif format_type == 'ndjson':
+                filename = f"{filename}.ndjson"
             elif format_type == 'bibtex':
                 filename = f"{filename}.bib"
             elif format_type == 'ris':
@@ -1474,104 +1914,70 @@ def save_results_to_file(records, filename, format_type='text', include_raw=Fals
             else:
                 filename = f"{filename}.txt"
         
+        saved = 0
+        
+        def each_record():
+            nonlocal saved
+            for saved, record in enumerate(records, 1):
+                yield record
+        
+        def record_dicts():
+            for record in each_record():
+                data = record.to_dict()
+                if include_raw:
+                    data['raw_data'] = _raw_text(record.raw_data)
+                yield data
+        
         with open(filename, 'w', encoding='utf-8') as f:
             # Special handling for certain formats
             if format_type == 'json':
-                # For JSON, create a list of record dictionaries
-                data = [record.to_dict() for record in records]
-                if include_raw:
-                    for i, record in enumerate(records):
-                        data[i]['raw_data'] = record.raw_data
-                json.dump(data, f, indent=2)
+                # For JSON, write a list of record dictionaries
+                _write_json_array(f, record_dicts())
+            
+            elif format_type == 'ndjson':
+                # For NDJSON, write one compact record dictionary per line
+                for data in record_dicts():
+                    f.write(_dumps(data))
+                    f.write('\n')
             
             elif format_type == 'zotero':
-                # For Zotero format, create a list of Zotero-compatible items
-                zotero_items = []
-                for record in records:
-                    item_type = "book" if not record.issn else "journalArticle"
+                # For Zotero format, write a list of Zotero-compatible items
+                def zotero_items():
+                    for record in each_record():
+                        item_type = "book" if not record.issn else "journalArticle"
                     
-                    # Format creators
-                    creators = []
-                    for author in record.authors:
-                        creator = {}
-                        if ',' in author:
-                            parts = author.split(',', 1)
-                            creator = {
-                                "creatorType": "author",
-                                "lastName": parts[0].strip(),
-                                "firstName": parts[1].strip() if len(parts) > 1 else ""
-                            }
-                        else:
-                            parts = author.split()
-                            if len(parts) > 1:
-                                creator = {
-                                    "creatorType": "author",
-                                    "lastName": parts[-1],
-                                    "firstName": ' '.join(parts[:-1])
-                                }
-                            else:
-                                creator = {
-                                    "creatorType": "author",
-                                    "lastName": author,
-                                    "firstName": ""
-                                }
-                        creators.append(creator)
-
-                    # Add editors
-                    for editor in record.editors:
-                        creator = {}
-                        if ',' in editor:
-                            parts = editor.split(',', 1)
-                            creator = {
-                                "creatorType": "editor",
-                                "lastName": parts[0].strip(),
-                                "firstName": parts[1].strip() if len(parts) > 1 else ""
-                            }
-                        else:
-                            parts = editor.split()
-                            if len(parts) > 1:
-                                creator = {
-                                    "creatorType": "editor",
-                                    "lastName": parts[-1],
-                                    "firstName": ' '.join(parts[:-1])
-                                }
-                            else:
-                                creator = {
-                                    "creatorType": "editor",
-                                    "lastName": editor,
-                                    "firstName": ""
-                                }
-                        creators.append(creator)
+                        # Format creators
+                        creators = _zotero_creators(record)
                     
-                    # Create Zotero item
-                    zotero_item = {
-                        "itemType": item_type,
-                        "title": record.title,
-                        "creators": creators,
-                        "date": record.year,
-                        "publisher": record.publisher_name,
-                        "place": record.place_of_publication,
-                        "ISBN": record.isbn,
-                        "ISSN": record.issn,
-                        "series": record.series,
-                        "edition": record.edition,
-                        "language": record.language,
-                        "url": record.urls[0] if record.urls else "",
-                        "abstractNote": record.abstract,
-                        "tags": [{"tag": subject} for subject in record.subjects],
-                        "notes": []
-                    }
-                    zotero_items.append(zotero_item)
+                        # Create Zotero item
+                        zotero_item = {
+                            "itemType": item_type,
+                            "title": record.title,
+                            "creators": creators,
+                            "date": record.year,
+                            "publisher": record.publisher_name,
+                            "place": record.place_of_publication,
+                            "ISBN": record.isbn,
+                            "ISSN": record.issn,
+                            "series": record.series,
+                            "edition": record.edition,
+                            "language": record.language,
+                            "url": record.urls[0] if record.urls else "",
+                            "abstractNote": record.abstract,
+                            "tags": [{"tag": subject} for subject in record.subjects],
+                            "notes": []
+                        }
+                        yield zotero_item
                 
-                json.dump(zotero_items, f, indent=2)
+                _write_json_array(f, zotero_items())
             
             else:
                 # For other formats, write each record one by one
-                for record in records:
-                    f.write(format_record(record, format_type, include_raw, verbose))
+                for record in each_record():
+                    f.writelines(iter_format_record(record, format_type, include_raw, verbose))
                     f.write("\n\n")
         
-        logger.info(f"Saved {len(records)} records to {filename}")
+        logger.info(f"Saved {saved} records to {filename}")
         return True
     
     except Exception as e:
@@ -1602,7 +2008,7 @@ def import_to_zotero(records, zotero_path=None, zotero_api_key=None, zotero_libr
         
 def import_to_zotero_api(records, api_key, library_id, library_type='user'):
     """Import records to Zotero via API."""
-    if not ZOTERO_API_AVAILABLE:
+    if not _have_pyzotero():
         logger.error("Zotero API import requires the pyzotero library.")
         logger.error("Install it with: pip install pyzotero")
         return (0, len(records))
@@ -1629,57 +2035,7 @@ def import_to_zotero_api(records, api_key, library_id, library_type='user'):
                 item_type = "book" if not record.issn else "journalArticle"
                 
                 # Format creators
-                creators = []
-                for author in record.authors:
-                    creator = {}
-                    if ',' in author:
-                        parts = author.split(',', 1)
-                        creator = {
-                            "creatorType": "author",
-                            "lastName": parts[0].strip(),
-                            "firstName": parts[1].strip() if len(parts) > 1 else ""
-                        }
-                    else:
-                        parts = author.split()
-                        if len(parts) > 1:
-                            creator = {
-                                "creatorType": "author",
-                                "lastName": parts[-1],
-                                "firstName": ' '.join(parts[:-1])
-                            }
-                        else:
-                            creator = {
-                                "creatorType": "author",
-                                "lastName": author,
-                                "firstName": ""
-                            }
-                    creators.append(creator)
-                
-                # Add editors
-                for editor in record.editors:
-                    creator = {}
-                    if ',' in editor:
-                        parts = editor.split(',', 1)
-                        creator = {
-                            "creatorType": "editor",
-                            "lastName": parts[0].strip(),
-                            "firstName": parts[1].strip() if len(parts) > 1 else ""
-                        }
-                    else:
-                        parts = editor.split()
-                        if len(parts) > 1:
-                            creator = {
-                                "creatorType": "editor",
-                                "lastName": parts[-1],
-                                "firstName": ' '.join(parts[:-1])
-                            }
-                        else:
-                            creator = {
-                                "creatorType": "editor",
-                                "lastName": editor,
-                                "firstName": ""
-                            }
-                    creators.append(creator)
+                creators = _zotero_creators(record)
                 
                 # Create item template
                 item = {
@@ -1835,20 +2191,7 @@ def import_to_zotero_local(records, zotero_path):
                 creator_order = 0
                 for author in record.authors:
                     # Create creator data
-                    first_name = ""
-                    last_name = ""
-                    
-                    if ',' in author:
-                        parts = author.split(',', 1)
-                        last_name = parts[0].strip()
-                        first_name = parts[1].strip() if len(parts) > 1 else ""
-                    else:
-                        parts = author.split()
-                        if len(parts) > 1:
-                            last_name = parts[-1]
-                            first_name = ' '.join(parts[:-1])
-                        else:
-                            last_name = author
+                    last_name, first_name = _split_name(author)
                     
                     # Insert into creatorData
                     cursor.execute(
@@ -1867,20 +2210,7 @@ def import_to_zotero_local(records, zotero_path):
                 # Insert editors
                 for editor in record.editors:
                     # Create creator data
-                    first_name = ""
-                    last_name = ""
-                    
-                    if ',' in editor:
-                        parts = editor.split(',', 1)
-                        last_name = parts[0].strip()
-                        first_name = parts[1].strip() if len(parts) > 1 else ""
-                    else:
-                        parts = editor.split()
-                        if len(parts) > 1:
-                            last_name = parts[-1]
-                            first_name = ' '.join(parts[:-1])
-                        else:
-                            last_name = editor
+                    last_name, first_name = _split_name(editor)
                     
                     # Insert into creatorData
                     cursor.execute(
@@ -2649,14 +2979,14 @@ def create_custom_endpoint(args):
 
 def explore_endpoint(args):
     """Explore available sets and metadata formats for an OAI-PMH endpoint."""
+    from oai_pmh_library import OAIClient
     endpoint_id = args.endpoint
-    if endpoint_id not in OAI_ENDPOINTS:
+    endpoint_info = _resolve_endpoint(args, 'oai')
+    if endpoint_info is None:
         logger.error(f"Unknown OAI-PMH endpoint: {endpoint_id}")
         logger.info("Use --list --protocol oai to see available OAI-PMH endpoints")
         return False
     
-    # Get endpoint info
-    endpoint_info = OAI_ENDPOINTS[endpoint_id]
     print(f"\nExploring {endpoint_info['name']} ({endpoint_id})")
     print("=" * 50)
     
@@ -2718,8 +3048,98 @@ def explore_endpoint(args):
     return True
 
 
-def parse_args():
-    """Parse command-line arguments."""
+def _add_sru_args(parser):
+    """SRU protocol parameters."""
+    sru_group = parser.add_argument_group('SRU Protocol Parameters')
+    sru_group.add_argument('--schema',
+                        help='Record schema (overrides endpoint default)')
+
+
+# OAI-PMH datestamps in day granularity. The seconds granularity
+# (YYYY-MM-DDThh:mm:ssZ) is not accepted: OAIClient splits long date ranges
+# into day-based chunks and can't parse it.
+_OAI_DATE_RE = re.compile(r'\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01])')
+
+
+def _positive_int(value):
+    """argparse type for counts that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"invalid value '{value}' (expected a positive integer)")
+    return number
+
+
+def _oai_date(value):
+    """argparse type for --from-date/--until-date: reject malformed dates up front."""
+    try:
+        valid = _OAI_DATE_RE.fullmatch(value) and datetime.strptime(value, '%Y-%m-%d')
+    except ValueError:
+        # Well-formed but not a calendar day, like 2023-02-30
+        valid = False
+    if not valid:
+        raise argparse.ArgumentTypeError(f"invalid date '{value}' (expected YYYY-MM-DD)")
+    return value
+
+
+def _add_oai_args(parser):
+    """OAI-PMH protocol parameters."""
+    oai_group = parser.add_argument_group('OAI-PMH Protocol Parameters')
+    oai_group.add_argument('--metadata-prefix',
+                        help='Metadata prefix (overrides endpoint default)')
+    oai_group.add_argument('--set',
+                        help='Set to search within')
+    oai_group.add_argument('--from-date', type=_oai_date,
+                        help='From date (YYYY-MM-DD)')
+    oai_group.add_argument('--until-date', type=_oai_date,
+                        help='Until date (YYYY-MM-DD)')
+
+
+def _add_ixtheo_args(parser):
+    """IxTheo specific parameters."""
+    ixtheo_group = parser.add_argument_group('IxTheo Parameters')
+    ixtheo_group.add_argument('--format-filter',
+                           help='Filter by format (e.g., "Article", "Book")')
+    ixtheo_group.add_argument('--language-filter',
+                           help='Filter by language (e.g., "German", "English")')
+
+
+# Protocol-specific argument groups, built only for the protocol in use (all
+# of them for --help). The Zotero group is always built: its import options
+# apply to results from every protocol.
+_PROTOCOL_ARGS = {
+    'sru': (_add_sru_args, ('schema',)),
+    'oai': (_add_oai_args, ('metadata_prefix', 'set', 'from_date', 'until_date')),
+    'ixtheo': (_add_ixtheo_args, ('format_filter', 'language_filter')),
+}
+
+
+def _option_protocol(option):
+    """The protocol whose argument group defines option (e.g. '--set'), or None."""
+    for name, (_, dests) in _PROTOCOL_ARGS.items():
+        if option in ('--' + dest.replace('_', '-') for dest in dests):
+            return name
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _build_pre_parser():
+    """Parser for the first pass, which only finds --protocol and --help."""
+    pre_parser = argparse.ArgumentParser(add_help=False)
+    pre_parser.add_argument('--protocol')
+    pre_parser.add_argument('-h', '--help', action='store_true')
+    return pre_parser
+
+
+@functools.lru_cache(maxsize=8)
+def _build_parser(protocol):
+    """
+    Build the command-line parser with the argument group of one protocol,
+    or of every protocol if protocol is None (--help without --protocol). Parsers are cached, so callers
+    running main() repeatedly in one process build each one once.
+    """
     parser = argparse.ArgumentParser(
         description='Search library SRU, OAI-PMH and specialized endpoints for books, journals, and other materials.',
         epilog='Example: library_search.py --endpoint dnb --title "Python Programming" --protocol sru'
@@ -2762,21 +3182,11 @@ def parse_args():
     search_group.add_argument('--start-record', type=int, default=1,
                               help='Start record position (for pagination)')
     
-    # SRU specific parameters
-    sru_group = parser.add_argument_group('SRU Protocol Parameters')
-    sru_group.add_argument('--schema',
-                        help='Record schema (overrides endpoint default)')
-    
-    # OAI-PMH specific parameters
-    oai_group = parser.add_argument_group('OAI-PMH Protocol Parameters')
-    oai_group.add_argument('--metadata-prefix',
-                        help='Metadata prefix (overrides endpoint default)')
-    oai_group.add_argument('--set',
-                        help='Set to search within')
-    oai_group.add_argument('--from-date',
-                        help='From date (YYYY-MM-DD)')
-    oai_group.add_argument('--until-date',
-                        help='Until date (YYYY-MM-DD)')
+    for name, (add_args, dests) in _PROTOCOL_ARGS.items():
+        if protocol is None or name == protocol:
+            add_args(parser)
+        else:
+            parser.set_defaults(**dict.fromkeys(dests))
     
     # Zotero specific parameters
     zotero_group = parser.add_argument_group('Zotero Parameters')
@@ -2807,16 +3217,9 @@ def parse_args():
     zotero_group.add_argument('--deduplicate', action='store_true',
                           help='Attempt to deduplicate results before importing')
     
-    # IxTheo specific parameters
-    ixtheo_group = parser.add_argument_group('IxTheo Parameters')
-    ixtheo_group.add_argument('--format-filter',
-                           help='Filter by format (e.g., "Article", "Book")')
-    ixtheo_group.add_argument('--language-filter',
-                           help='Filter by language (e.g., "German", "English")')
-    
     # Output format
     output_group = parser.add_argument_group('Output Parameters')
-    output_group.add_argument('--format', choices=['text', 'json', 'bibtex', 'ris', 'zotero'], default='text',
+    output_group.add_argument('--format', choices=['text', 'json', 'ndjson', 'bibtex', 'ris', 'zotero'], default='text',
                         help='Output format')
     output_group.add_argument('--output',
                         help='Output file for results')
@@ -2826,31 +3229,108 @@ def parse_args():
     # Other options
     parser.add_argument('--timeout', type=int, default=30,
                         help='Request timeout in seconds')
+    parser.add_argument('--jobs', '-j', type=_positive_int, default=SRU_MAX_WORKERS,
+                        help=f'Requests run in parallel: SRU result windows, OAI-PMH date ranges '
+                             f'(default: {SRU_MAX_WORKERS})')
     parser.add_argument('--verbose', '-v', action='store_true',
                         help='Enable verbose output')
     parser.add_argument('--no-verify-ssl', action='store_true',
                         help='Disable SSL certificate verification')
+    parser.add_argument('--cache', dest='cache', action='store_true', default=False,
+                        help=f'Reuse cached SRU/OAI-PMH/IxTheo responses from {DEFAULT_CACHE_PATH}')
+    parser.add_argument('--no-cache', dest='cache', action='store_false',
+                        help='Always query the endpoints, bypassing the response cache (default)')
+    parser.add_argument('--cache-ttl', type=int, default=DEFAULT_CACHE_TTL,
+                        help=f'Seconds a cached response stays valid (default: {DEFAULT_CACHE_TTL})')
     
-    args = parser.parse_args()
-    
-    # Parse advanced search parameter if it's JSON
-    if args.advanced and args.advanced.startswith('{'):
+    return parser
+
+
+def parse_args(argv=None):
+    """Parse command-line arguments."""
+    # Shell completion through argcomplete, if installed. It is only imported
+    # while the shell asks for completions, and offers every protocol's options.
+    if '_ARGCOMPLETE' in os.environ:
         try:
-            args.advanced = json.loads(args.advanced)
+            import argcomplete
+        except ImportError:
+            pass
+        else:
+            argcomplete.autocomplete(_build_parser(None))
+    
+    # First pass: only find out which protocol the rest of the parser is for.
+    # --help without --protocol describes every protocol.
+    pre_args, _ = _build_pre_parser().parse_known_args(argv)
+    protocol = pre_args.protocol
+    if protocol is None and not pre_args.help:
+        protocol = 'sru'
+    parser = _build_parser(protocol)
+    
+    # Options of another protocol aren't known to this parser; name the
+    # protocol they belong to rather than just calling them unrecognized
+    args, unknown = parser.parse_known_args(argv)
+    if unknown:
+        for arg in unknown:
+            owner = _option_protocol(arg.partition('=')[0])
+            if owner is not None:
+                parser.error(f"{arg.partition('=')[0]} is only available with --protocol {owner}")
+        parser.error(f"unrecognized arguments: {' '.join(unknown)}")
+    
+    # Parse advanced search parameter if it's a JSON object; a CQL query that
+    # merely starts with '{' can't end with '}' and is left alone untried
+    advanced = args.advanced
+    if advanced and advanced[0] == '{' and advanced.rstrip()[-1] == '}':
+        try:
+            args.advanced = _loads(advanced)
         except json.JSONDecodeError:
             # Keep as string if not valid JSON
             pass
     
+    # Resolve the endpoint for the chosen protocol once (None if unknown)
+    args.endpoint_info = _protocol_endpoints(args.protocol).get(args.endpoint)
+    
     return args
 
 
+# Search function for each --protocol
+_PROTOCOL_SEARCHES = {
+    'sru': search_sru_endpoint,
+    'oai': search_oai_endpoint,
+    'zotero': search_zotero,
+    'ixtheo': search_ixtheo_endpoint,
+}
+
+
+def _run_meta_command(argv):
+    """
+    Handle `--list [--protocol P]` and `--info ENDPOINT_ID` without building
+    the argument parser. Returns False for any other command line, which
+    then goes through parse_args as usual.
+    """
+    if len(argv) == 2 and argv[0] == '--info' and not argv[1].startswith('-'):
+        show_endpoint_info(argv[1])
+        return True
+    if '--list' in argv:
+        rest = [arg for arg in argv if arg != '--list']
+        if not rest or (len(rest) == 2 and rest[0] == '--protocol' and rest[1] in _PROTOCOL_SEARCHES):
+            # --protocol defaults to sru, as in parse_args
+            list_endpoints(rest[1] if rest else 'sru')
+            return True
+    return False
+
+
 def main():
     """Main function."""
+    # Endpoint listings are answered before any parser is built
+    if _run_meta_command(sys.argv[1:]):
+        sys.exit(0)
+    
     args = parse_args()
     
     # Set log level based on verbosity
     if args.verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
+        for name in _VERBOSE_LOGGERS:
+            logging.getLogger(name).setLevel(logging.DEBUG)
     
     # List endpoints if requested
     if args.list:
@@ -2879,23 +3359,18 @@ def main():
             sys.exit(1)
     
     # Check if any search criteria were specified
-    if not any([
-        args.title, args.author, args.isbn, args.issn, args.year, args.subject, args.advanced,
-        # OAI-PMH specific criteria can also be valid search parameters
-        (args.protocol == 'oai' and (args.set or args.from_date or args.until_date))
-    ]):
+    has_criteria = (args.title or args.author or args.isbn or args.issn or args.year
+                    or args.subject or args.advanced
+                    # OAI-PMH specific criteria can also be valid search parameters
+                    or (args.protocol == 'oai' and (args.set or args.from_date or args.until_date)))
+    if not has_criteria:
         logger.error("No search criteria specified. Use --help to see available options.")
         sys.exit(1)
     
     # Perform search based on protocol
-    if args.protocol == 'sru':
-        search_success, records = search_sru_endpoint(args)
-    elif args.protocol == 'oai':
-        search_success, records = search_oai_endpoint(args)
-    elif args.protocol == 'zotero':
-        search_success, records = search_zotero(args)
-    elif args.protocol == 'ixtheo':
-        search_success, records = search_ixtheo_endpoint(args)
+    search = _PROTOCOL_SEARCHES.get(args.protocol)
+    if search is not None:
+        search_success, records = search(args)
     else:
         logger.error(f"Unknown protocol: {args.protocol}")
         logger.info("Valid protocols are: sru, oai, zotero, ixtheo")
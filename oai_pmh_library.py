@@ -8,12 +8,17 @@ This module provides a modular approach to query various library OAI-PMH endpoin
 without requiring hardcoded classes for each specific library.
 """
 
+import html
+import io
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 try:
     import defusedxml.ElementTree as ET  # type: ignore[import-not-found]
 except ImportError:  # pragma: no cover
     import xml.etree.ElementTree as ET  # nosec B405 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple, Callable
 import re
@@ -35,6 +40,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger("oai_pmh_library")
 
+# Retry policy for catalog requests: connection errors and transient server
+# errors are retried with exponential backoff. Once retries are exhausted
+# the last response is returned, so raise_for_status() still reports it.
+_RETRY = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504),
+               respect_retry_after_header=True, allowed_methods=frozenset(["GET"]),
+               raise_on_status=False)
+
+_OAI_RECORD_TAG = '{http://www.openarchives.org/OAI/2.0/}record'
+
+# Cheap scans of a raw ListRecords page, used to request the next page while
+# the current one is still being parsed: the resumption token, and the
+# record headers (one per record) to tell whether another page is needed
+_RESUMPTION_TOKEN_RE = re.compile(rb'<(?:oai:)?resumptionToken\b[^>]*>([^<]+)</(?:oai:)?resumptionToken>')
+_RECORD_HEADER_RE = re.compile(rb'<(?:oai:)?header[\s>]')
+
+# Date ranges harvested concurrently by OAIClient.search; kept small to be
+# polite to the repositories
+OAI_MAX_WORKERS = 4
+
 class OAIClient:
     """
     A flexible OAI-PMH client that can work with any OAI-PMH endpoint.
@@ -57,7 +81,8 @@ class OAIClient:
                 namespaces: Dict[str, str] = None,
                 timeout: int = 30, 
                 record_parser: Optional[Callable] = None,
-                use_sickle: bool = True):
+                use_sickle: bool = True,
+                pool_size: int = 10):
         """
         Initialize OAI-PMH client.
         
@@ -68,6 +93,8 @@ class OAIClient:
             timeout: Request timeout in seconds
             record_parser: Custom parser function for records
             use_sickle: Whether to use Sickle library when available
+            pool_size: Connections kept open per host; raise it for more
+                concurrent requests than that
         """
         self.base_url = base_url
         self.timeout = timeout
@@ -109,6 +136,14 @@ class OAIClient:
         if namespaces:
             self.namespaces.update(namespaces)
             
+        # One keep-alive session for all requests, so paging and the
+        # concurrently harvested date ranges reuse open connections (retried
+        # per _RETRY)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=pool_size, max_retries=_RETRY)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
         # Initialize Sickle if available and requested
         self.sickle = None
         if self.use_sickle:
@@ -136,7 +171,7 @@ class OAIClient:
                 }
             else:
                 url = f"{self.base_url}?verb=Identify"
-                response = requests.get(url, timeout=self.timeout)
+                response = self.session.get(url, timeout=self.timeout)
                 response.raise_for_status()
                 
                 root = ET.fromstring(response.content)  # nosec B314
@@ -187,7 +222,7 @@ class OAIClient:
                 return sets
             else:
                 url = f"{self.base_url}?verb=ListSets"
-                response = requests.get(url, timeout=self.timeout)
+                response = self.session.get(url, timeout=self.timeout)
                 response.raise_for_status()
                 
                 root = ET.fromstring(response.content)  # nosec B314
@@ -251,7 +286,7 @@ class OAIClient:
                 return formats
             else:
                 url = f"{self.base_url}?{self._build_query_string(params)}"
-                response = requests.get(url, timeout=self.timeout)
+                response = self.session.get(url, timeout=self.timeout)
                 response.raise_for_status()
                 
                 root = ET.fromstring(response.content)  # nosec B314
@@ -306,7 +341,7 @@ class OAIClient:
         
         while url_with_token and request_count < max_requests:
             try:
-                response = requests.get(url_with_token, timeout=self.timeout)
+                response = self.session.get(url_with_token, timeout=self.timeout)
                 response.raise_for_status()
                 
                 root = ET.fromstring(response.content)  # nosec B314
@@ -396,7 +431,7 @@ class OAIClient:
                 return identifiers
             else:
                 url = f"{self.base_url}?{self._build_query_string(params)}"
-                response = requests.get(url, timeout=self.timeout)
+                response = self.session.get(url, timeout=self.timeout)
                 response.raise_for_status()
                 
                 root = ET.fromstring(response.content)  # nosec B314
@@ -475,7 +510,7 @@ class OAIClient:
                 return self._process_sickle_record(record)
             else:
                 url = f"{self.base_url}?{self._build_query_string(params)}"
-                response = requests.get(url, timeout=self.timeout)
+                response = self.session.get(url, timeout=self.timeout)
                 response.raise_for_status()
                 
                 root = ET.fromstring(response.content)  # nosec B314
@@ -513,36 +548,41 @@ class OAIClient:
         """
         all_records = []
         request_count = 0
+        # (url, future) of the next page, requested while this one is parsed
+        prefetched = None
+        prefetcher = ThreadPoolExecutor(max_workers=1)
         
         while url_with_token and request_count < max_requests:
             if max_results and len(all_records) >= max_results:
                 break
                 
             try:
-                response = requests.get(url_with_token, timeout=self.timeout)
+                if prefetched is not None and prefetched[0] == url_with_token:
+                    response = prefetched[1].result()
+                else:
+                    response = self.session.get(url_with_token, timeout=self.timeout)
+                prefetched = None
                 response.raise_for_status()
                 
-                root = ET.fromstring(response.content)  # nosec B314
+                # Extract the base URL without parameters
+                base_url = url_with_token.split('?')[0]
                 
-                # Extract records
-                record_elements = root.findall('.//oai:record', self.namespaces)
-                metadata_prefix = self.default_metadata_prefix
+                # Request the next page now if this one won't fill max_results
+                content = response.content
+                token_match = _RESUMPTION_TOKEN_RE.search(content)
+                if (token_match and request_count + 1 < max_requests and
+                        not (max_results and len(all_records) + len(_RECORD_HEADER_RE.findall(content)) >= max_results)):
+                    token = html.unescape(token_match.group(1).decode('utf-8'))
+                    next_url = f"{base_url}?verb=ListRecords&resumptionToken={token}"
+                    prefetched = (next_url, prefetcher.submit(self.session.get, next_url, timeout=self.timeout))
                 
-                for i, record_elem in enumerate(record_elements):
-                    if max_results and len(all_records) >= max_results:
-                        break
-                        
-                    record = self._process_record_element(record_elem, metadata_prefix)
-                    if record:
-                        biblio_record = self._to_biblio_record(record, metadata_prefix)
-                        if biblio_record:
-                            all_records.append(biblio_record)
+                # Extract records
+                root, _ = self._stream_records(content, self.default_metadata_prefix,
+                                               all_records, max_results)
                 
                 # Check for next resumption token
                 token_elem = root.find('.//oai:resumptionToken', self.namespaces)
                 if token_elem is not None and token_elem.text:
-                    # Extract the base URL without parameters
-                    base_url = url_with_token.split('?')[0]
                     url_with_token = f"{base_url}?verb=ListRecords&resumptionToken={token_elem.text}"
                 else:
                     url_with_token = None
@@ -553,6 +593,8 @@ class OAIClient:
                 logger.error(f"Error following resumption token: {e}")
                 url_with_token = None
         
+        # Don't wait for a page requested ahead that turned out not to be needed
+        prefetcher.shutdown(wait=False)
         return all_records
 
 
@@ -686,10 +728,12 @@ class OAIClient:
                     url = f"{self.base_url}?{self._build_query_string(params)}"
                     
                     try:
-                        response = requests.get(url, timeout=self.timeout)
+                        response = self.session.get(url, timeout=self.timeout)
                         response.raise_for_status()
                         
-                        root = ET.fromstring(response.content)  # nosec B314
+                        # Records are converted while the response is parsed
+                        root, chunk_count = self._stream_records(response.content, metadata_prefix,
+                                                                 records, chunk_max)
                         
                         # Check for error
                         error = root.find('.//oai:error', self.namespaces)
@@ -712,28 +756,15 @@ class OAIClient:
                                     
                                     url = f"{self.base_url}?{self._build_query_string(new_params)}"
                                     try:
-                                        response = requests.get(url, timeout=self.timeout)
+                                        response = self.session.get(url, timeout=self.timeout)
                                         response.raise_for_status()
-                                        root = ET.fromstring(response.content)  # nosec B314
+                                        root, chunk_count = self._stream_records(
+                                            response.content, metadata_prefix, records, chunk_max)
                                     except Exception:  # nosec B112 
                                         continue  # Try next chunk
                                 else:
                                     continue  # Try next chunk
                         
-                        # Extract records
-                        record_elements = root.findall('.//oai:record', self.namespaces)
-                        chunk_count = len(record_elements)
-                        
-                        for i, record_elem in enumerate(record_elements):
-                            if chunk_max and i >= chunk_max:
-                                break
-                                
-                            record = self._process_record_element(record_elem, metadata_prefix)
-                            if record:
-                                biblio_record = self._to_biblio_record(record, metadata_prefix)
-                                if biblio_record:
-                                    records.append(biblio_record)
-                        
                         # Check for resumption token
                         resumption_token = root.find('.//oai:resumptionToken', self.namespaces)
                         if resumption_token is not None and resumption_token.text and not (chunk_max and len(records) >= chunk_max):
@@ -774,21 +805,11 @@ class OAIClient:
                                     
                                     sub_url = f"{self.base_url}?{self._build_query_string(sub_params)}"
                                     try:
-                                        sub_response = requests.get(sub_url, timeout=self.timeout)
+                                        sub_response = self.session.get(sub_url, timeout=self.timeout)
                                         sub_response.raise_for_status()
                                         
-                                        sub_root = ET.fromstring(sub_response.content)  # nosec B314
-                                        sub_record_elements = sub_root.findall('.//oai:record', self.namespaces)
-                                        
-                                        for i, record_elem in enumerate(sub_record_elements):
-                                            record = self._process_record_element(record_elem, metadata_prefix)
-                                            if record:
-                                                biblio_record = self._to_biblio_record(record, metadata_prefix)
-                                                if biblio_record:
-                                                    records.append(biblio_record)
-                                            
-                                            if chunk_max and len(records) >= chunk_max:
-                                                break
+                                        self._stream_records(sub_response.content, metadata_prefix,
+                                                             records, chunk_max)
                                     except Exception as sub_e:
                                         logger.error(f"Error in sub-chunk {sub_from} to {sub_until}: {sub_e}")
                         else:
@@ -815,7 +836,8 @@ class OAIClient:
             set_spec: str = None,
             from_date: str = None,
             until_date: str = None,
-            max_results: int = 20) -> Tuple[int, List[BiblioRecord]]:
+            max_results: int = 20,
+            max_workers: int = OAI_MAX_WORKERS) -> Tuple[int, List[BiblioRecord]]:
         """
         Search records using the provided criteria.
         
@@ -826,6 +848,7 @@ class OAIClient:
             from_date: Optional start date (YYYY-MM-DD)
             until_date: Optional end date (YYYY-MM-DD)
             max_results: Maximum number of results to return
+            max_workers: Number of date ranges harvested concurrently
             
         Returns:
             Tuple of (count, list of BiblioRecord objects)
@@ -896,31 +919,40 @@ class OAIClient:
                 
                 logger.info(f"Searching across {len(chunks)} time chunks")
                 
-                # Search each time period and filter as we go
-                for chunk_index, (chunk_start, chunk_end) in enumerate(chunks):
+                def harvest(chunk_index):
+                    chunk_start, chunk_end = chunks[chunk_index]
                     logger.info(f"Processing chunk {chunk_index+1}/{len(chunks)}: {chunk_start} to {chunk_end}")
-                    
-                    chunk_count, chunk_records = self.list_records(
+                    return self.list_records(
                         metadata_prefix=metadata_prefix,
                         set_spec=set_spec,
                         from_date=chunk_start,
                         until_date=chunk_end,
                         max_results=100  # Get a good number per chunk
                     )
-                    
-                    total_count += chunk_count
-                    
-                    # Filter this chunk immediately
-                    for record in chunk_records:
-                        if self._record_matches_query(record, query):
-                            filtered_records.append(record)
-                    
-                    logger.info(f"Found {len(filtered_records)} matching records so far")
-                    
-                    # Stop if we've found enough matching records
-                    if len(filtered_records) >= max_results:
-                        logger.info(f"Reached desired number of results ({max_results}), stopping search")
-                        break
+                
+                # Harvest up to max_workers time periods at a time and
+                # filter them in date order, stopping after the batch in which
+                # enough matching records have been found
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    for batch_start in range(0, len(chunks), max_workers):
+                        batch = range(batch_start, min(batch_start + max_workers, len(chunks)))
+                        for chunk_count, chunk_records in executor.map(harvest, batch):
+                            total_count += chunk_count
+                            
+                            # Filter this chunk immediately
+                            for record in chunk_records:
+                                if self._record_matches_query(record, query):
+                                    filtered_records.append(record)
+                            
+                            logger.info(f"Found {len(filtered_records)} matching records so far")
+                            
+                            # Stop if we've found enough matching records
+                            if len(filtered_records) >= max_results:
+                                break
+                        
+                        if len(filtered_records) >= max_results:
+                            logger.info(f"Reached desired number of results ({max_results}), stopping search")
+                            break
                         
             except Exception as e:
                 logger.error(f"Error when chunking dates: {e}")
@@ -1155,6 +1187,36 @@ class OAIClient:
         
         return chunks
     
+    def _stream_records(self, content: bytes, metadata_prefix: str,
+                        records: List[BiblioRecord],
+                        max_results: int = None) -> Tuple[Any, int]:
+        """
+        Parse a ListRecords response incrementally into BiblioRecords.
+        
+        Each oai:record element is converted as soon as its end tag has been
+        parsed and is then cleared, so a large response is never held as a
+        full document tree. Converted records are appended to records until it
+        holds max_results; the remaining elements are only counted.
+        
+        Returns:
+            Tuple of (response root element, number of oai:record elements)
+        """
+        root = None
+        count = 0
+        for event, elem in ET.iterparse(io.BytesIO(content), events=('start', 'end')):  # nosec B314
+            if root is None:
+                root = elem
+            elif event == 'end' and elem.tag == _OAI_RECORD_TAG:
+                count += 1
+                if not (max_results and len(records) >= max_results):
+                    record = self._process_record_element(elem, metadata_prefix)
+                    if record:
+                        biblio_record = self._to_biblio_record(record, metadata_prefix)
+                        if biblio_record:
+                            records.append(biblio_record)
+                elem.clear()
+        return root, count
+    
     def _process_record_element(self, record_elem, metadata_prefix) -> Dict[str, Any]:
         """Process an OAI-PMH record element from XML."""
         try:
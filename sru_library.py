@@ -8,6 +8,8 @@ without requiring hardcoded classes for each specific library.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 # Prefer defusedxml to harden against XXE / billion-laughs / quadratic-blowup
 # attacks when parsing untrusted SRU/OAI responses. Fall back to stdlib
 # ElementTree only if defusedxml is not installed.
@@ -32,6 +34,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger("sru_library")
 
+# Retry policy for catalog requests: connection errors and transient server
+# errors are retried with exponential backoff. Once retries are exhausted
+# the last response is returned, so raise_for_status() still reports it.
+_RETRY = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504),
+               respect_retry_after_header=True, allowed_methods=frozenset(["GET"]),
+               raise_on_status=False)
+
 # BiblioRecord, the name/type helpers, and the SRU parsers live in the shared
 # sru_shared module (PLAN 8.5) so CrispLib and citer share ONE implementation
 # and can no longer drift — the parser-parity golden guards the output.
@@ -69,9 +78,13 @@ class SRUClient:
                 namespaces: Optional[Dict[str, str]] = None,
                 timeout: int = 30,
                 record_parser: Optional[Callable] = None,
-                query_params: Optional[Dict[str, str]] = None):
+                query_params: Optional[Dict[str, str]] = None,
+                pool_size: int = 10):
         """
         Initialize SRU client.
+        
+        pool_size is the number of connections kept open per host; raise it
+        when more result windows than that are fetched concurrently.
         """
         self.base_url = base_url
         self.version = version
@@ -80,6 +93,13 @@ class SRUClient:
         self.custom_parser = record_parser
         self.query_params = query_params or {}
         
+        # One keep-alive session for all requests, so consecutive and
+        # concurrent result windows reuse open connections (retried per _RETRY)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=pool_size, max_retries=_RETRY)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
         # Comprehensive set of namespaces for different record formats
         self.namespaces = {
             # SRU namespaces
@@ -213,7 +233,7 @@ class SRUClient:
         logger.debug(f"Querying: {url}")
         
         try:
-            response = requests.get(url, timeout=self.timeout)
+            response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
             
             # Parse XML response
@@ -244,7 +264,7 @@ class SRUClient:
                             if url and 'recordSchema=marcxchange' in url:
                                 corrected_url = url.replace('recordSchema=marcxchange', 'recordSchema=dublincore')
                                 logger.info(f"Retrying with corrected URL: {corrected_url}")
-                                response = requests.get(corrected_url, timeout=self.timeout)
+                                response = self.session.get(corrected_url, timeout=self.timeout)
                                 response.raise_for_status()
                                 root = ET.fromstring(response.content)  # nosec B314 
             
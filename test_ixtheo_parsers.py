@@ -0,0 +1,234 @@
+"""Contract tests for the IxTheo page parsers (ixtheo_library.py).
+
+Small inline search-results and record-detail pages are parsed offline with
+both backends — compiled lxml XPaths and the BeautifulSoup fallback — which
+must agree field for field.
+"""
+import pytest
+
+import ixtheo_library
+from ixtheo_library import IxTheoClient
+from sru_library import BiblioRecord
+
+RESULTS_PAGE = """<html><body>
+<div class="search-stats js-search-stats">Showing 1 - 3 results of 1,234</div>
+<form>
+<input type="hidden" name="idsAll[]" value="Solr|111">
+<input type="hidden" name="idsAll[]" value="Solr|222">
+<input type="hidden" name="idsAll[]" value="Solr|333">
+<ul>
+<li id="result0" class="result grid">
+  <input class="hiddenId" value="AAA">
+  <a class="title"> Foo <b>Bar</b> </a><span class="subtitle">not the title</span>
+  <div class="author">Doe, John (Author)</div>
+  <span class="format book">Book</span><span class="format">Online</span>
+  <span class="publishDate">published 2019</span>
+  <div class="subject"><a>God</a><a> Faith </a></div>
+  <span class="publisher">Pub</span>
+</li>
+<li id="result1" class="result">
+  <input class="checkbox-select-item" value="Solr|BBB">
+  <div class="author">A; B ;</div>
+  <span class="publishDate">1850</span>
+</li>
+<li id="result2" class="result"><span class="title">T<!-- comment --></span></li>
+</ul>
+</form>
+</body></html>"""
+
+EXPECTED = (1234, [
+    BiblioRecord(id='AAA', title='FooBar', authors=['Doe, John'],
+                 format='Book, Online', year='2019',
+                 subjects=['God', 'Faith'], publisher_name='Pub'),
+    BiblioRecord(id='BBB', title='Unknown Title', authors=['A', 'B'],
+                 format=''),
+    # No hidden/checkbox id: falls back to the idsAll[] input at the li index
+    BiblioRecord(id='333', title='T', format=''),
+])
+
+
+@pytest.fixture
+def client():
+    # Bypass __init__, which opens a network session
+    c = IxTheoClient.__new__(IxTheoClient)
+    c.debug = False
+    return c
+
+
+def test_soup_backend(client):
+    assert client._extract_results_soup(RESULTS_PAGE) == EXPECTED
+
+
+@pytest.mark.skipif(not ixtheo_library.LXML_AVAILABLE, reason="lxml not installed")
+def test_lxml_backend_matches_soup(client):
+    assert client._extract_results_lxml(RESULTS_PAGE) == EXPECTED
+
+
+def test_parse_search_results_envelope(client):
+    parsed = client._parse_search_results(RESULTS_PAGE, 'q', 1, 20)
+    assert parsed['status'] == 'success'
+    assert parsed['total_results'] == 1234
+    assert [r.id for r in parsed['records']] == ['AAA', 'BBB', '333']
+
+
+@pytest.mark.skipif(not ixtheo_library.LXML_AVAILABLE, reason="lxml not installed")
+def test_streamed_page_matches(client):
+    """Feeding the page in small byte chunks parses to the same results."""
+    data = RESULTS_PAGE.encode('utf-8')
+    chunks = (data[i:i + 7] for i in range(0, len(data), 7))
+    tree = ixtheo_library._parse_html_stream(chunks, 'utf-8')
+    assert client._extract_results_lxml(tree) == EXPECTED
+
+
+def test_total_read_from_source_markup():
+    html = 'Showing <strong>1</strong> - <strong>20</strong> results of <strong class="x">12.345</strong>'
+    assert ixtheo_library._find_total_in_source(html) == 12345
+    assert ixtheo_library._find_total_in_source('<p>no hits</p>') is None
+
+
+DETAIL_PAGE = """<html><body><h3 property="name">The Title</h3>
+<table class="table-striped"><tr><th>Author: </th><td><span property="name">Doe, J.</span><span property="name">Roe, R.</span></td></tr>
+<tr><th>Format:</th><td><span class="format">Print</span><span class="format">Article</span></td></tr>
+<tr><th>Language:</th><td>German</td></tr>
+<tr><th>Published:</th><td><span property="location">Berlin</span><span property="name">Pub</span><span property="datePublished">2011</span></td></tr>
+<tr><th>Subject Chains:</th><td><a href="/Search/Results?x">God</a><a href="/Search/Results?y">Faith</a></td></tr>
+<tr><th>Subjects:</th><td><a href="/Search/Results?x">God</a><a href="/Search/Results?z">Hope</a></td></tr>
+<tr><th>ISBN:</th><td>outside</td></tr>
+<tr><th>In:</th><td><a>Journal X</a> Year: 2011, Volume: 5, Issue: 2, Pages: 10-20</td></tr>
+<tr><th>Series</th><td><a>Ser</a></td></tr>
+<tr><th>Online Access:</th><td><a class="fulltext" href="http://x">x</a><a class="fulltext" href="/rel">y</a></td></tr>
+</table>
+<div class="description-tab"><table class="table-striped">
+<tr><th>ISBN:</th><td><span property="isbn">978</span></td></tr>
+<tr><th>ISSN:</th><td>1234-5678</td></tr>
+<tr><th>Physical Description:</th><td>300 p.</td></tr>
+<tr><th>Summary:</th><td>Abstract text</td></tr>
+</table></div></body></html>"""
+
+EXPECTED_DETAIL = {
+    "title": "The Title",
+    "authors": ["Doe, J.", "Roe, R."],
+    "year": "2011",
+    "publisher_name": "Pub",
+    "place_of_publication": "Berlin",
+    # Only the identifiers inside the description tab count
+    "isbn": "978",
+    "issn": "1234-5678",
+    "urls": ["http://x"],
+    "abstract": "Abstract text",
+    "language": "German",
+    "format": "PrintArticle",
+    "subjects": ["God", "Faith", "Hope"],
+    "series": "Ser",
+    "extent": "300 p.",
+    "journal_title": "Journal X",
+    "volume": "5",
+    "issue": "2",
+    "pages": "10-20",
+}
+
+
+def test_detail_soup_backend(client):
+    assert client._extract_detail_soup(DETAIL_PAGE) == EXPECTED_DETAIL
+
+
+@pytest.mark.skipif(not ixtheo_library.LXML_AVAILABLE, reason="lxml not installed")
+def test_detail_lxml_backend_matches_soup(client):
+    assert client._extract_detail_lxml(DETAIL_PAGE) == EXPECTED_DETAIL
+
+
+class _Response:
+    def __init__(self, status_code, text):
+        self.status_code = status_code
+        self.text = text
+
+
+class _CartSession:
+    """Answers cart exports with the given body and records each request."""
+
+    def __init__(self, status_code, text):
+        self.response = _Response(status_code, text)
+        self.requests = []
+
+    def get(self, url, params=None, **kwargs):
+        self.requests.append((url, params))
+        return self.response
+
+
+def _ris(record_id, title):
+    return f"TY  - BOOK\nTI  - {title}\nUR  - https://ixtheo.de/Record/{record_id}\nER  - "
+
+
+@pytest.fixture
+def export_client(monkeypatch):
+    # A real client without the session warm-up; tests swap in a _CartSession
+    monkeypatch.setattr(IxTheoClient, "_initialize_session", lambda self: None)
+    client = IxTheoClient(timeout=5, requests_per_second=1000, burst=1000, record_cache_size=16)
+    monkeypatch.setattr(client, "get_export_data_batch",
+                        lambda ids, fmt="RIS": {i: f"single {i}" for i in ids})
+    return client
+
+
+def test_bulk_export_splits_cart_records(export_client):
+    # Records are matched by their record URL, whatever order they come in
+    export_client.session = _CartSession(200, _ris("B", "Two") + "\n\n" + _ris("A", "One") + "\n")
+    exports = export_client.get_export_data_bulk(["A", "B", "A"])
+    assert exports == {"A": _ris("A", "One"), "B": _ris("B", "Two")}
+    assert export_client.session.requests[0][1] == [("f", "RIS"), ("i[]", "Solr|A"), ("i[]", "Solr|B")]
+    # The per-record export finds them in the cache
+    assert export_client._lru_get(("export", "B", "RIS")) == exports["B"]
+
+
+def test_bulk_export_falls_back_to_single_records(export_client):
+    # B is missing and the other record names no requested ID
+    export_client.session = _CartSession(200, _ris("A", "One") + "\nTY  - JOUR\nTI  - ?\nER  - \n")
+    assert export_client.get_export_data_bulk(["A", "B"]) == {"A": _ris("A", "One"), "B": "single B"}
+    assert export_client._bulk_export_supported is True
+
+    # A server error only affects its own chunk
+    export_client.session = _CartSession(500, "Internal Server Error")
+    assert export_client.get_export_data_bulk(["C"]) == {"C": "single C"}
+    assert export_client._bulk_export_supported is True
+
+    # Not supported at all: later calls don't try again
+    export_client.session = _CartSession(404, "Not found")
+    assert export_client.get_export_data_bulk(["D"]) == {"D": "single D"}
+    assert export_client.get_export_data_bulk(["E"]) == {"E": "single E"}
+    assert len(export_client.session.requests) == 1
+
+
+class _PageResponse(_Response):
+    headers = {"Content-Type": "text/html; charset=utf-8"}
+    encoding = "utf-8"
+
+    def iter_content(self, chunk_size):
+        yield self.text.encode("utf-8")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _CountingBucket:
+    def __init__(self):
+        self.tokens = 0
+
+    def acquire(self):
+        self.tokens += 1
+
+
+def test_search_pages_are_rate_limited(export_client):
+    class Session:
+        def get(self, url, params=None, **kwargs):
+            return _PageResponse(200, RESULTS_PAGE)
+
+    export_client.session = Session()
+    export_client.csrf_token = None
+    bucket = export_client._rate = _CountingBucket()
+    total, records = export_client.search_all_pages("god", max_results=9, limit=3)
+    assert total == 1234
+    assert len(records) == 9
+    # One token per result page, including the ones fetched in parallel
+    assert bucket.tokens == 3
@@ -0,0 +1,38 @@
+"""Tests that JSON output from library_search.py is the same with and without orjson."""
+import json
+from pathlib import Path
+
+import pytest
+
+import library_search
+from sru_library import BiblioRecord
+
+RECORDS = [BiblioRecord(**r) for r in json.loads(
+    (Path(__file__).parent / "fixtures" / "parity" / "records.json").read_text(encoding="utf-8"))]
+# Escaping edge cases: astral and BMP characters, DEL, a control character
+RECORDS.append(BiblioRecord(id="x", title="Emoji \U0001F600 / café \x7f\x1f \"q\" \\",
+                            authors=["Müller, Jörg"], raw_data={"k": " "}))
+
+
+def _save(tmp_path, monkeypatch, format_type, use_orjson):
+    monkeypatch.setattr(library_search, "ORJSON_AVAILABLE", use_orjson)
+    path = tmp_path / f"{format_type}-{use_orjson}.json"
+    assert library_search.save_results_to_file(iter(RECORDS), str(path), format_type, include_raw=True)
+    return path.read_bytes()
+
+
+@pytest.mark.skipif(not library_search.ORJSON_AVAILABLE, reason="orjson not installed")
+@pytest.mark.parametrize("format_type", ["json", "ndjson", "zotero"])
+def test_file_output_does_not_depend_on_orjson(tmp_path, monkeypatch, format_type):
+    with_orjson = _save(tmp_path, monkeypatch, format_type, True)
+    assert with_orjson == _save(tmp_path, monkeypatch, format_type, False)
+
+
+def test_json_output_matches_stdlib(tmp_path, monkeypatch):
+    output = _save(tmp_path, monkeypatch, "json", library_search.ORJSON_AVAILABLE)
+    expected = []
+    for record in RECORDS:
+        data = record.to_dict()
+        data["raw_data"] = library_search._raw_text(record.raw_data)
+        expected.append(data)
+    assert output == json.dumps(expected, indent=2).encode("ascii")
@@ -0,0 +1,76 @@
+"""Tests for the library_search.py command line (meta commands, argument parsing)."""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import library_search
+
+HERE = Path(__file__).parent
+
+
+def _modules_after(code):
+    """Names of the heavy modules imported after running code in a fresh interpreter."""
+    script = ("import sys\n" + code +
+              "\nprint(' '.join(m for m in ('requests', 'urllib3', 'lxml', 'bs4') if m in sys.modules))")
+    result = subprocess.run([sys.executable, "-c", script], cwd=str(HERE),
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            universal_newlines=True, check=True)
+    return result.stdout.splitlines()[-1].split()
+
+
+def test_endpoint_info_does_not_import_protocol_clients():
+    code = ("import library_search\n"
+            "library_search.show_endpoint_info('dnb')\n"
+            "library_search.show_endpoint_info('europeana')")
+    assert _modules_after(code) == []
+
+
+def test_meta_commands_do_not_import_protocol_clients():
+    code = ("import library_search\n"
+            "assert library_search._run_meta_command(['--info', 'dnb'])\n"
+            "assert library_search._run_meta_command(['--list'])\n"
+            "assert library_search._run_meta_command(['--list', '--protocol', 'oai'])")
+    assert _modules_after(code) == []
+
+
+def test_info_script_run_does_not_import_requests():
+    # -X importtime logs every module the script imports to stderr
+    result = subprocess.run([sys.executable, "-X", "importtime", "library_search.py", "--info", "dnb"],
+                            cwd=str(HERE), stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            universal_newlines=True, check=True)
+    assert "Deutsche" in result.stdout
+    imported = {line.rsplit("|", 1)[-1].strip() for line in result.stderr.splitlines()}
+    assert not imported & {"requests", "urllib3", "lxml"}
+
+
+def test_protocol_options_are_accepted_with_their_protocol():
+    args = library_search.parse_args(['--protocol', 'oai', '--endpoint', 'dnb', '--set', 'x'])
+    assert args.set == 'x'
+    # Another protocol's options are not parsed but still default to None
+    assert args.schema is None
+    args = library_search.parse_args(['--title', 'Python', '--schema', 'dc'])
+    assert (args.protocol, args.schema, args.set) == ('sru', 'dc', None)
+
+
+@pytest.mark.parametrize("argv, owner", [
+    (['--protocol', 'sru', '--set', 'x'], 'oai'),
+    (['--from-date=2020-01-01'], 'oai'),
+    (['--protocol', 'oai', '--format-filter', 'Book'], 'ixtheo'),
+    (['--protocol', 'ixtheo', '--schema', 'dc'], 'sru'),
+])
+def test_options_of_another_protocol_are_rejected(capsys, argv, owner):
+    with pytest.raises(SystemExit) as excinfo:
+        library_search.parse_args(argv)
+    assert excinfo.value.code == 2
+    assert f"is only available with --protocol {owner}" in capsys.readouterr().err
+
+
+def test_oai_dates_must_be_calendar_days(capsys):
+    args = library_search.parse_args(['--protocol', 'oai', '--from-date', '2024-02-29'])
+    assert args.from_date == '2024-02-29'
+    for value in ('2023-02-30', '2023-01-01T00:00:00Z', '2023-1-5'):
+        with pytest.raises(SystemExit):
+            library_search.parse_args(['--protocol', 'oai', '--until-date', value])
+        assert "expected YYYY-MM-DD" in capsys.readouterr().err
@@ -0,0 +1,114 @@
+"""Tests for ListRecords paging in oai_pmh_library.py: the streaming record
+parser and resumption-token following with the next page prefetched."""
+import threading
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from oai_pmh_library import OAIClient, _OAI_RECORD_TAG
+
+BASE_URL = "https://example.org/oai"
+
+
+def _page(index, pages, per_page):
+    """ListRecords response number index (0-based) of a pages-long result."""
+    records = "".join(
+        f"""<record><header><identifier>oai:x:{index}-{k}</identifier>
+<datestamp>2020-01-0{k + 1}</datestamp><setSpec>s{index}</setSpec></header>
+<metadata><oai_dc:dc xmlns:oai_dc="http://www.openarchives.org/OAI/2.0/oai_dc/"
+ xmlns:dc="http://purl.org/dc/elements/1.1/">
+<dc:title>Title {index}-{k}</dc:title><dc:creator>Doe, Jane</dc:creator>
+<dc:date>19{index}{k}</dc:date><dc:type>book</dc:type><dc:language>ger</dc:language>
+</oai_dc:dc></metadata></record>"""
+        for k in range(per_page)
+    )
+    # Tokens are XML-escaped in the response; the '&' checks they are unescaped
+    token = (f'<resumptionToken cursor="{index * per_page}">tok{index + 1}&amp;x</resumptionToken>'
+             if index + 1 < pages else "<resumptionToken/>")
+    return (f'<?xml version="1.0"?><OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/">'
+            f"<ListRecords>{records}{token}</ListRecords></OAI-PMH>").encode("utf-8")
+
+
+def _url(index):
+    return f"{BASE_URL}?verb=ListRecords&resumptionToken=tok{index}&x"
+
+
+class _Response:
+    status_code = 200
+
+    def __init__(self, content):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+class _PagedSession:
+    """Serves the pages of one ListRecords result and records the URLs asked for."""
+
+    def __init__(self, pages, per_page):
+        self.pages = pages
+        self.per_page = per_page
+        self.urls = []
+        self._lock = threading.Lock()
+
+    def get(self, url, timeout=None, **kwargs):
+        with self._lock:
+            self.urls.append(url)
+        index = int(url.split("resumptionToken=tok")[1].split("&")[0])
+        return _Response(_page(index, self.pages, self.per_page))
+
+
+@pytest.fixture
+def client():
+    return OAIClient(BASE_URL, use_sickle=False)
+
+
+def _summary(records):
+    return [(r.id, r.title, r.authors, r.year, r.language, r.raw_data) for r in records]
+
+
+def test_stream_parser_matches_dom_parser(client):
+    content = _page(0, 2, 3)
+    records = []
+    root, count = client._stream_records(content, "oai_dc", records)
+
+    dom = ET.fromstring(content)
+    expected = [client._to_biblio_record(client._process_record_element(elem, "oai_dc"), "oai_dc")
+                for elem in dom.iter(_OAI_RECORD_TAG)]
+    assert count == 3
+    assert _summary(records) == _summary(expected)
+    assert records[0].title == "Title 0-0" and records[0].year == "1900"
+    # The root is kept for the resumption token lookup
+    token = root.find(".//oai:resumptionToken", client.namespaces)
+    assert token.text == "tok1&x"
+
+
+def test_stream_parser_stops_converting_at_max_results(client):
+    records = []
+    _, count = client._stream_records(_page(0, 1, 5), "oai_dc", records, max_results=2)
+    assert count == 5
+    assert [r.id for r in records] == ["oai:x:0-0", "oai:x:0-1"]
+
+
+def test_resumption_tokens_are_followed_in_order(client):
+    client.session = _PagedSession(pages=4, per_page=3)
+    records = client._follow_resumption_token_with_records(_url(0))
+    assert [r.id for r in records] == [f"oai:x:{i}-{k}" for i in range(4) for k in range(3)]
+    # Each page is requested once, prefetched or not
+    assert client.session.urls == [_url(i) for i in range(4)]
+
+
+@pytest.mark.parametrize("max_results, pages_requested", [(6, 2), (7, 3), (3, 1)])
+def test_no_prefetch_past_max_results(client, max_results, pages_requested):
+    client.session = _PagedSession(pages=5, per_page=3)
+    records = client._follow_resumption_token_with_records(_url(0), max_results=max_results)
+    assert len(records) == max_results
+    assert client.session.urls == [_url(i) for i in range(pages_requested)]
+
+
+def test_no_prefetch_past_max_requests(client):
+    client.session = _PagedSession(pages=5, per_page=3)
+    records = client._follow_resumption_token_with_records(_url(0), max_requests=2)
+    assert len(records) == 6
+    assert client.session.urls == [_url(0), _url(1)]
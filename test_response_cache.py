@@ -0,0 +1,38 @@
+"""Tests for the on-disk response cache in library_search.py (--cache)."""
+from library_search import _ResponseCache, _record_from_cache, _record_to_cache
+from sru_library import BiblioRecord
+
+
+def test_round_trip_and_expiry(tmp_path):
+    cache = _ResponseCache(str(tmp_path / "cache" / "responses.sqlite"), ttl=60)
+    key = _ResponseCache.key('sru', 'https://example.org/sru', 'title="x"', None, 10, 1)
+    assert cache.get(key) is None
+
+    cache.put(key, {'total': 3, 'records': []})
+    assert cache.get(key) == {'total': 3, 'records': []}
+
+    cache.ttl = -1
+    assert cache.get(key) is None
+
+
+def test_key_depends_on_every_part():
+    assert _ResponseCache.key('sru', 'q', 1) == _ResponseCache.key('sru', 'q', 1)
+    assert _ResponseCache.key('sru', 'q', 1) != _ResponseCache.key('sru', 'q', 2)
+
+
+def test_records_survive_serialization(tmp_path):
+    cache = _ResponseCache(str(tmp_path / "responses.sqlite"))
+    record = BiblioRecord(id='1', title='T', authors=['Doe, J'], year='2001',
+                          subjects=['God'], raw_data='<record/>')
+    cache.put('k', _record_to_cache(record))
+    assert _record_from_cache(cache.get('k')) == record
+
+
+def test_expired_rows_are_pruned_on_open(tmp_path):
+    path = str(tmp_path / "responses.sqlite")
+    with _ResponseCache(path, ttl=60) as cache:
+        cache.put('old', {'total': 0})
+        cache.conn.execute("UPDATE cache SET ts = ts - 120")
+        cache.conn.commit()
+    with _ResponseCache(path, ttl=60) as cache:
+        assert cache.conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0] == 0
@@ -0,0 +1,137 @@
+"""Tests for the local Zotero database search in library_search.py (--zotero-path)."""
+import argparse
+import sqlite3
+
+import pytest
+
+from library_search import search_zotero_local
+
+SCHEMA = """
+CREATE TABLE items (itemID INTEGER PRIMARY KEY, itemTypeID INT, key TEXT);
+CREATE TABLE deletedItems (itemID INTEGER PRIMARY KEY);
+CREATE TABLE fields (fieldID INTEGER PRIMARY KEY, fieldName TEXT);
+CREATE TABLE itemDataValues (valueID INTEGER PRIMARY KEY, value TEXT);
+CREATE TABLE itemData (itemID INT, fieldID INT, valueID INT);
+CREATE TABLE creatorData (creatorDataID INTEGER PRIMARY KEY, lastName TEXT, firstName TEXT);
+CREATE TABLE creators (itemID INT, creatorDataID INT, orderIndex INT);
+CREATE TABLE tags (tagID INTEGER PRIMARY KEY, name TEXT);
+CREATE TABLE itemTags (itemID INT, tagID INT);
+"""
+
+# itemID: (itemTypeID, key, fields, [(lastName, firstName)], tags)
+ITEMS = {
+    1: (1, 'AAAA1111', {'title': 'Python and God', 'date': '2019-05-01', 'ISBN': '9780000000011',
+                        'publisher': 'Pub', 'place': 'Berlin', 'url': 'https://example.org/1',
+                        'language': 'en'},
+        [('Doe', 'John'), ('Roe', None)], ['God', 'Python']),
+    2: (2, 'BBBB2222', {'title': 'Grace', 'date': 'ca. 1850', 'ISSN': '1234-567X'},
+        [('Smith', 'Anna')], ['Faith']),
+    3: (5, 'CCCC3333', {'title': 'Python note'}, [], []),             # not a searched item type
+    4: (1, 'DDDD4444', {'title': 'Python deleted'}, [], []),          # in the trash
+    5: (3, 'EEEE5555', {'title': 'Python chapter', 'series': 'S', 'edition': '2'},
+        [('Müller', 'Jörg')], []),
+    6: (7, 'FFFF6666', {'title': 'Python and God', 'ISBN': '9780000000011'},
+        [('Doe', 'John')], ['Copy']),                                 # duplicate of item 1
+}
+
+
+@pytest.fixture
+def zotero_db(tmp_path):
+    path = tmp_path / "zotero.sqlite"
+    conn = sqlite3.connect(str(path))
+    conn.executescript(SCHEMA)
+    field_ids = {}
+    for item_id, (type_id, key, fields, creators, tags) in ITEMS.items():
+        conn.execute("INSERT INTO items VALUES (?, ?, ?)", (item_id, type_id, key))
+        for name, value in fields.items():
+            field_id = field_ids.setdefault(name, len(field_ids) + 1)
+            conn.execute("INSERT OR IGNORE INTO fields VALUES (?, ?)", (field_id, name))
+            value_id = conn.execute("INSERT INTO itemDataValues (value) VALUES (?)", (value,)).lastrowid
+            conn.execute("INSERT INTO itemData VALUES (?, ?, ?)", (item_id, field_id, value_id))
+        # Insert creators in reverse so orderIndex, not rowid, decides the order
+        for index, (last, first) in reversed(list(enumerate(creators))):
+            creator_id = conn.execute("INSERT INTO creatorData (lastName, firstName) VALUES (?, ?)",
+                                      (last, first)).lastrowid
+            conn.execute("INSERT INTO creators VALUES (?, ?, ?)", (item_id, creator_id, index))
+        for tag in tags:
+            tag_id = conn.execute("INSERT INTO tags (name) VALUES (?)", (tag,)).lastrowid
+            conn.execute("INSERT INTO itemTags VALUES (?, ?)", (item_id, tag_id))
+    conn.execute("INSERT INTO deletedItems VALUES (4)")
+    conn.commit()
+    conn.close()
+    return str(path)
+
+
+def _baseline(path):
+    """
+    Items as the original per-item queries saw them: every field row of the
+    searched item types, then creators and tags one item at a time.
+    """
+    conn = sqlite3.connect(path)
+    rows = conn.execute("""
+        SELECT i.itemID, i.key, f.fieldName, idv.value
+        FROM items i
+        JOIN itemData idata ON i.itemID = idata.itemID
+        JOIN itemDataValues idv ON idata.valueID = idv.valueID
+        JOIN fields f ON idata.fieldID = f.fieldID
+        WHERE i.itemTypeID IN (1, 2, 3, 7)
+          AND i.itemID NOT IN (SELECT itemID FROM deletedItems)
+    """).fetchall()
+    items = {}
+    for item_id, key, name, value in rows:
+        items.setdefault(item_id, {'key': key, 'fields': {}})['fields'][name] = value
+    for item_id, data in items.items():
+        data['authors'] = [f"{last or ''}, {first or ''}".strip() for last, first in conn.execute("""
+            SELECT cd.lastName, cd.firstName
+            FROM creators c JOIN creatorData cd ON c.creatorDataID = cd.creatorDataID
+            WHERE c.itemID = ? ORDER BY c.orderIndex
+        """, (item_id,))]
+        data['tags'] = [name for name, in conn.execute(
+            "SELECT t.name FROM tags t JOIN itemTags it ON t.tagID = it.tagID WHERE it.itemID = ?",
+            (item_id,))]
+    conn.close()
+    return items
+
+
+def _args(path, **criteria):
+    args = argparse.Namespace(zotero_path=path, title=None, author=None, isbn=None, issn=None,
+                              year=None, max_records=10)
+    for name, value in criteria.items():
+        setattr(args, name, value)
+    return args
+
+
+def test_records_match_baseline_queries(zotero_db):
+    success, records = search_zotero_local(_args(zotero_db))
+    assert success
+    baseline = _baseline(zotero_db)
+    # Item 6 duplicates item 1 and is dropped; the rest keep itemID order
+    assert [record.id for record in records] == [baseline[i]['key'] for i in (1, 2, 5)]
+    for record, item_id in zip(records, (1, 2, 5)):
+        expected = baseline[item_id]
+        assert record.raw_data == expected['fields']
+        assert record.title == expected['fields']['title']
+        assert record.authors == expected['authors']
+        assert record.subjects == expected['tags']
+    assert records[0].authors == ['Doe, John', 'Roe,']
+    assert records[0].year == '2019' and records[1].year == '1850'
+    assert records[0].urls == ['https://example.org/1']
+    assert (records[2].series, records[2].edition) == ('S', '2')
+
+
+@pytest.mark.parametrize("criteria, keys", [
+    ({'title': 'python'}, ['AAAA1111', 'EEEE5555']),
+    ({'author': 'Smith'}, ['BBBB2222']),
+    ({'issn': '1234'}, ['BBBB2222']),
+    ({'year': '1850', 'author': 'Müller'}, ['BBBB2222', 'EEEE5555']),
+    ({'title': 'nothing'}, []),
+])
+def test_search_criteria(zotero_db, criteria, keys):
+    success, records = search_zotero_local(_args(zotero_db, **criteria))
+    assert success == bool(keys)
+    assert [record.id for record in records] == keys
+
+
+def test_limit_counts_items(zotero_db):
+    success, records = search_zotero_local(_args(zotero_db, max_records=2))
+    assert [record.id for record in records] == ['AAAA1111', 'BBBB2222']